@@ -17,10 +17,14 @@ import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
 import os
+import sys
+
+# Modules partagés du dossier scripts/ (style et sortie communs)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "scripts"))
+import afia_style
+from afia_style import US_COLOR, CN_COLOR, save_fig
 
 # ─── Configuration ──────────────────────────────────────────────────────────
-OUTPUT_DIR = "./output/figures_ch6quat"
-DPI = 300
 FIGSIZE_WIDE = (12, 6.5)
 FIGSIZE_SQUARE = (10, 7)
 FIGSIZE_TALL = (11, 8)
@@ -28,8 +32,6 @@ FIGSIZE_TALL = (11, 8)
 # Couleurs palette professionnelle
 DARK_BLUE  = "#1B3A5C"
 MEDIUM_BLUE= "#2E75B6"
-US_COLOR   = "#1B4F72"
-CN_COLOR   = "#C0392B"
 AF_COLOR   = "#D4A574"    # Sable / Africa
 SA_COLOR   = "#2E86C1"    # South Africa
 NG_COLOR   = "#148F77"    # Nigeria
@@ -37,185 +39,16 @@ KE_COLOR   = "#E67E22"    # Kenya
 MA_COLOR   = "#884EA0"    # Morocco
 EG_COLOR   = "#D4AC0D"    # Egypt
 RW_COLOR   = "#27AE60"    # Rwanda
-BG_COLOR   = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
 WARN_RED   = "#CC0000"
 
 # ─── Traductions ────────────────────────────────────────────────────────────
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        # Fig 1 — Capacité DC Afrique vs Monde
-        "fig1_title": "Capacité data center : l'Afrique face au monde\n(MW IT load, mi-2025)",
-        "fig1_ylabel": "MW (IT load)",
-        "fig1_cats": ["États-Unis", "Europe", "Chine", "Inde", "Afrique"],
-        "fig1_source": "Sources : IEA (2025), McKinsey (2025), Mordor Intelligence (2026), African Energy Chamber (2025)",
-        "fig1_annot": "< 2 % du total mondial",
-        # Fig 2 — Pôles IA africains
-        "fig2_title": "Les six pôles IA africains : data centers et investissements\n(2025)",
-        "fig2_ylabel": "",
-        "fig2_cats": ["Afrique du Sud", "Nigeria", "Kenya", "Maroc", "Égypte", "Rwanda"],
-        "fig2_dc_label": "Data centers (nb)",
-        "fig2_inv_label": "Investissement clé (M$)",
-        "fig2_source": "Sources : Mordor Intelligence (2026), African Energy Chamber (2025), DCD (2025), Bloomberg (2025)",
-        # Fig 3 — Croissance marché IA africain
-        "fig3_title": "Marché IA africain : trajectoire de croissance\n(2025-2031, milliards USD)",
-        "fig3_ylabel": "Milliards USD",
-        "fig3_xlabel": "",
-        "fig3_label_ai": "Marché IA africain",
-        "fig3_label_dc": "Marché data centers africain",
-        "fig3_source": "Sources : Tech In Africa (2025), Mordor Intelligence (2026), McKinsey (2025)",
-        "fig3_cagr_ai": "CAGR 27 %",
-        "fig3_cagr_dc": "CAGR 14,5 %",
-        # Fig 4 — Compétition US vs Chine en Afrique
-        "fig4_title": "Compétition IA en Afrique : engagements États-Unis vs Chine\n(principaux investissements, M$)",
-        "fig4_ylabel": "Millions USD",
-        "fig4_cats": ["Infrastructure\nDC/GPU", "Cloud &\nhyperscalers", "Formation\ntalents IA", "Modèles IA\n& services"],
-        "fig4_legend_us": "États-Unis",
-        "fig4_legend_cn": "Chine",
-        "fig4_source": "Sources : Bloomberg (2025), DCD (2025), Semafor (2025), Rest of World (2025), Africa Defense Forum (2025)",
-        # Fig 5 — Matrice scénarielle Afrique
-        "fig5_title": "Matrice scénarielle 2×2 : trajectoires IA pour l'Afrique\n(2026-2030)",
-        "fig5_x_label": "Intensité du protectionnisme US →",
-        "fig5_y_label": "← Réponse africaine active",
-        "fig5_s1": "S1\nStagnation\ndépendante",
-        "fig5_s2": "S2\nRattrapage\nciblé",
-        "fig5_s3": "S3\nBifurcation\nimposée",
-        "fig5_s4": "S4\nNon-alignement\nnumérique",
-        "fig5_s1_detail": "IA ~1 % PIB 2030\nBrain drain continu",
-        "fig5_s2_detail": "AI Factories opérationnelles\nIA ~3 % PIB 2030",
-        "fig5_s3_detail": "Dépendance Huawei/DeepSeek\nRisque surveillance",
-        "fig5_s4_detail": "Multi-sourcing\nSouveraineté données",
-        "fig5_source": "Source : Analyse auteur, adaptation matrice Chapitre V",
-        "fig5_mod": "Modéré",
-        "fig5_int": "Intense",
-        "fig5_pass": "Passive",
-        "fig5_act": "Active",
-        # Fig 6 — Ratios CACI Afrique vs US
-        "fig6_title": "Ratios CACI : l'abîme Afrique / États-Unis\n(2025)",
-        "fig6_ylabel": "Ratio US / Afrique (×)",
-        "fig6_cats": ["Capacité DC\n(GW IT)", "Investissement\nDC ($)", "GPUs IA\n(Nvidia)", "Talent IA\n(pool)", "Marché IA\n($)"],
-        "fig6_source": "Sources : données compilées auteur — IEA, McKinsey, Mordor Intelligence, WEF, Tech In Africa (2025-2026)",
-    },
-    "en": {
-        "suffix": "EN",
-        "fig1_title": "Data Center Capacity: Africa vs the World\n(MW IT load, mid-2025)",
-        "fig1_ylabel": "MW (IT load)",
-        "fig1_cats": ["United States", "Europe", "China", "India", "Africa"],
-        "fig1_source": "Sources: IEA (2025), McKinsey (2025), Mordor Intelligence (2026), African Energy Chamber (2025)",
-        "fig1_annot": "< 2% of global total",
-        "fig2_title": "The Six African AI Hubs: Data Centers and Investments\n(2025)",
-        "fig2_ylabel": "",
-        "fig2_cats": ["South Africa", "Nigeria", "Kenya", "Morocco", "Egypt", "Rwanda"],
-        "fig2_dc_label": "Data centers (#)",
-        "fig2_inv_label": "Key investment ($M)",
-        "fig2_source": "Sources: Mordor Intelligence (2026), African Energy Chamber (2025), DCD (2025), Bloomberg (2025)",
-        "fig3_title": "African AI Market: Growth Trajectory\n(2025-2031, USD billions)",
-        "fig3_ylabel": "USD Billions",
-        "fig3_xlabel": "",
-        "fig3_label_ai": "African AI market",
-        "fig3_label_dc": "African data center market",
-        "fig3_source": "Sources: Tech In Africa (2025), Mordor Intelligence (2026), McKinsey (2025)",
-        "fig3_cagr_ai": "CAGR 27%",
-        "fig3_cagr_dc": "CAGR 14.5%",
-        "fig4_title": "AI Competition in Africa: US vs China Engagements\n(key investments, $M)",
-        "fig4_ylabel": "USD Millions",
-        "fig4_cats": ["DC/GPU\nInfrastructure", "Cloud &\nHyperscalers", "AI Talent\nTraining", "AI Models\n& Services"],
-        "fig4_legend_us": "United States",
-        "fig4_legend_cn": "China",
-        "fig4_source": "Sources: Bloomberg (2025), DCD (2025), Semafor (2025), Rest of World (2025), Africa Defense Forum (2025)",
-        "fig5_title": "2×2 Scenario Matrix: AI Trajectories for Africa\n(2026-2030)",
-        "fig5_x_label": "US Protectionism Intensity →",
-        "fig5_y_label": "← Active African Response",
-        "fig5_s1": "S1\nDependent\nStagnation",
-        "fig5_s2": "S2\nTargeted\nCatch-Up",
-        "fig5_s3": "S3\nImposed\nBifurcation",
-        "fig5_s4": "S4\nDigital\nNon-Alignment",
-        "fig5_s1_detail": "AI ~1% of GDP 2030\nContinuous brain drain",
-        "fig5_s2_detail": "Operational AI Factories\nAI ~3% of GDP 2030",
-        "fig5_s3_detail": "Huawei/DeepSeek dependency\nSurveillance risk",
-        "fig5_s4_detail": "Multi-sourcing\nData sovereignty",
-        "fig5_source": "Source: Author analysis, adapted from Chapter V matrix",
-        "fig5_mod": "Moderate",
-        "fig5_int": "Intense",
-        "fig5_pass": "Passive",
-        "fig5_act": "Active",
-        "fig6_title": "CACI Ratios: The Africa / US Abyss\n(2025)",
-        "fig6_ylabel": "US / Africa Ratio (×)",
-        "fig6_cats": ["DC Capacity\n(GW IT)", "DC Investment\n($)", "AI GPUs\n(Nvidia)", "AI Talent\n(pool)", "AI Market\n($)"],
-        "fig6_source": "Sources: compiled data — IEA, McKinsey, Mordor Intelligence, WEF, Tech In Africa (2025-2026)",
-    },
-    "pt": {
-        "suffix": "PT",
-        "fig1_title": "Capacidade de data center: África vs o mundo\n(MW IT load, meados de 2025)",
-        "fig1_ylabel": "MW (IT load)",
-        "fig1_cats": ["Estados Unidos", "Europa", "China", "Índia", "África"],
-        "fig1_source": "Fontes: IEA (2025), McKinsey (2025), Mordor Intelligence (2026), African Energy Chamber (2025)",
-        "fig1_annot": "< 2% do total global",
-        "fig2_title": "Os seis polos de IA africanos: data centers e investimentos\n(2025)",
-        "fig2_ylabel": "",
-        "fig2_cats": ["África do Sul", "Nigéria", "Quênia", "Marrocos", "Egito", "Ruanda"],
-        "fig2_dc_label": "Data centers (nº)",
-        "fig2_inv_label": "Investimento-chave (M$)",
-        "fig2_source": "Fontes: Mordor Intelligence (2026), African Energy Chamber (2025), DCD (2025), Bloomberg (2025)",
-        "fig3_title": "Mercado de IA africano: trajetória de crescimento\n(2025-2031, bilhões USD)",
-        "fig3_ylabel": "Bilhões USD",
-        "fig3_xlabel": "",
-        "fig3_label_ai": "Mercado de IA africano",
-        "fig3_label_dc": "Mercado de data centers africano",
-        "fig3_source": "Fontes: Tech In Africa (2025), Mordor Intelligence (2026), McKinsey (2025)",
-        "fig3_cagr_ai": "CAGR 27%",
-        "fig3_cagr_dc": "CAGR 14,5%",
-        "fig4_title": "Competição de IA na África: engajamentos EUA vs China\n(principais investimentos, M$)",
-        "fig4_ylabel": "Milhões USD",
-        "fig4_cats": ["Infraestrutura\nDC/GPU", "Cloud &\nhyperscalers", "Formação\ntalentos IA", "Modelos de IA\n& serviços"],
-        "fig4_legend_us": "Estados Unidos",
-        "fig4_legend_cn": "China",
-        "fig4_source": "Fontes: Bloomberg (2025), DCD (2025), Semafor (2025), Rest of World (2025), Africa Defense Forum (2025)",
-        "fig5_title": "Matriz de cenários 2×2: trajetórias de IA para a África\n(2026-2030)",
-        "fig5_x_label": "Intensidade do protecionismo EUA →",
-        "fig5_y_label": "← Resposta africana ativa",
-        "fig5_s1": "C1\nEstagnação\ndependente",
-        "fig5_s2": "C2\nRecuperação\ndirecionada",
-        "fig5_s3": "C3\nBifurcação\nimposta",
-        "fig5_s4": "C4\nNão-alinhamento\ndigital",
-        "fig5_s1_detail": "IA ~1% do PIB 2030\nFuga de cérebros contínua",
-        "fig5_s2_detail": "AI Factories operacionais\nIA ~3% do PIB 2030",
-        "fig5_s3_detail": "Dependência Huawei/DeepSeek\nRisco de vigilância",
-        "fig5_s4_detail": "Multi-sourcing\nSoberania de dados",
-        "fig5_source": "Fonte: Análise do autor, adaptação da matriz Capítulo V",
-        "fig5_mod": "Moderado",
-        "fig5_int": "Intenso",
-        "fig5_pass": "Passiva",
-        "fig5_act": "Ativa",
-        "fig6_title": "Razões CACI: o abismo África / Estados Unidos\n(2025)",
-        "fig6_ylabel": "Razão EUA / África (×)",
-        "fig6_cats": ["Capacidade DC\n(GW IT)", "Investimento\nDC ($)", "GPUs de IA\n(Nvidia)", "Talento IA\n(pool)", "Mercado IA\n($)"],
-        "fig6_source": "Fontes: dados compilados — IEA, McKinsey, Mordor Intelligence, WEF, Tech In Africa (2025-2026)",
-    },
-}
+# Un catalogue JSON par langue (locales/chapitre6quat/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 
 def setup_style():
-    plt.rcParams.update({
-        'font.family': 'sans-serif',
-        'font.sans-serif': ['DejaVu Sans', 'Arial', 'Helvetica'],
-        'font.size': 11,
-        'axes.facecolor': BG_COLOR,
-        'figure.facecolor': 'white',
-        'axes.grid': True,
-        'grid.alpha': 0.3,
-        'grid.color': GRID_COLOR,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-    })
-
-
-def save_fig(fig, name, lang_suffix):
-    path = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}.png")
-    fig.savefig(path, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {path}")
+    """Style commun, grille très légère."""
+    afia_style.setup_style({'grid.alpha': 0.3})
 
 
 # =============================================================================
@@ -250,7 +83,7 @@ def fig1_dc_capacity(L, lang):
 
     fig.text(0.5, -0.02, L["fig1_source"], ha='center', fontsize=8, color='gray', style='italic')
     fig.tight_layout()
-    save_fig(fig, "fig1_dc_capacity", L["suffix"])
+    return save_fig(fig, "fig1_dc_capacity", L["suffix"])
 
 
 # =============================================================================
@@ -289,7 +122,7 @@ def fig2_african_hubs(L, lang):
     fig.suptitle(L["fig2_title"], fontsize=14, fontweight='bold', color=DARK_BLUE, y=1.02)
     fig.text(0.5, -0.04, L["fig2_source"], ha='center', fontsize=8, color='gray', style='italic')
     fig.tight_layout()
-    save_fig(fig, "fig2_african_hubs", L["suffix"])
+    return save_fig(fig, "fig2_african_hubs", L["suffix"])
 
 
 # =============================================================================
@@ -334,7 +167,7 @@ def fig3_market_growth(L, lang):
 
     fig.text(0.5, -0.02, L["fig3_source"], ha='center', fontsize=8, color='gray', style='italic')
     fig.tight_layout()
-    save_fig(fig, "fig3_market_growth", L["suffix"])
+    return save_fig(fig, "fig3_market_growth", L["suffix"])
 
 
 # =============================================================================
@@ -377,7 +210,7 @@ def fig4_us_vs_china(L, lang):
 
     fig.text(0.5, -0.02, L["fig4_source"], ha='center', fontsize=8, color='gray', style='italic')
     fig.tight_layout()
-    save_fig(fig, "fig4_us_vs_china", L["suffix"])
+    return save_fig(fig, "fig4_us_vs_china", L["suffix"])
 
 
 # =============================================================================
@@ -429,7 +262,7 @@ def fig5_scenario_matrix(L, lang):
 
     fig.suptitle(L["fig5_title"], fontsize=14, fontweight='bold', color=DARK_BLUE, y=0.98)
     fig.text(0.5, 0.01, L["fig5_source"], ha='center', fontsize=8, color='gray', style='italic')
-    save_fig(fig, "fig5_scenario_matrix", L["suffix"])
+    return save_fig(fig, "fig5_scenario_matrix", L["suffix"])
 
 
 # =============================================================================
@@ -462,34 +295,35 @@ def fig6_caci_ratios(L, lang):
 
     fig.text(0.5, -0.02, L["fig6_source"], ha='center', fontsize=8, color='gray', style='italic')
     fig.tight_layout()
-    save_fig(fig, "fig6_caci_ratios", L["suffix"])
+    return save_fig(fig, "fig6_caci_ratios", L["suffix"])
 
 
 # =============================================================================
 # MAIN
 # =============================================================================
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
 
     print("=" * 70)
     print(" AI FOR AMERICANS FIRST — Chapitre VI quater : Afrique")
-    print(" Génération des 6 figures × 3 langues = 18 PNG")
+    print(f" Génération des 6 figures × {len(LANGS)} langue(s)")
     print("=" * 70)
 
+    all_files = []
     for lang_key, L in LANGS.items():
         print(f"\n─── Langue : {lang_key.upper()} ───")
-        fig1_dc_capacity(L, lang_key)
-        fig2_african_hubs(L, lang_key)
-        fig3_market_growth(L, lang_key)
-        fig4_us_vs_china(L, lang_key)
-        fig5_scenario_matrix(L, lang_key)
-        fig6_caci_ratios(L, lang_key)
+        all_files.append(fig1_dc_capacity(L, lang_key))
+        all_files.append(fig2_african_hubs(L, lang_key))
+        all_files.append(fig3_market_growth(L, lang_key))
+        all_files.append(fig4_us_vs_china(L, lang_key))
+        all_files.append(fig5_scenario_matrix(L, lang_key))
+        all_files.append(fig6_caci_ratios(L, lang_key))
 
     print(f"\n{'=' * 70}")
-    print(f" ✅ 18 fichiers PNG générés dans {OUTPUT_DIR}/")
+    print(f" ✅ {len(all_files)} fichier(s) généré(s) dans {afia_style.OUTPUT_DIR}/")
     print(f"{'=' * 70}")
 
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
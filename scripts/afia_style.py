@@ -0,0 +1,241 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Style et sortie communs des générateurs de figures
+=============================================================================
+ Remplace les copies de setup_style / save_fig / couleurs / OUTPUT_DIR des
+ scripts de chapitres :
+   - palette partagée (US_COLOR, EU_COLOR, …) ;
+   - setup_style(overrides) : afia.mplstyle, lu une fois par processus, plus
+     les écarts propres à un chapitre (ex. {'grid.alpha': 0.5}) ;
+   - OUTPUT_DIR : <racine>/figures, ou la variable AFIA_OUTPUT_DIR ;
+   - save_fig(fig, name, lang_suffix) : appelle chaque saver actif (PNG par
+     défaut, encodé en arrière-plan par png_encode) puis ferme la figure.
+     De nouveaux formats s'ajoutent avec register_saver() et s'activent
+     avec set_savers().
+ Les formats actifs au démarrage sont lus dans AFIA_FIGURE_FORMATS
+ (ex. "svg,png") : les schémas sortent alors en vectoriel, plus légers et
+ imprimables à toute taille sans nouveau rendu.
+
+ Traductions : load_catalogs(__file__) remplace le dictionnaire LANGS de
+ chaque script par un Mapping paresseux sur locales/<chapitre>/<langue>.json
+ (à côté du script). Un catalogue n'est lu qu'au premier accès à sa langue ;
+ select_langs() (--lang, ou AFIA_LANGS) restreint les langues parcourues.
+
+ Mode brouillon (set_draft(), --draft des scripts de chapitre ou
+ AFIA_DRAFT=1) : DRAFT_DPI, pas de bbox_inches='tight', compression PNG
+ minimale et sortie dans OUTPUT_DIR/draft, pour itérer vite sur la mise en
+ page d'une figure sans toucher aux rendus définitifs.
+=============================================================================
+"""
+
+import argparse
+import collections.abc
+import functools
+import json
+import os
+import time
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import figure_layout
+import figure_report
+import png_encode
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+STYLE_PATH = os.path.join(SCRIPTS_DIR, "afia.mplstyle")
+
+# ─── Configuration ──────────────────────────────────────────────────────────
+OUTPUT_DIR = os.environ.get("AFIA_OUTPUT_DIR", os.path.join(ROOT_DIR, "figures"))
+DPI = 300
+SAVEFIG_KW = {'bbox_inches': 'tight', 'facecolor': 'white', 'edgecolor': 'none'}
+# Métadonnées retirées des fichiers vectoriels (dates, versions) : un même
+# rendu donne les mêmes octets d'une exécution à l'autre.
+VECTOR_METADATA = {
+    "svg": {'Date': None, 'Creator': None},
+    "pdf": {'CreationDate': None, 'ModDate': None, 'Creator': None, 'Producer': None},
+}
+FORMATS_ENV = "AFIA_FIGURE_FORMATS"
+
+DRAFT_ENV = "AFIA_DRAFT"
+DRAFT_DPI = 72
+DRAFT = False
+
+# Couleurs partagées par tous les chapitres
+US_COLOR = "#1B4F72"       # Bleu foncé (US)
+EU_COLOR = "#D4AC0D"       # Or/jaune (EU)
+FR_COLOR = "#2E86C1"       # Bleu moyen (France)
+CN_COLOR = "#C0392B"       # Rouge (Chine)
+ACCENT1 = "#148F77"        # Vert canard
+BG_COLOR = "#FAFBFC"
+GRID_COLOR = "#E0E0E0"
+
+_style = None
+
+
+def setup_style(overrides=None):
+    """Applique afia.mplstyle puis les rcParams propres au chapitre."""
+    global _style
+    if _style is None:
+        _style = matplotlib.rc_params_from_file(STYLE_PATH, use_default_template=False)
+    plt.rcParams.update(_style)
+    if overrides:
+        plt.rcParams.update(overrides)
+
+
+# ─── Savers ─────────────────────────────────────────────────────────────────
+# Un saver reçoit (fig, stem) — chemin sans extension — et renvoie le chemin
+# du fichier (écrit au plus tard à png_encode.wait()). save_fig les appelle
+# dans l'ordre de ACTIVE_SAVERS.
+def save_png(fig, stem):
+    """Rendu Agg ici ; compression et écriture dans un thread (png_encode).
+
+    Le cadrage serré vient du cache de figure_layout quand le build en fournit
+    la clé.
+    """
+    path = f"{stem}.png"
+    savefig_kw = dict(SAVEFIG_KW)
+    t0 = time.perf_counter()
+    if savefig_kw.get('bbox_inches') == 'tight':
+        savefig_kw['bbox_inches'] = figure_layout.bbox_inches(fig, DPI)
+    rgba, entry = figure_report.render_rgba_timed(fig, path, time.perf_counter() - t0,
+                                                  dpi=DPI, **savefig_kw)
+    png_encode.submit(rgba, path, DPI, entry)
+    return path
+
+
+def save_vector(fig, stem, ext):
+    """SVG / PDF : textes et tracés vectoriels, DPI pour les seules images."""
+    path = f"{stem}.{ext}"
+    figure_report.savefig_timed(fig, path, dpi=DPI, metadata=VECTOR_METADATA[ext], **SAVEFIG_KW)
+    return path
+
+
+SAVERS = {
+    "png": save_png,
+    "svg": functools.partial(save_vector, ext="svg"),
+    "pdf": functools.partial(save_vector, ext="pdf"),
+}
+ACTIVE_SAVERS = []
+
+
+def register_saver(name, saver):
+    SAVERS[name] = saver
+
+
+def set_savers(names):
+    """Active les savers donnés, dans l'ordre (le premier fournit le chemin renvoyé)."""
+    unknown = [n for n in names if n not in SAVERS]
+    if unknown:
+        raise ValueError(f"saver(s) inconnu(s) : {', '.join(unknown)}")
+    ACTIVE_SAVERS[:] = names
+
+
+set_savers(os.environ.get(FORMATS_ENV, "png").split(","))
+
+
+def format_path(path, fmt):
+    """Chemin du fichier au format fmt d'un même rendu (save_fig ne renvoie que le premier)."""
+    return f"{os.path.splitext(path)[0]}.{fmt}"
+
+
+def save_fig(fig, name, lang_suffix):
+    """Sauvegarde avec nom normalisé dans OUTPUT_DIR ; renvoie le premier chemin."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    stem = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}")
+    paths = [SAVERS[n](fig, stem) for n in ACTIVE_SAVERS]
+    plt.close(fig)
+    for path in paths:
+        print(f"  ✓ {path}")
+    return paths[0]
+
+
+# ─── Catalogues de traduction ───────────────────────────────────────────────
+LANG_ORDER = ("fr", "en", "pt")
+LANGS_ENV = "AFIA_LANGS"
+SELECTED_LANGS = None
+
+
+class Catalogs(collections.abc.Mapping):
+    """LANGS d'un chapitre : un fichier JSON par langue, lu au premier accès."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._loaded = {}
+
+    def available(self):
+        """Langues présentes, dans l'ordre LANG_ORDER puis alphabétique."""
+        langs = [os.path.splitext(n)[0] for n in os.listdir(self.directory)
+                 if n.endswith(".json")]
+        rank = {lang: i for i, lang in enumerate(LANG_ORDER)}
+        return sorted(langs, key=lambda lang: (rank.get(lang, len(rank)), lang))
+
+    def __iter__(self):
+        return iter([lang for lang in self.available()
+                     if SELECTED_LANGS is None or lang in SELECTED_LANGS])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+    def __getitem__(self, lang):
+        # Relu si le fichier a changé depuis (build_figures --watch).
+        path = os.path.join(self.directory, f"{lang}.json")
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            raise KeyError(lang) from None
+        loaded = self._loaded.get(lang)
+        if loaded is None or loaded[0] != mtime:
+            with open(path, encoding="utf-8") as f:
+                loaded = self._loaded[lang] = (mtime, json.load(f))
+        return loaded[1]
+
+
+def catalog_dir(script_path):
+    """locales/<chapitre>/ à côté du script (generate_chapitre3_graphs → chapitre3)."""
+    stem = os.path.splitext(os.path.basename(script_path))[0]
+    name = stem.removeprefix("generate_").removesuffix("_graphs")
+    return os.path.join(os.path.dirname(os.path.abspath(script_path)), "locales", name)
+
+
+def load_catalogs(script_path):
+    return Catalogs(catalog_dir(script_path))
+
+
+def select_langs(langs):
+    """Restreint les langues parcourues par les catalogues (None : toutes)."""
+    global SELECTED_LANGS
+    SELECTED_LANGS = tuple(langs) if langs else None
+
+
+# ─── Mode brouillon ─────────────────────────────────────────────────────────
+def set_draft():
+    """Passe en rendu brouillon (idempotent)."""
+    global DRAFT, DPI, OUTPUT_DIR
+    if DRAFT:
+        return
+    DRAFT, DPI = True, DRAFT_DPI
+    SAVEFIG_KW.pop('bbox_inches', None)
+    OUTPUT_DIR = os.path.join(OUTPUT_DIR, "draft")
+    png_encode.configure(level=1)
+
+
+def parse_cli(argv=None):
+    """Options communes des scripts de chapitre lancés directement."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--draft", action="store_true",
+                        help=f"rendu rapide à {DRAFT_DPI} DPI, sans recadrage, dans OUTPUT_DIR/draft")
+    parser.add_argument("--lang", default="",
+                        help="langues à générer, séparées par des virgules (défaut : toutes)")
+    args = parser.parse_args(argv)
+    if args.draft:
+        set_draft()
+    select_langs([lang.strip() for lang in args.lang.split(",") if lang.strip()])
+    return args
+
+
+if os.environ.get(DRAFT_ENV):
+    set_draft()
+select_langs([lang for lang in os.environ.get(LANGS_ENV, "").split(",") if lang])
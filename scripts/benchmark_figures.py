@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Benchmark des fonctions de figures
+=============================================================================
+ Usage  : python benchmark_figures.py                     # tout mesurer
+          python benchmark_figures.py -c 6ter -k synthesis
+          python benchmark_figures.py --save-baseline       # fige la référence
+ Output : tableau des médianes + .build_cache/benchmark_last.json
+=============================================================================
+ Pour chaque (chapitre, figN_*, langue) : W exécutions d'échauffement puis
+ R exécutions mesurées (médiane), rendu complet à DPI dans un dossier
+ temporaire. Chaque exécution encode et écrit ses PNG (png_encode,
+ force=True), même identiques aux précédents, et recalcule son cadrage
+ serré (cache de figure_layout coupé, layouts.jsonl intact). Le coût
+ d'import de chaque module de chapitre est mesuré dans un interpréteur
+ neuf (matplotlib déjà chargé), R fois.
+
+ Le code de sortie vaut 1 si une figure (ou un import) dépasse sa médiane
+ de référence de plus de --threshold (relatif) ET de --min-delta secondes.
+=============================================================================
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import afia_style
+import build_figures
+import figure_layout
+import png_encode
+
+CACHE_DIR = os.path.join(build_figures.ROOT_DIR, ".build_cache")
+BASELINE_PATH = os.path.join(CACHE_DIR, "benchmark_baseline.json")
+LAST_PATH = os.path.join(CACHE_DIR, "benchmark_last.json")
+
+IMPORT_PROBE = """
+import sys, time
+sys.path.insert(0, {scripts!r})
+import build_figures
+t0 = time.perf_counter()
+build_figures.load_chapter({chapter!r})
+print(time.perf_counter() - t0)
+"""
+
+
+def import_cost(chapter, repeat):
+    """Médiane du temps d'exécution du module de chapitre, interpréteur neuf."""
+    code = IMPORT_PROBE.format(scripts=build_figures.SCRIPTS_DIR, chapter=chapter)
+    samples = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                             text=True, check=True).stdout
+        samples.append(float(out.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+
+def time_figure(job, warmup, repeat):
+    """Médiane des durées de rendu d'un job (encodage PNG compris) après échauffement."""
+    task = (job[0], job[1], (job[2],))
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(warmup + repeat):
+            t0 = time.perf_counter()
+            build_figures.run_task(task)
+            if i >= warmup:
+                samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def compare(results, baseline, threshold, min_delta):
+    """Liste des (clé, mesure, référence) en régression."""
+    regressions = []
+    for key, value in results.items():
+        ref = baseline.get(key)
+        if ref is not None and value > ref * (1 + threshold) and value - ref > min_delta:
+            regressions.append((key, value, ref))
+    return regressions
+
+
+def load_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json(data, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des fonctions figN_* de chaque chapitre.")
+    parser.add_argument("-c", "--chapters", default=",".join(build_figures.CHAPTERS),
+                        help="chapitres à mesurer, séparés par des virgules")
+    parser.add_argument("-k", "--filter", default="",
+                        help="expression régulière sur le nom de la fonction")
+    parser.add_argument("-l", "--langs", default="",
+                        help="langues à mesurer (défaut : toutes)")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="échauffements (défaut : 1)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="mesures (défaut : 3)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="régression relative tolérée (défaut : 0.25)")
+    parser.add_argument("--min-delta", type=float, default=0.05,
+                        help="régression absolue minimale en secondes (défaut : 0.05)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="fichier de référence")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="enregistre les mesures comme nouvelle référence")
+    parser.add_argument("--no-imports", action="store_true",
+                        help="ne mesure pas le coût d'import des modules")
+    args = parser.parse_args(argv)
+    args.chapters = [c.strip() for c in args.chapters.split(",") if c.strip()]
+    args.langs = [l.strip() for l in args.langs.split(",") if l.strip()]
+    unknown = [c for c in args.chapters if c not in build_figures.CHAPTERS]
+    if unknown:
+        parser.error(f"chapitre(s) inconnu(s) : {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = {}
+
+    print("=" * 70)
+    print(f" BENCHMARK FIGURES — échauffement {args.warmup}, mesures {args.repeat}")
+    print("=" * 70)
+
+    if not args.no_imports:
+        print("\n Coût d'import (interpréteur neuf, matplotlib chargé)")
+        for chapter in args.chapters:
+            results[f"import/{chapter}"] = cost = import_cost(chapter, args.repeat)
+            print(f"   {cost:7.3f} s  {chapter}")
+
+    pattern = re.compile(args.filter)
+    jobs = [job for job in build_figures.enumerate_jobs(args.chapters)
+            if pattern.search(job[1]) and (not args.langs or job[2] in args.langs)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Rendus et rapport de construction isolés du build réel.
+        os.environ["AFIA_FIGURE_REPORT"] = os.path.join(tmp, "report.jsonl")
+        afia_style.OUTPUT_DIR = tmp
+        png_encode.configure(force=True)
+        figure_layout.set_enabled(False)
+
+        print(f"\n Rendu des figures ({len(jobs)} jobs, médiane en secondes)")
+        for job in jobs:
+            key = "/".join(job)
+            results[key] = median = time_figure(job, args.warmup, args.repeat)
+            print(f"   {median:7.3f} s  {key}")
+
+    save_json(results, LAST_PATH)
+    baseline = load_json(args.baseline)
+    regressions = compare(results, baseline, args.threshold, args.min_delta)
+
+    if args.save_baseline:
+        baseline.update(results)
+        save_json(baseline, args.baseline)
+        print(f"\n Référence enregistrée : {args.baseline}")
+    elif not baseline:
+        print(f"\n Aucune référence ({args.baseline}) — relancer avec --save-baseline")
+
+    for key, value, ref in regressions:
+        print(f"  ✗ {key} : {value:.3f} s (référence {ref:.3f} s, "
+              f"+{(value / ref - 1) * 100:.0f}%)", file=sys.stderr)
+
+    print(f"\n{'='*70}")
+    print(f" {len(results)} mesures, {len(regressions)} régression(s)")
+    print(f"{'='*70}")
+    return 1 if regressions and not args.save_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Construction unifiée des figures
+ Pilote parallèle pour tous les générateurs de chapitres (FR / EN / PT-BR)
+=============================================================================
+ Usage  : python build_figures.py                 # tous les chapitres
+          python build_figures.py -c 3,6ter -j 8  # sélection, 8 processus
+          python build_figures.py --list          # liste des jobs
+          python build_figures.py --force         # ignore le cache
+          python build_figures.py --report r.jsonl  # rapport de temps/tailles
+          python build_figures.py --format svg,png  # vectoriel + PNG
+          python build_figures.py --png-level 3 --png-palette 256
+          python build_figures.py --web           # + dérivés WebP / AVIF
+          python build_figures.py --chapter-pdf   # + un PDF vectoriel par chapitre
+          python build_figures.py -c 5 -k tipping --draft  # itération rapide
+          python build_figures.py --diff          # régressions vs docs/figures
+          python build_figures.py --publish       # docs/figures + figures.json + web
+          python build_figures.py --lang en       # une seule langue
+          python build_figures.py --no-check      # sans vérifier les catalogues
+          python build_figures.py -c 5 --draft --watch  # re-rendu à l'enregistrement
+ Output : PNG files in afia_style.OUTPUT_DIR (figures/ ou $AFIA_OUTPUT_DIR)
+=============================================================================
+ Chaque job est un triplet (chapitre, figN_*, langue). Les modules de
+ chapitre sont importés une seule fois par processus et leurs catalogues de
+ traduction (locales/) lus seulement pour les langues construites. Avant
+ tout rendu, check_langs.py vérifie que chaque catalogue contient les clés
+ lues par les figures demandées, avec des listes de même longueur dans
+ toutes les langues ; en cas de problème le build s'arrête. Les
+ jobs sont répartis sur un pool de processus dimensionné sur la machine. Les
+ figures dont la clé de cache (figure_cache.py) n'a pas changé sont sautées.
+ Chaque save_fig ajoute temps et tailles au rapport JSON lines
+ (figure_report.py). Les PNG sont compressés par un pool de threads pendant
+ le rendu suivant (png_encode.py) ; chaque processus attend ses encodages
+ en fin de tâche.
+ Le cadrage serré de chaque PNG est mémorisé par clé de mise en page
+ (figure_layout.py) : seul un nouveau rendu de la même figure, même langue
+ (--force, autre format, autre compression), saute la passe de mesure de
+ bbox_inches='tight' — un build ordinaire n'en profite pas.
+ Après chaque tâche, figure_memory.py ferme les figures restées ouvertes
+ (échec FigureLeak), libère les figures fermées et vérifie que le RSS du
+ processus reste stable.
+ Avec --web, les PNG sont ensuite déclinés en WebP / AVIF pour srcset
+ (figure_derivatives.py, dans OUTPUT_DIR/web), à partir du même cache.
+ Avec --chapter-pdf, chaque chapitre est aussi écrit, page par page, dans
+ un PDF vectoriel par langue (figure_pdf.py, dans OUTPUT_DIR/pdf), réécrit
+ seulement si l'une de ses figures a changé.
+ Avec --draft, rendu brouillon (afia_style.set_draft) dans OUTPUT_DIR/draft.
+ Avec --diff, les PNG rendus sont comparés à docs/figures (figure_diff.py).
+ Avec --watch, le build se poursuit par une surveillance des scripts, des
+ catalogues et des données (figure_watch.py) : chaque enregistrement
+ re-rend les seules figures dont la clé a changé, sans ré-importer
+ matplotlib ni les chapitres intacts.
+ Les builds répétés (CI, itérations) peuvent passer par figure_server.py,
+ qui garde matplotlib, les polices et la pile statistique de l'annexe
+ chargées : `figure_server.py build <options>` remplace alors
+ `build_figures.py <options>` sans les ≈ 2,8 s d'imports.
+ Chaque build met à jour OUTPUT_DIR/figures.json (figure_index.py) : chapitre,
+ numéro, langue, hash, taille et fonction source de chaque figure.
+ --publish rend dans docs/figures (PUBLISH_DIR) avec --web : la galerie de
+ docs/index.html y lit figures.json et web/manifest.json. Les PNG publiés
+ sont alors ceux de la pile matplotlib / FreeType locale ; pour ne mettre
+ à jour que l'index et les dérivés des PNG déjà publiés, sans rendu :
+ figure_index.py puis figure_derivatives.py.
+=============================================================================
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import os
+import re
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import afia_style
+import check_langs
+import figure_cache
+import figure_derivatives
+import figure_diff
+import figure_index
+import figure_layout
+import figure_memory
+import figure_pdf
+import figure_report
+import figure_watch
+import png_encode
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+
+# Figures publiées, lues par docs/index.html (--publish).
+PUBLISH_DIR = os.path.join(ROOT_DIR, "docs", "figures")
+
+# ─── Registre des chapitres ─────────────────────────────────────────────────
+CHAPTERS = {
+    "1":      os.path.join(SCRIPTS_DIR, "generate_chapitre1_graphs.py"),
+    "2":      os.path.join(SCRIPTS_DIR, "generate_chapitre2_graphs.py"),
+    "3":      os.path.join(SCRIPTS_DIR, "generate_chapitre3_graphs.py"),
+    "4":      os.path.join(SCRIPTS_DIR, "generate_chapitre4_graphs.py"),
+    "5":      os.path.join(SCRIPTS_DIR, "generate_chapitre5_graphs.py"),
+    "6":      os.path.join(SCRIPTS_DIR, "generate_chapitre6_graphs.py"),
+    "6bis":   os.path.join(SCRIPTS_DIR, "generate_chapitre6bis_graphs.py"),
+    "6ter":   os.path.join(SCRIPTS_DIR, "generate_chapitre6ter_graphs.py"),
+    "6quat":  os.path.join(ROOT_DIR, "docs", "figures", "figure_ch6quart",
+                           "generate_chapitre6quat_graphs.py"),
+    "7":      os.path.join(SCRIPTS_DIR, "generate_chapitre7_graphs.py"),
+    "annexe": os.path.join(SCRIPTS_DIR, "generate_caci_graphs_multilingual.py"),
+}
+
+FIG_FUNC_RE = re.compile(r"^fig(\d+)_\w+$")
+
+
+def load_chapter(chapter):
+    """Importe (une fois par processus) le module générateur d'un chapitre.
+
+    Le module est ré-exécuté si son fichier a changé depuis (--watch).
+    """
+    path = CHAPTERS[chapter]
+    mod_name = os.path.splitext(os.path.basename(path))[0]
+    mod = sys.modules.get(mod_name)
+    mtime = os.stat(path).st_mtime_ns
+    if mod is None or getattr(mod, "_chapter_mtime", None) != mtime:
+        spec = importlib.util.spec_from_file_location(mod_name, path)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[mod_name] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except BaseException:
+            del sys.modules[mod_name]
+            raise
+        mod._chapter_mtime = mtime
+    return mod
+
+
+def figure_functions(mod):
+    """Fonctions figN_* définies dans le module, triées par numéro de figure."""
+    funcs = []
+    for name, obj in vars(mod).items():
+        m = FIG_FUNC_RE.match(name)
+        if m and callable(obj) and getattr(obj, "__module__", None) == mod.__name__:
+            funcs.append((int(m.group(1)), name))
+    return [name for _, name in sorted(funcs)]
+
+
+def enumerate_jobs(chapters):
+    """Liste des jobs (chapitre, fonction, langue) pour les chapitres demandés."""
+    jobs = []
+    for chapter in chapters:
+        mod = load_chapter(chapter)
+        for lang_key in mod.LANGS:
+            for fn_name in figure_functions(mod):
+                jobs.append((chapter, fn_name, lang_key))
+    return jobs
+
+
+def apply_style(mod):
+    """Repart des rcParams par défaut puis applique le style du chapitre."""
+    plt.rcdefaults()
+    mod.setup_style()
+
+
+def job_keys(jobs):
+    """Clé de cache de chaque job, calculée avec le style actif du chapitre."""
+    keys = {}
+    for chapter in dict.fromkeys(job[0] for job in jobs):
+        mod = load_chapter(chapter)
+        apply_style(mod)
+        rc = dict(plt.rcParams)
+        for job in jobs:
+            if job[0] == chapter:
+                keys[job] = figure_cache.job_key(mod, job[1], mod.LANGS[job[2]], rc)
+    return keys
+
+
+@contextlib.contextmanager
+def layout_cache(mod, fn_name, L):
+    """Active le cadrage mémorisé (figure_layout) pour les sauvegardes du bloc."""
+    figure_layout.set_key(figure_cache.layout_key(mod, fn_name, L, dict(plt.rcParams)))
+    try:
+        yield
+    finally:
+        figure_layout.set_key(None)
+
+
+def run_job(job):
+    """Rend une figure dans le processus courant ; renvoie (job, chemin, durée)."""
+    chapter, fn_name, lang_key = job
+    mod = load_chapter(chapter)
+    apply_style(mod)
+    t0 = time.perf_counter()
+    L = mod.LANGS[lang_key]
+    with layout_cache(mod, fn_name, L):
+        path = getattr(mod, fn_name)(L, lang_key)
+    if path is not None:
+        path = os.path.abspath(path)
+    return job, path, time.perf_counter() - t0
+
+
+def run_chapter_pdf_job(chapter, lang_key):
+    """Écrit le PDF multi-pages d'un chapitre ; renvoie (job, chemin, durée)."""
+    mod = load_chapter(chapter)
+    apply_style(mod)
+    t0 = time.perf_counter()
+    path = figure_pdf.chapter_pdf_path(chapter, mod.LANGS[lang_key]["suffix"])
+    figure_pdf.write_chapter_pdf(mod, figure_functions(mod), lang_key, path)
+    return (chapter, figure_pdf.CHAPTER_PDF, lang_key), path, time.perf_counter() - t0
+
+
+def make_tasks(jobs):
+    """Tâches (chapitre, fonction, langues) : une langue par tâche."""
+    return [(chapter, fn_name, (lang_key,)) for chapter, fn_name, lang_key in jobs]
+
+
+def run_task(task, flush=True):
+    """Exécute une tâche ; renvoie la liste des (job, chemin, durée).
+
+    Avec flush, attend la fin des encodages PNG et lève en cas d'erreur.
+    Les figures laissées ouvertes et la croissance mémoire sont contrôlées
+    par figure_memory.guard.
+    """
+    chapter, fn_name, lang_keys = task
+    with figure_memory.guard(f"{chapter}/{fn_name}"):
+        if fn_name == figure_pdf.CHAPTER_PDF:
+            results = [run_chapter_pdf_job(chapter, lang_keys[0])]
+        else:
+            results = [run_job((chapter, fn_name, lang_keys[0]))]
+        if flush:
+            errors = png_encode.wait()
+            if errors:
+                raise RuntimeError("\n".join(f"{path}\n{tb}" for path, tb in errors))
+    return results
+
+
+def _task_jobs(task):
+    return [(task[0], task[1], lk) for lk in task[2]]
+
+
+def build(tasks, workers=None, pool=None):
+    """Répartit les tâches sur un pool de processus ; renvoie (résultats, échecs).
+
+    pool : pool déjà démarré à réutiliser (--watch), sinon un pool est créé
+    pour l'appel.
+    """
+    results, failures = [], []
+    workers = workers or os.cpu_count() or 1
+
+    if pool is not None:
+        return _run_pool(pool, tasks)
+    if workers == 1:
+        # En série, les encodages PNG chevauchent le rendu des tâches suivantes.
+        for task in tasks:
+            try:
+                results.extend(run_task(task, flush=False))
+            except Exception:
+                failures.extend((job, traceback.format_exc()) for job in _task_jobs(task))
+        failed = dict(png_encode.wait())
+        failures.extend((job, failed[path]) for job, path, _ in results if path in failed)
+        results = [r for r in results if r[1] not in failed]
+        return results, failures
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks) or 1)) as pool:
+        return _run_pool(pool, tasks)
+
+
+def _run_pool(pool, tasks):
+    results, failures = [], []
+    futures = {pool.submit(run_task, task): task for task in tasks}
+    for fut in as_completed(futures):
+        try:
+            results.extend(fut.result())
+        except Exception:
+            tb = traceback.format_exc()
+            failures.extend((job, tb) for job in _task_jobs(futures[fut]))
+    return results, failures
+
+
+def stale_jobs(jobs, manifest, force=False):
+    """(clés, jobs à rendre) : jobs dont la clé de cache a changé."""
+    keys = job_keys(jobs)
+    return keys, [job for job in jobs if force or not figure_cache.is_fresh(manifest, job, keys[job])]
+
+
+def stale_chapter_pdfs(chapters, keys, manifest, force=False):
+    """(clés, jobs) des PDF de chapitre dont une figure a changé.
+
+    keys doit couvrir toutes les figures des chapitres (pas seulement -k).
+    """
+    pdf_keys = {}
+    for chapter in chapters:
+        mod = load_chapter(chapter)
+        for lang_key in mod.LANGS:
+            job = (chapter, figure_pdf.CHAPTER_PDF, lang_key)
+            pdf_keys[job] = figure_pdf.chapter_key(
+                keys[(chapter, fn_name, lang_key)] for fn_name in figure_functions(mod))
+    return pdf_keys, [job for job, key in pdf_keys.items()
+                      if force or not figure_cache.is_fresh(manifest, job, key)]
+
+
+def record(manifest, manifest_path, jobs, keys, results, failures):
+    """Met à jour manifeste, cache de cadrage et index figures.json."""
+    for job, path, _ in results:
+        manifest[figure_cache.manifest_id(job)] = {"key": keys[job], "path": path}
+    for job, _ in failures:
+        manifest.pop(figure_cache.manifest_id(job), None)
+    figure_cache.save_manifest(manifest, manifest_path)
+    figure_layout.compact()
+    index_path = os.path.join(afia_style.OUTPUT_DIR, figure_index.INDEX_NAME)
+    figure_index.write_index(index_path, jobs, manifest, load_chapter)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Construction parallèle des figures de l'étude.")
+    parser.add_argument("-c", "--chapters", default=",".join(CHAPTERS),
+                        help="chapitres à construire, séparés par des virgules "
+                             f"(défaut : tous — {','.join(CHAPTERS)})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("-l", "--lang", default="",
+                        help="langues à construire, séparées par des virgules (défaut : toutes)")
+    parser.add_argument("-k", "--filter", default="",
+                        help="expression régulière sur le nom de la fonction figN_*")
+    parser.add_argument("--draft", action="store_true",
+                        help=f"rendu brouillon ({afia_style.DRAFT_DPI} DPI, sans recadrage) "
+                             "dans OUTPUT_DIR/draft")
+    parser.add_argument("--no-check", action="store_true",
+                        help="ne vérifie pas les catalogues de traduction avant le rendu")
+    parser.add_argument("--list", action="store_true",
+                        help="affiche les jobs sans rien rendre")
+    parser.add_argument("--force", action="store_true",
+                        help="re-rend toutes les figures sans consulter le cache")
+    parser.add_argument("--report", default=figure_report.REPORT_PATH,
+                        help="rapport JSON lines de la construction "
+                             "(défaut : .build_cache/figure_report.jsonl)")
+    parser.add_argument("--format", default="png",
+                        help="formats de sortie séparés par des virgules "
+                             f"({', '.join(afia_style.SAVERS)} ; défaut : png)")
+    parser.add_argument("--png-level", type=int, default=png_encode.LEVEL,
+                        help=f"niveau de compression zlib des PNG, 0-9 (défaut : {png_encode.LEVEL})")
+    parser.add_argument("--png-palette", type=int, default=png_encode.PALETTE,
+                        help="palette PNG de N couleurs au plus ; avec perte si la figure "
+                             "en compte davantage (défaut : 0, désactivé)")
+    parser.add_argument("--web", action="store_true",
+                        help="produit aussi les dérivés WebP / AVIF et leur manifeste srcset")
+    parser.add_argument("--chapter-pdf", action="store_true",
+                        help="écrit aussi un PDF vectoriel multi-pages par chapitre et "
+                             "par langue dans OUTPUT_DIR/pdf")
+    parser.add_argument("--diff", action="store_true",
+                        help="compare les PNG rendus à docs/figures et liste ceux qui ont changé")
+    parser.add_argument("--publish", action="store_true",
+                        help="rend dans docs/figures, avec figures.json et les dérivés "
+                             "web (--web) lus par docs/index.html")
+    parser.add_argument("--watch", action="store_true",
+                        help="surveille scripts, catalogues et données ; re-rend les "
+                             "figures touchées à chaque enregistrement")
+    args = parser.parse_args(argv)
+    args.chapters = [c.strip() for c in args.chapters.split(",") if c.strip()]
+    args.lang = [lang.strip() for lang in args.lang.split(",") if lang.strip()]
+    unknown = [c for c in args.chapters if c not in CHAPTERS]
+    if unknown:
+        parser.error(f"chapitre(s) inconnu(s) : {', '.join(unknown)}")
+    if args.publish and (args.draft or args.diff):
+        parser.error("--publish ne se combine ni avec --draft ni avec --diff")
+    try:
+        png_encode.configure(args.png_level, args.png_palette)
+    except ValueError as exc:
+        parser.error(str(exc))
+    args.format = [f.strip() for f in args.format.split(",") if f.strip()]
+    unknown = [f for f in args.format if f not in afia_style.SAVERS]
+    if unknown or not args.format:
+        parser.error(f"format(s) inconnu(s) : {', '.join(unknown) or '(vide)'}")
+    if args.publish and "png" not in args.format:
+        parser.error("--publish demande le format png (galerie et dérivés web)")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    afia_style.select_langs(args.lang)
+    os.environ[afia_style.LANGS_ENV] = ",".join(args.lang)
+    pattern = re.compile(args.filter)
+    # Vérification statique des catalogues, avant même l'import des chapitres.
+    if not (args.list or args.no_check):
+        chapters = {chapter: CHAPTERS[chapter] for chapter in args.chapters}
+        problems = check_langs.report(check_langs.check(chapters, pattern))
+        if problems:
+            print("\n CATALOGUES DE TRADUCTION INCOMPLETS (--no-check pour passer outre)",
+                  file=sys.stderr)
+            print("\n".join(problems), file=sys.stderr)
+            return 2
+    jobs = [job for job in enumerate_jobs(args.chapters) if pattern.search(job[1])]
+
+    if args.list:
+        for chapter, fn_name, lang_key in jobs:
+            print(f"{chapter:<7} {fn_name:<40} {lang_key}")
+        return 0
+
+    # Les processus de rendu héritent des variables d'environnement.
+    if args.publish:
+        os.environ["AFIA_OUTPUT_DIR"] = afia_style.OUTPUT_DIR = PUBLISH_DIR
+        args.web = True
+    os.environ["AFIA_FIGURE_REPORT"] = os.path.abspath(args.report)
+    os.environ[afia_style.FORMATS_ENV] = ",".join(args.format)
+    afia_style.set_savers(args.format)
+    if args.draft:
+        os.environ[afia_style.DRAFT_ENV] = "1"
+        afia_style.set_draft()
+    os.environ[png_encode.LEVEL_ENV] = str(png_encode.LEVEL)
+    os.environ[png_encode.PALETTE_ENV] = str(png_encode.PALETTE)
+    manifest_path = (figure_cache.DRAFT_MANIFEST_PATH if args.draft
+                     else figure_cache.MANIFEST_PATH)
+    if os.path.exists(args.report):
+        os.remove(args.report)
+
+    t0 = time.perf_counter()
+    manifest = figure_cache.load_manifest(manifest_path)
+    keys, todo = stale_jobs(jobs, manifest, args.force)
+
+    print("=" * 70)
+    print(f" BUILD FIGURES — {len(todo)}/{len(jobs)} jobs à rendre, "
+          f"{len(args.chapters)} chapitres, {args.jobs} processus")
+    print("=" * 70)
+
+    tasks = make_tasks(todo)
+    if args.chapter_pdf:
+        all_keys = keys if not args.filter else job_keys(enumerate_jobs(args.chapters))
+        pdf_keys, pdf_todo = stale_chapter_pdfs(args.chapters, all_keys, manifest, args.force)
+        keys = {**keys, **pdf_keys}
+        # Tâches les plus longues (un chapitre entier) en tête du pool.
+        tasks = make_tasks(pdf_todo) + tasks
+    results, failures = build(tasks, args.jobs)
+    pdfs = [r for r in results if r[0][1] == figure_pdf.CHAPTER_PDF]
+    results = [r for r in results if r[0][1] != figure_pdf.CHAPTER_PDF]
+    record(manifest, manifest_path, jobs, keys, results + pdfs, failures)
+    if args.chapter_pdf:
+        print(f"\n PDF de chapitre : {len(pdfs)} écrit(s), {len(pdf_keys) - len(pdf_todo)} à jour")
+    if args.web and "png" in args.format and not args.draft:
+        made, _ = figure_derivatives.build(afia_style.OUTPUT_DIR, workers=args.jobs)
+        print(f"\n Dérivés web : {made} figure(s) déclinée(s)")
+    elapsed = time.perf_counter() - t0
+
+    print()
+    for line in figure_report.summarize(figure_report.load_report(args.report)):
+        print(line)
+    if args.diff:
+        # PNG de chaque job, quel que soit le premier format de --format.
+        rendered = (sorted(afia_style.format_path(path, "png") for _, path, _ in results if path)
+                    if "png" in args.format else [])
+        checked = figure_diff.check(rendered, workers=args.jobs)
+        changed = [r for r in checked if r["status"] in figure_diff.CHANGED]
+        print(f"\n Régressions visuelles : {len(changed)}/{len(checked)} figure(s) modifiée(s)")
+        for result in changed:
+            print(figure_diff.describe(result))
+    for (chapter, fn_name, lang_key), tb in failures:
+        print(f"\n  ✗ {chapter}/{fn_name} [{lang_key}]\n{tb}", file=sys.stderr)
+
+    print(f"\n{'='*70}")
+    print(f" Total : {len(results)} figures rendues, {len(jobs) - len(todo)} à jour, "
+          f"en {elapsed:.1f} s"
+          + (f" — {len(failures)} échec(s)" if failures else ""))
+    print(f"{'='*70}")
+    if args.watch:
+        return watch(args, manifest_path)
+    return 1 if failures else 0
+
+
+def watch(args, manifest_path):
+    """--watch : re-rend, à chaque enregistrement, les figures touchées.
+
+    Les modules de chapitre restent chargés (et les processus de rendu
+    démarrés) d'un cycle à l'autre ; seuls les jobs dont la clé de cache a
+    changé sont rendus (figure_watch.classify pour le détail).
+    """
+    pattern = re.compile(args.filter)
+    chapters = {chapter: CHAPTERS[chapter] for chapter in args.chapters}
+    roots = figure_watch.watch_roots(chapters)
+    state = figure_watch.snapshot(roots)
+    pool = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    print(f"\n Surveillance de {', '.join(os.path.relpath(r, ROOT_DIR) for r in roots)}"
+          " — Ctrl-C pour arrêter")
+    try:
+        while True:
+            state, changed = figure_watch.wait_for_change(roots, state)
+            t0 = time.perf_counter()
+            print(f"\n {time.strftime('%H:%M:%S')} — modifié : "
+                  + ", ".join(os.path.relpath(p, ROOT_DIR) for p in changed))
+            loaded = {os.path.abspath(m.__file__) for m in list(sys.modules.values())
+                      if getattr(m, "__file__", None)}
+            touched, restart = figure_watch.classify(changed, chapters, loaded)
+            if restart:
+                # Module du pilote ou feuille de style : état de chaque
+                # processus à refaire, redémarrage complet.
+                print(" ↻ module partagé modifié — redémarrage")
+                if pool is not None:
+                    pool.shutdown(cancel_futures=True)
+                os.execv(sys.executable, [sys.executable] + sys.argv)
+            if not touched:
+                print(" aucune figure concernée")
+                continue
+            try:
+                # Fichier en cours d'édition : une erreur n'arrête pas la surveillance.
+                problems = [] if args.no_check else check_langs.report(check_langs.check(
+                    {chapter: CHAPTERS[chapter] for chapter in touched}, pattern))
+                if problems:
+                    print("\n".join(problems), file=sys.stderr)
+                    continue
+                jobs = [job for job in enumerate_jobs(touched) if pattern.search(job[1])]
+                manifest = figure_cache.load_manifest(manifest_path)
+                keys, todo = stale_jobs(jobs, manifest)
+            except Exception:
+                traceback.print_exc()
+                continue
+            forced = {chapter for chapter, force in touched.items() if force}
+            todo += [job for job in jobs if job[0] in forced and job not in todo]
+            results, failures = build(make_tasks(todo), args.jobs, pool)
+            record(manifest, manifest_path, jobs, keys, results, failures)
+            for (chapter, fn_name, lang_key), tb in failures:
+                print(f"\n  ✗ {chapter}/{fn_name} [{lang_key}]\n{tb}", file=sys.stderr)
+            print(f" {len(results)}/{len(jobs)} figure(s) re-rendue(s) en "
+                  f"{time.perf_counter() - t0:.1f} s"
+                  + (f" — {len(failures)} échec(s)" if failures else ""))
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Modèles de l'annexe, ajustés une fois et mis en cache
+=============================================================================
+ L'annexe ré-estimait à chaque lancement ses trois modèles (MCO,
+ PanelOLS deux voies, RandomEffects) et importait pour cela statsmodels et
+ linearmodels (≈ 1,8 s), même quand seul un libellé de figure changeait.
+
+ fitted(df, estimator, dependent, exog, **options) renvoie un FittedModel :
+ params, bse / std_errors, cov, resid et fittedvalues, tels que les
+ produit la bibliothèque. Le résultat est enregistré (pickle) dans
+ .build_cache/models/<clé>.pkl ; la clé est un SHA-256 du panel (valeurs,
+ index, colonnes), de la spécification et des versions de numpy, pandas,
+ statsmodels et linearmodels. Un nouveau lancement sur le même panel relit
+ le fichier sans importer ces bibliothèques.
+
+ Le cache est borné à AFIA_MODEL_CACHE_MB Mo (défaut 64) : après chaque
+ écriture, les entrées les moins récemment lues sont supprimées jusqu'à
+ repasser sous la borne.
+=============================================================================
+"""
+
+import glob
+import hashlib
+import importlib.metadata
+import json
+import os
+import pickle
+
+import pandas as pd
+
+import figure_cache
+
+CACHE_DIR = os.path.join(figure_cache.CACHE_DIR, "models")
+SIZE_ENV = "AFIA_MODEL_CACHE_MB"
+MAX_MB = float(os.environ.get(SIZE_ENV, 64))
+ESTIMATORS = ("OLS", "PanelOLS", "RandomEffects")
+LIBRARIES = ("numpy", "pandas", "statsmodels", "linearmodels")
+
+
+class FittedModel:
+    """Résultats d'un ajustement, sous les noms de statsmodels et de linearmodels."""
+
+    def __init__(self, params, cov, std_errors, resid, fittedvalues):
+        self.params = params
+        self.cov = cov
+        self.std_errors = self.bse = std_errors
+        self.resid = resid
+        self.fittedvalues = fittedvalues
+
+
+def _versions():
+    versions = {}
+    for name in LIBRARIES:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def model_key(df, spec):
+    """Clé d'un ajustement : panel, spécification, versions des bibliothèques."""
+    h = hashlib.sha256()
+    h.update(json.dumps({"spec": spec, "versions": _versions(),
+                         "columns": [str(c) for c in df.columns],
+                         "dtypes": [str(t) for t in df.dtypes]}, sort_keys=True).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def fit(df, spec):
+    """Ajuste la spécification sur le panel df (format long) ; renvoie un FittedModel."""
+    import statsmodels.api as sm
+    from linearmodels.panel import PanelOLS, RandomEffects
+
+    dependent, exog = spec["dependent"], spec["exog"]
+    cov_options = {"cov_type": spec["cov_type"], **spec.get("cov_config", {})}
+    if spec["estimator"] == "OLS":
+        X = df[exog].copy()
+        if spec.get("constant"):
+            X = sm.add_constant(X)
+        res = sm.OLS(df[dependent], X).fit(**cov_options)
+        return FittedModel(res.params, res.cov_params(), res.bse, res.resid, res.fittedvalues)
+
+    panel = df.set_index(spec["index"])
+    X = panel[exog]
+    if spec.get("constant"):
+        X = sm.add_constant(X)
+    if spec["estimator"] == "PanelOLS":
+        model = PanelOLS(panel[dependent], X, entity_effects=spec.get("entity_effects", False),
+                         time_effects=spec.get("time_effects", False), check_rank=False)
+    else:
+        model = RandomEffects(panel[dependent], X, check_rank=False)
+    res = model.fit(**cov_options)
+    return FittedModel(res.params, res.cov, res.std_errors, res.resids, res.fitted_values)
+
+
+def fitted(df, estimator, dependent, exog, constant=False, index=("country", "year"),
+           cov_type="unadjusted", **options):
+    """Modèle ajusté, relu en cache si le panel et la spécification n'ont pas changé.
+
+    options : effets (entity_effects, time_effects) et réglages de la
+    covariance (cluster_entity…), passés à la bibliothèque.
+    """
+    if estimator not in ESTIMATORS:
+        raise ValueError(f"estimateur inconnu : {estimator} ({', '.join(ESTIMATORS)})")
+    effects = {k: options.pop(k) for k in ("entity_effects", "time_effects") if k in options}
+    spec = {"estimator": estimator, "dependent": dependent, "exog": list(exog),
+            "constant": constant, "index": list(index), "cov_type": cov_type,
+            "cov_config": options, **effects}
+    path = os.path.join(CACHE_DIR, f"{model_key(df, spec)}.pkl")
+    try:
+        with open(path, "rb") as f:
+            result = pickle.load(f)
+        os.utime(path)
+        return result
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+    result = fit(df, spec)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, path)
+    evict()
+    return result
+
+
+def evict(max_mb=None):
+    """Supprime les entrées les moins récemment lues au-delà de max_mb Mo."""
+    max_bytes = (MAX_MB if max_mb is None else max_mb) * 2**20
+    entries = []
+    for path in glob.glob(os.path.join(CACHE_DIR, "*.pkl")):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        removed += 1
+    return removed
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Monte Carlo : stabilité de β(ln CACI) de l'annexe
+=============================================================================
+ Usage  : python caci_montecarlo.py                      # 10 000 réplications
+          python caci_montecarlo.py -n 2000 --noise 0.02,0.05,0.1 -j 4
+          python caci_montecarlo.py --verify             # contre statsmodels / linearmodels
+          python caci_montecarlo.py -o mc.npz            # distributions complètes
+ Output : moyenne, écart-type et intervalle 95 % de β et de son SE par modèle
+=============================================================================
+ La Fig. A.3 montre β(ln CACI) estimé sur un seul tirage du panel (graine
+ 42) par MCO, effets fixes deux voies et effets aléatoires. Ce module
+ re-tire le panel calibré de l'annexe (caci_panel.simulate_panel, mêmes
+ paramètres) N fois, pour un ou plusieurs niveaux de bruit, et ré-estime
+ les trois modèles à chaque tirage :
+
+   ols : ln_PROD ~ 1 + ln_CACI + ln_GDP_pc + regulation_idx + export_control,
+         SE HC1 (sm.OLS(...).fit(cov_type='HC1')) ;
+   fe  : ln_PROD ~ ln_CACI + regulation_idx + export_control, effets pays et
+         année, SE groupés par pays (PanelOLS, entity_effects, time_effects) ;
+   re  : même équation avec constante, effets aléatoires pays, SE groupés
+         par pays (RandomEffects).
+
+ Les moindres carrés sont faits par lots : un lot de réplications est un
+ tableau (réplications, pays, années[, variables]) et chaque étape
+ (double centrage, équations normales, sandwich groupé, composantes de
+ variance de RE) est une opération NumPy sur tout le lot. Les formules
+ reprennent celles de statsmodels et linearmodels, degrés de liberté
+ compris ; --verify les compare au tirage publié.
+
+ Les lots sont répartis sur un pool de processus. Chaque lot a sa propre
+ graine (SeedSequence(seed).spawn) : le résultat dépend de la graine et de
+ la taille des lots, pas du nombre de processus.
+=============================================================================
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import caci_panel
+
+MODELS = {
+    "ols": "MCO, SE HC1",
+    "fe": "Effets fixes pays + année, SE groupés par pays",
+    "re": "Effets aléatoires pays, SE groupés par pays",
+}
+REGRESSORS = {
+    "ols": ["const", "ln_CACI", "ln_GDP_pc", "regulation_idx", "export_control"],
+    "fe": ["ln_CACI", "regulation_idx", "export_control"],
+    "re": ["const", "ln_CACI", "regulation_idx", "export_control"],
+}
+DEPENDENT = "ln_PROD"
+COEF = "ln_CACI"
+BATCH = 500
+
+
+# ─── Estimateurs par lots ───────────────────────────────────────────────────
+# y : (R, pays, années) ; X : (R, pays, années, K) ; R réplications.
+def design(panel, model):
+    """(y, X) d'un modèle ; panel : tableaux de simulate_panel(draws=R)."""
+    y = panel[DEPENDENT]
+    X = np.stack([np.ones_like(y) if name == "const" else panel[name]
+                  for name in REGRESSORS[model]], axis=-1)
+    return y, X
+
+
+def _normal_equations(y, X):
+    """β et (X'X)⁻¹ par réplication ; y (R, n), X (R, n, K)."""
+    xtx_inv = np.linalg.inv(np.einsum("rnk,rnl->rkl", X, X))
+    beta = np.einsum("rkl,rl->rk", xtx_inv, np.einsum("rnk,rn->rk", X, y))
+    return beta, xtx_inv
+
+
+def _fit(y, X):
+    """MCO empilé ; renvoie (β, (X'X)⁻¹, résidus) au format (R, pays, années)."""
+    R, C, T, K = X.shape
+    beta, xtx_inv = _normal_equations(y.reshape(R, C * T), X.reshape(R, C * T, K))
+    resid = y - np.einsum("rctk,rk->rct", X, beta)
+    return beta, xtx_inv, resid
+
+
+def _sandwich(xtx_inv, meat, scale):
+    cov = xtx_inv @ meat @ xtx_inv
+    return np.sqrt(np.diagonal(cov, axis1=1, axis2=2) * scale)
+
+
+def _clustered_se(X, resid, xtx_inv, scale):
+    """SE groupés par pays : scores sommés par pays, sandwich × scale."""
+    scores = np.einsum("rctk,rct->rck", X, resid)
+    return _sandwich(xtx_inv, np.einsum("rck,rcl->rkl", scores, scores), scale)
+
+
+def ols_hc1(y, X):
+    """MCO, SE HC1 (statsmodels) ; renvoie (β, SE), chacun (R, K)."""
+    R, C, T, K = X.shape
+    n = C * T
+    beta, xtx_inv, resid = _fit(y, X)
+    meat = np.einsum("rctk,rct,rctl->rkl", X, resid ** 2, X)
+    return beta, _sandwich(xtx_inv, meat, n / (n - K))
+
+
+def _demean_twoway(z):
+    """Centrage pays et année, exact sur un panel cylindré."""
+    return z - z.mean(axis=1, keepdims=True) - z.mean(axis=2, keepdims=True) \
+        + z.mean(axis=(1, 2), keepdims=True)
+
+
+def fe_twoway(y, X):
+    """Effets fixes pays et année, SE groupés par pays (PanelOLS).
+
+    Degrés de liberté de linearmodels : effets absorbés (pays + années - 1)
+    et régresseurs retranchés de n.
+    """
+    R, C, T, K = X.shape
+    n = C * T
+    X = _demean_twoway(X)
+    beta, xtx_inv, resid = _fit(_demean_twoway(y), X)
+    return beta, _clustered_se(X, resid, xtx_inv, n / (n - (C + T - 1) - K))
+
+
+def re_gls(y, X):
+    """Effets aléatoires pays (Swamy-Arora, RandomEffects), SE groupés par pays."""
+    R, C, T, K = X.shape
+    n = C * T
+    y_bar, X_bar = y.mean(axis=2), X.mean(axis=2)
+    # Variance idiosyncratique : régression intra-pays (moyenne générale rajoutée).
+    _, _, within = _fit(y - y_bar[..., None] + y.mean(axis=(1, 2))[:, None, None],
+                        X - X_bar[:, :, None] + X.mean(axis=(1, 2))[:, None, None])
+    sigma2_e = np.einsum("rct,rct->r", within, within) / (n - K - C + 1)
+    # Variance des effets : régression inter-pays sur les moyennes.
+    beta_b, _ = _normal_equations(y_bar, X_bar)
+    between = y_bar - np.einsum("rck,rk->rc", X_bar, beta_b)
+    sigma2_u = np.maximum(0, np.einsum("rc,rc->r", between, between) / (C - K) - sigma2_e / T)
+    theta = 1 - np.sqrt(sigma2_e / (T * sigma2_u + sigma2_e))
+    wy = y - theta[:, None, None] * y_bar[..., None]
+    wX = X - theta[:, None, None, None] * X_bar[:, :, None]
+    beta, xtx_inv, resid = _fit(wy, wX)
+    return beta, _clustered_se(wX, resid, xtx_inv, n / (n - K))
+
+
+ESTIMATORS = {"ols": ols_hc1, "fe": fe_twoway, "re": re_gls}
+
+
+def estimate(panel):
+    """{modèle: (β, SE) de ln_CACI}, tableaux (R,), pour un panel de R tirages."""
+    out = {}
+    for model, estimator in ESTIMATORS.items():
+        beta, se = estimator(*design(panel, model))
+        i = REGRESSORS[model].index(COEF)
+        out[model] = (beta[:, i], se[:, i])
+    return out
+
+
+# ─── Réplications ───────────────────────────────────────────────────────────
+def replicate(calibration, size, seed_seq, noise=0.05):
+    """Un lot de size réplications ; renvoie estimate()."""
+    rng = np.random.default_rng(seed_seq)
+    panel = caci_panel.simulate_panel(**calibration, rng=rng, draws=size, noise=noise)
+    return estimate(panel)
+
+
+def run(calibration, replications=10_000, noise=0.05, seed=0, workers=None, batch=BATCH):
+    """Distribution de β(ln CACI) et de son SE : {modèle: (β, SE)}, tableaux (N,)."""
+    sizes = [min(batch, replications - start) for start in range(0, replications, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(calibration, size, seq, noise) for size, seq in zip(sizes, seeds)]
+    workers = min(workers or os.cpu_count() or 1, len(args))
+    if workers == 1:
+        parts = [replicate(*a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(replicate, *zip(*args)))
+    return {model: tuple(np.concatenate([part[model][j] for part in parts]) for j in (0, 1))
+            for model in ESTIMATORS}
+
+
+def summarize(results, reference=None):
+    """Lignes de résumé ; reference : {modèle: β du tirage publié}."""
+    lines = [f"  {'modèle':<6} {'β moyen':>9} {'σ(β)':>8} {'IC 95 %':>21} "
+             f"{'SE moyen':>9} {'SE/σ(β)':>8}" + ("  rang publié" if reference else "")]
+    for model, (beta, se) in results.items():
+        low, high = np.percentile(beta, [2.5, 97.5])
+        line = (f"  {model:<6} {beta.mean():>9.4f} {beta.std(ddof=1):>8.4f} "
+                f"[{low:>8.4f} ; {high:>8.4f}] {se.mean():>9.4f} "
+                f"{se.mean() / beta.std(ddof=1):>8.2f}")
+        if reference:
+            line += f"  {np.mean(beta < reference[model]) * 100:>6.1f} %"
+        lines.append(line)
+    return lines
+
+
+def verify(annex):
+    """Écarts max entre estimate() et les modèles de l'annexe (tirage publié)."""
+    panel = caci_panel.simulate_panel(**annex.calibration, rng=np.random.RandomState(42))
+    ours = estimate({k: v[None] for k, v in panel.items()})
+    reference = {
+        "ols": (annex.ols_model.params[COEF], annex.ols_model.bse[COEF]),
+        "fe": (annex.fe_model.params[COEF], annex.fe_model.std_errors[COEF]),
+        "re": (annex.re_model.params[COEF], annex.re_model.std_errors[COEF]),
+    }
+    return {model: (abs(ours[model][0][0] - ref[0]), abs(ours[model][1][0] - ref[1]))
+            for model, ref in reference.items()}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo de β(ln CACI) sur le panel de l'annexe.")
+    parser.add_argument("-n", "--replications", type=int, default=10_000,
+                        help="nombre de réplications par niveau de bruit (défaut : 10 000)")
+    parser.add_argument("--noise", default="0.05",
+                        help="amplitude(s) du bruit sur F, E et PROD, séparées par des "
+                             "virgules (défaut : 0.05, celle du panel publié)")
+    parser.add_argument("--seed", type=int, default=0, help="graine racine (défaut : 0)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--batch", type=int, default=BATCH,
+                        help=f"réplications par lot (défaut : {BATCH})")
+    parser.add_argument("-o", "--output", default="",
+                        help="fichier .npz des distributions complètes")
+    parser.add_argument("--verify", action="store_true",
+                        help="compare les estimateurs par lots à statsmodels / linearmodels "
+                             "sur le tirage publié")
+    args = parser.parse_args(argv)
+    try:
+        args.noise = [float(x) for x in args.noise.split(",") if x.strip()]
+    except ValueError:
+        parser.error(f"niveau de bruit invalide : {args.noise}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    import build_figures
+    annex = build_figures.load_chapter("annexe")
+    reference = {"ols": annex.ols_model.params[COEF], "fe": annex.fe_model.params[COEF],
+                 "re": annex.re_model.params[COEF]}
+    if args.verify:
+        print(" Tirage publié (graine 42), écart absolu à statsmodels / linearmodels :")
+        worst = 0.0
+        for model, (d_beta, d_se) in verify(annex).items():
+            print(f"  {model:<6} β {d_beta:.2e}   SE {d_se:.2e}")
+            worst = max(worst, d_beta, d_se)
+        return 0 if worst < 1e-8 else 1
+
+    saved = {"noise": np.array(args.noise)}
+    for noise in args.noise:
+        t0 = time.perf_counter()
+        results = run(annex.calibration, args.replications, noise, args.seed, args.jobs, args.batch)
+        print(f"\n Bruit ±{noise:g} — {args.replications} réplications en "
+              f"{time.perf_counter() - t0:.1f} s")
+        for line in summarize(results, reference):
+            print(line)
+        for model, (beta, se) in results.items():
+            saved.setdefault(f"{model}_beta", []).append(beta)
+            saved.setdefault(f"{model}_se", []).append(se)
+    print("\n " + " ; ".join(f"{model} : {label}" for model, label in MODELS.items()))
+    if args.output:
+        np.savez_compressed(args.output, **{k: np.asarray(v) for k, v in saved.items()})
+        print(f" Distributions : {args.output} (tableaux niveau de bruit × réplication)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
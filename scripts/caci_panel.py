@@ -0,0 +1,127 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Panel CACI simulé (pays × années), vectorisé
+=============================================================================
+ Reconstruit le panel de l'annexe économétrique à partir des niveaux de
+ l'année de référence et des taux de croissance par pays :
+
+   F, E, PIB, PROD : niveau de référence actualisé par (1 + g) ** (réf - an) ;
+   L               : niveau de référence × (1 - 0,05 × (réf - an)) ;
+   bruit           : F, E et PROD multipliés par 1 + U(-0,05 ; 0,05)
+                     (amplitude réglable : noise) ;
+   R&D = PIB × U(0,015 ; 0,035), internet = min(98, 60 + U(15 ; 38)),
+   régulation = U(0 ; 1), contrôle à l'export par pays à partir d'une année.
+
+ simulate_panel() calcule tous les pays × années (× tirages) en tableaux
+ NumPy, sans boucle par observation : une centaine de pays sur plusieurs
+ décennies et des milliers de tirages restent de l'ordre de la seconde.
+ panel_frame() met le résultat au format long de l'annexe (une ligne par
+ pays-année, colonnes COLUMNS).
+
+ Aléa : rng est un np.random.Generator (défaut : default_rng(seed)). Les
+ six tirages uniformes d'une observation sont pris dans l'ordre de
+ l'ancienne boucle ligne à ligne (UNIFORMS) ; un np.random.RandomState(42)
+ redonne donc exactement le panel publié, tiré par np.random.seed(42).
+=============================================================================
+"""
+
+import numpy as np
+import pandas as pd
+
+# Variables de base_data, dans l'ordre de ses colonnes.
+BASE_VARS = ("F_petaflops", "E_cost_mwh", "GDP_T_usd", "L_ai_thousands", "PROD_ai_pct")
+
+# Tirages uniformes (bornes) de chaque observation, dans l'ordre de tirage.
+UNIFORMS = np.array([
+    (-0.05, 0.05),    # bruit sur F
+    (-0.05, 0.05),    # bruit sur E
+    (-0.05, 0.05),    # bruit sur PROD
+    (0.015, 0.035),   # part de la R&D dans le PIB
+    (15.0, 38.0),     # internet, au-delà de 60 %
+    (0.0, 1.0),       # indice de régulation
+])
+
+COLUMNS = ["F_petaflops", "E_cost_mwh", "GDP_T_usd", "L_ai_thousands", "CACI",
+           "PROD_ai_pct", "RD_T_usd", "internet_pct", "regulation_idx", "export_control",
+           "ln_CACI", "ln_PROD", "ln_F", "ln_GDP_pc"]
+
+
+def _discount(rates, countries, t):
+    """(1 + taux) ** t, tableau (pays, années) ; rates : {pays: taux} ou commun.
+
+    Table déterministe de taille pays × années seulement, calculée avec la
+    puissance flottante de Python : np.power diffère parfois au dernier bit,
+    ce qui suffirait à changer le panel publié.
+    """
+    if np.isscalar(rates):
+        rates = dict.fromkeys(countries, rates)
+    return np.array([[(1 + rates[c]) ** int(ti) for ti in t] for c in countries])
+
+
+def simulate_panel(countries, years, base_data, compute_growth, energy_growth,
+                   gdp_growth, prod_growth, export_controls=None, base_year=None,
+                   rng=None, seed=None, draws=None, noise=0.05):
+    """Variables du panel en tableaux {nom: array}.
+
+    base_data : {pays: [F, E, PIB, L, PROD]} à l'année base_year (défaut :
+    la dernière de years) ; *_growth : {pays: taux} ou taux commun ;
+    export_controls : {pays: (à partir de l'année, niveau)} ; noise :
+    amplitude du bruit multiplicatif sur F, E et PROD. Forme des tableaux :
+    (pays, années), ou (draws, pays, années) si draws est donné.
+    """
+    countries = list(countries)
+    years = np.asarray(years)
+    base_year = years.max() if base_year is None else base_year
+    rng = np.random.default_rng(seed) if rng is None else rng
+    shape = (len(countries), len(years)) if draws is None else (draws, len(countries), len(years))
+
+    base = np.array([base_data[c] for c in countries], dtype=float)
+    F_ref, E_ref, GDP_ref, L_ref, PROD_ref = (base[:, [i]] for i in range(len(BASE_VARS)))
+    t = base_year - years
+    F = F_ref / _discount(compute_growth, countries, t)
+    E = E_ref / _discount(energy_growth, countries, t)
+    GDP = GDP_ref / _discount(gdp_growth, countries, t)
+    L = L_ref * (1 - 0.05 * t)
+    PROD = PROD_ref / _discount(prod_growth, countries, t)
+
+    bounds = UNIFORMS.copy()
+    bounds[:3] = (-noise, noise)
+    low, high = bounds[:, 0], bounds[:, 1]
+    u = low + (high - low) * rng.random(shape + (len(UNIFORMS),))
+    F = F * (1 + u[..., 0])
+    E = E * (1 + u[..., 1])
+    PROD = PROD * (1 + u[..., 2])
+    GDP = np.broadcast_to(GDP, shape)
+    L = np.broadcast_to(L, shape)
+    CACI = (F / E) / (GDP * 1e6 * L)
+
+    export_control = np.zeros((len(countries), len(years)))
+    for country, (since, level) in (export_controls or {}).items():
+        if country in countries:
+            export_control[countries.index(country), years >= since] = level
+
+    return {
+        "F_petaflops": F, "E_cost_mwh": E, "GDP_T_usd": GDP, "L_ai_thousands": L,
+        "CACI": CACI, "PROD_ai_pct": PROD, "RD_T_usd": GDP * u[..., 3],
+        "internet_pct": np.minimum(98, 60 + u[..., 4]), "regulation_idx": u[..., 5],
+        "export_control": np.broadcast_to(export_control, shape),
+        "ln_CACI": np.log(CACI + 1e-10), "ln_PROD": np.log(PROD + 0.01),
+        "ln_F": np.log(F), "ln_GDP_pc": np.log(GDP * 1e12 / (L * 1000 * 50)),
+    }
+
+
+def panel_frame(panel, countries, years):
+    """Format long de l'annexe : une ligne par (tirage,) pays, année.
+
+    Colonnes country, year puis COLUMNS ; draw en tête si le panel a une
+    dimension de tirages.
+    """
+    shape = panel["CACI"].shape
+    n_obs = int(np.prod(shape))
+    index = {"country": np.repeat(np.asarray(countries, dtype=object), len(years)),
+             "year": np.tile(np.asarray(years), len(countries))}
+    if len(shape) == 3:
+        per_draw = len(countries) * len(years)
+        index = {"draw": np.repeat(np.arange(shape[0]), per_draw),
+                 **{k: np.tile(v, shape[0]) for k, v in index.items()}}
+    return pd.DataFrame({**index, **{k: np.reshape(panel[k], n_obs) for k in COLUMNS}})
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Courbe de spécification de β(ln CACI) (multivers)
+=============================================================================
+ Usage  : python caci_specs.py               # résumé de toutes les spécifications
+          python caci_specs.py --verify      # contre statsmodels / linearmodels
+          python caci_specs.py -o specs.csv  # une ligne par spécification
+ Output : nombre de spécifications, temps, distribution de β et part significative
+=============================================================================
+ L'annexe retient une spécification MCO (ln_CACI, ln_GDP_pc,
+ regulation_idx, export_control). Ce module ré-estime β(ln CACI) sur tout
+ le multivers des choix raisonnables :
+
+   contrôles     : chaque sous-ensemble de CONTROLS (2⁶ = 64) ;
+   estimateur    : MCO avec constante (SE HC1), effets fixes pays, effets
+                   fixes pays + année (SE groupés par pays, degrés de
+                   liberté de linearmodels) ;
+   échantillon   : panel complet, sans la première année, sans un pays
+                   (chaque pays à tour de rôle).
+
+ Les moindres carrés sont partagés : pour un estimateur et un échantillon,
+ la matrice complète W = [ln_CACI, contrôles(, constante)] est centrée une
+ fois (caci_fe.within) et factorisée une fois, W = QR. La régression sur
+ un sous-ensemble S de colonnes ne dépend plus que de R[:, S] et de Q'y
+ (k × k au lieu de n × k) : les colonnes exclues sont remplacées par des
+ vecteurs unités hors de l'espace de R, et les 64 petits systèmes sont
+ re-factorisés en un seul np.linalg.qr empilé. Résidus et sandwichs sont
+ ensuite calculés pour tout le lot. Une spécification dont le R réduit est
+ numériquement singulier (contrôle absorbé par les effets) reçoit NaN.
+
+ --verify ré-estime un échantillon de spécifications avec statsmodels et
+ linearmodels et affiche l'écart maximal.
+=============================================================================
+"""
+
+import argparse
+import itertools
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import caci_fe
+
+DEPENDENT = "ln_PROD"
+COEF = "ln_CACI"
+CONTROLS = ("ln_GDP_pc", "regulation_idx", "export_control", "RD_T_usd", "internet_pct", "ln_F")
+# Effets absorbés et type de SE de chaque estimateur.
+ESTIMATORS = {
+    "ols": {"effects": (), "cov": "HC1"},
+    "fe_entity": {"effects": ("entity",), "cov": "clustered"},
+    "fe": {"effects": ("entity", "time"), "cov": "clustered"},
+}
+LABELS = {
+    "ols": "MCO, SE HC1",
+    "fe_entity": "Effets fixes pays, SE groupés par pays",
+    "fe": "Effets fixes pays + année, SE groupés par pays",
+}
+# Seuil de rang : |diag(R)| relatif sous lequel une spécification est écartée.
+RANK_TOL = 1e-10
+
+
+def subsets(controls=CONTROLS):
+    """Masques (2^m, m) de tous les sous-ensembles de contrôles, du vide au complet."""
+    return np.array(list(itertools.product((False, True), repeat=len(controls))))[:, ::-1]
+
+
+def samples(df):
+    """Échantillons {(type, valeur): masque de lignes} : tout, sans la 1re année, sans un pays."""
+    out = {("all", None): np.ones(len(df), dtype=bool)}
+    years = sorted(df["year"].unique())
+    out[("from", years[1])] = (df["year"] >= years[1]).to_numpy()
+    for country in df["country"].unique():
+        out[("drop", country)] = (df["country"] != country).to_numpy()
+    return out
+
+
+def fit_subsets(y, W, masks, cov="HC1", clusters=None, n_effects=0):
+    """MCO de y sur chaque sous-ensemble de colonnes de W ; renvoie (β, SE), (S, k).
+
+    y : (n,), W : (n, k), masks : (S, k) booléens (colonnes retenues) ;
+    cov : "HC1" ou "clustered" (clusters : codes 0..G-1, n_effects : effets
+    absorbés retranchés des degrés de liberté). Coefficients des colonnes
+    exclues : 0 ; spécifications singulières : NaN.
+    """
+    n, k = W.shape
+    S = len(masks)
+    Q, R = np.linalg.qr(W)
+    # Systèmes réduits (2k, k) : R[:, S] en haut, vecteur unité en bas pour
+    # chaque colonne exclue (orthogonal à tout le reste, second membre nul).
+    excluded = ~masks
+    R_ext = np.zeros((S, 2 * k, k))
+    R_ext[:, :k] = R * masks[:, None, :]
+    R_ext[:, k:] = np.eye(k) * excluded[:, None, :]
+    b = np.zeros((S, 2 * k))
+    b[:, :k] = Q.T @ y
+    Q2, R2 = np.linalg.qr(R_ext)
+    diag = np.abs(np.diagonal(R2, axis1=1, axis2=2))
+    ok = diag.min(axis=1) > RANK_TOL * np.abs(np.diagonal(R)).max()
+    R2[~ok] = np.eye(k)
+    R2_inv = np.linalg.inv(R2)
+    beta = np.einsum("skl,sml,sm->sk", R2_inv, Q2, b) * masks
+    # (W_S'W_S)⁻¹, bordée d'identité sur les colonnes exclues.
+    xtx_inv = R2_inv @ np.swapaxes(R2_inv, 1, 2)
+
+    resid = y - beta @ W.T
+    K = masks.sum(axis=1)
+    if cov == "HC1":
+        meat = np.einsum("sn,nk,nl->skl", resid ** 2, W, W)
+        scale = n / (n - K)
+    else:
+        onehot = np.zeros((clusters.max() + 1, n))
+        onehot[clusters, np.arange(n)] = 1
+        scores = np.einsum("gn,sn,nk->sgk", onehot, resid, W)
+        meat = np.einsum("sgk,sgl->skl", scores, scores)
+        scale = n / (n - n_effects - K)
+    meat *= masks[:, :, None] & masks[:, None, :]
+    var = np.diagonal(xtx_inv @ meat @ xtx_inv, axis1=1, axis2=2) * scale[:, None]
+    se = np.sqrt(np.maximum(var, 0)) * masks
+    beta[~ok] = np.nan
+    se[~ok] = np.nan
+    return beta, se
+
+
+def run(df, controls=CONTROLS, estimators=ESTIMATORS):
+    """Toutes les spécifications ; une ligne par spécification.
+
+    Colonnes : estimator, sample, dropped (pays retiré ou None), from_year,
+    un booléen par contrôle, n_controls, nobs, beta, se.
+    """
+    masks = subsets(controls)
+    frames = []
+    for (kind, value), rows in samples(df).items():
+        sub = df[rows]
+        groups = caci_fe.Groups(sub["country"].to_numpy(), sub["year"].to_numpy())
+        Z = sub[[DEPENDENT, COEF, *controls]].to_numpy(dtype=float)
+        for name, spec in estimators.items():
+            effects = spec["effects"]
+            if effects:
+                Z_w = caci_fe.within(Z, groups, effects=effects)
+                cols = np.ones((len(masks), 1), dtype=bool), masks
+                # Effets absorbés comptés comme linearmodels (sans constante) ;
+                # un effet pays seul, emboîté dans les grappes pays, ne compte pas.
+                n_effects = (0 if effects == ("entity",) else
+                             sum(len(getattr(groups, e)) for e in effects) - (len(effects) - 1))
+            else:
+                Z_w = np.column_stack([Z, np.ones(len(Z))])
+                cols = np.ones((len(masks), 1), dtype=bool), masks, np.ones((len(masks), 1), dtype=bool)
+                n_effects = 0
+            beta, se = fit_subsets(Z_w[:, 0], Z_w[:, 1:], np.hstack(cols), spec["cov"],
+                                   groups.entity.codes, n_effects)
+            frame = pd.DataFrame(masks, columns=list(controls))
+            frame.insert(0, "estimator", name)
+            frame.insert(1, "sample", kind)
+            frame.insert(2, "dropped", value if kind == "drop" else None)
+            frame.insert(3, "from_year", value if kind == "from" else None)
+            frame["n_controls"] = masks.sum(axis=1)
+            frame["nobs"] = len(sub)
+            frame["beta"] = beta[:, 0]
+            frame["se"] = se[:, 0]
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def curve(specs, z=1.96):
+    """Spécifications estimables triées par β, avec bornes de l'IC et significativité."""
+    out = specs.dropna(subset=["beta"]).sort_values("beta", kind="stable").reset_index(drop=True)
+    out["low"] = out["beta"] - z * out["se"]
+    out["high"] = out["beta"] + z * out["se"]
+    out["significant"] = (out["low"] > 0) | (out["high"] < 0)
+    return out
+
+
+# ─── Vérification ───────────────────────────────────────────────────────────
+def _reference_fit(sub, estimator, controls):
+    """(β, SE) de ln_CACI par statsmodels / linearmodels.
+
+    PanelOLS garde ici son contrôle de rang : avec check_rank=False, il
+    prend sur certains sous-échantillons une combinaison de régresseurs pour
+    une constante et ne retire pas les mêmes effets.
+    """
+    import statsmodels.api as sm
+    from linearmodels.panel import PanelOLS
+    exog = [COEF, *controls]
+    if estimator == "ols":
+        res = sm.OLS(sub[DEPENDENT], sm.add_constant(sub[exog])).fit(cov_type="HC1")
+        return res.params[COEF], res.bse[COEF]
+    panel = sub.set_index(["country", "year"])
+    res = PanelOLS(panel[DEPENDENT], panel[exog], entity_effects=True,
+                   time_effects=estimator == "fe").fit(cov_type="clustered", cluster_entity=True)
+    return res.params[COEF], res.std_errors[COEF]
+
+
+def verify(df, specs, count=60, seed=0):
+    """Écarts absolus max (β, SE) à statsmodels / linearmodels sur count spécifications tirées au hasard."""
+    rows = samples(df)
+    picked = specs.dropna(subset=["beta"]).sample(count, random_state=seed)
+    worst_beta = worst_se = 0.0
+    for _, spec in picked.iterrows():
+        value = spec["dropped"] if spec["sample"] == "drop" else spec["from_year"]
+        sub = df[rows[(spec["sample"], value)]]
+        controls = [c for c in CONTROLS if spec[c]]
+        beta, se = _reference_fit(sub, spec["estimator"], controls)
+        worst_beta = max(worst_beta, abs(beta - spec["beta"]))
+        worst_se = max(worst_se, abs(se - spec["se"]))
+    return worst_beta, worst_se
+
+
+def summarize(specs):
+    """Lignes de résumé par estimateur : β médian, étendue, part significative, part > 0."""
+    ranked = curve(specs)
+    lines = [f"  {'estimateur':<10} {'spéc.':>6} {'β médian':>9} {'min':>8} {'max':>8} "
+             f"{'β > 0':>7} {'IC 95 % ∌ 0':>12}"]
+    for name, sub in [*ranked.groupby("estimator", sort=False), ("tous", ranked)]:
+        lines.append(f"  {name:<10} {len(sub):>6} {sub['beta'].median():>9.4f} "
+                     f"{sub['beta'].min():>8.4f} {sub['beta'].max():>8.4f} "
+                     f"{(sub['beta'] > 0).mean() * 100:>6.1f}% "
+                     f"{sub['significant'].mean() * 100:>11.1f}%")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Courbe de spécification de β(ln CACI).")
+    parser.add_argument("--verify", action="store_true",
+                        help="compare un échantillon de spécifications à statsmodels / "
+                             "linearmodels")
+    parser.add_argument("-o", "--output", default="", help="fichier CSV des spécifications")
+    args = parser.parse_args(argv)
+
+    import build_figures
+    annex = build_figures.load_chapter("annexe")
+    t0 = time.perf_counter()
+    specs = run(annex.df)
+    elapsed = time.perf_counter() - t0
+    dropped = specs["beta"].isna().sum()
+    print(f" {len(specs)} spécifications en {elapsed:.2f} s"
+          + (f" ({dropped} non estimables)" if dropped else ""))
+    for line in summarize(specs):
+        print(line)
+    print("\n " + " ; ".join(f"{name} : {label}" for name, label in LABELS.items()))
+    if args.output:
+        specs.to_csv(args.output, index=False)
+        print(f" Spécifications : {args.output}")
+    if args.verify:
+        d_beta, d_se = verify(annex.df, specs)
+        print(f"\n Écart absolu max à statsmodels / linearmodels : β {d_beta:.2e}   SE {d_se:.2e}")
+        return 0 if max(d_beta, d_se) < 1e-8 else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Vérification des catalogues de traduction
+=============================================================================
+ Usage  : python check_langs.py                 # tous les chapitres
+          python check_langs.py -c 5 -l pt      # un chapitre, une langue
+ Output : liste des clés manquantes ou incohérentes ; code de sortie 1
+=============================================================================
+ Vérification statique, sans importer les scripts ni rien rendre : le
+ source de chaque générateur est analysé (ast) pour relever les clés
+ L["..."] lues par chaque fonction figN_* et par les fonctions du module
+ qu'elle appelle, puis chaque catalogue locales/<chapitre>/<langue>.json
+ est confronté à ces clés :
+
+   manquante : clé lue par une figure, absente du catalogue ;
+   type      : valeur d'un autre type que dans la langue de référence ;
+   longueur  : liste (ou liste imbriquée) d'une autre longueur que dans la
+               langue de référence (fig2_scenarios, f2_events…).
+
+ La langue de référence est la première des catalogues (LANG_ORDER, donc
+ fr). build_figures.py lance cette vérification avant tout rendu.
+=============================================================================
+"""
+
+import argparse
+import ast
+import os
+import re
+import sys
+import time
+
+import afia_style
+
+FIG_FUNC_RE = re.compile(r"^fig(\d+)_\w+$")
+
+
+def _called_names(node):
+    return {n.func.id for n in ast.walk(node)
+            if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)}
+
+
+def _lang_keys(node):
+    """{clé: ligne} des L["..."] à clé constante sous node."""
+    keys = {}
+    for n in ast.walk(node):
+        if (isinstance(n, ast.Subscript) and isinstance(n.value, ast.Name)
+                and n.value.id == "L" and isinstance(n.slice, ast.Constant)
+                and isinstance(n.slice.value, str)):
+            keys.setdefault(n.slice.value, n.lineno)
+    return keys
+
+
+def used_keys(script_path):
+    """{figN_*: {clé: ligne}} des clés lues par chaque figure du script."""
+    with open(script_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), script_path)
+    functions = {node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)}
+    figures = sorted((int(m.group(1)), name) for name in functions
+                     if (m := FIG_FUNC_RE.match(name)))
+    used = {}
+    for _, name in figures:
+        keys, seen, stack = {}, set(), [name]
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in functions:
+                continue
+            seen.add(current)
+            for key, line in _lang_keys(functions[current]).items():
+                keys.setdefault(key, line)
+            stack.extend(_called_names(functions[current]))
+        used[name] = keys
+    return used
+
+
+def shape_mismatch(value, ref, key):
+    """Première différence de type ou de longueur entre value et ref, ou None."""
+    if isinstance(ref, (int, float)) and not isinstance(ref, bool):
+        expected = (int, float)
+    else:
+        expected = type(ref)
+    if not isinstance(value, expected):
+        return f"type       {key} : {type(value).__name__} au lieu de {type(ref).__name__}"
+    if isinstance(ref, list):
+        if len(value) != len(ref):
+            return f"longueur   {key} : {len(value)} éléments au lieu de {len(ref)}"
+        for i, (item, ref_item) in enumerate(zip(value, ref)):
+            problem = shape_mismatch(item, ref_item, f"{key}[{i}]")
+            if problem:
+                return problem
+    elif isinstance(ref, dict):
+        for sub in ref:
+            if sub not in value:
+                return f"manquante  {key}[{sub!r}]"
+            problem = shape_mismatch(value[sub], ref[sub], f"{key}[{sub!r}]")
+            if problem:
+                return problem
+    return None
+
+
+def check_chapter(script_path, fn_filter=None):
+    """Problèmes relevés pour un script ; liste de lignes de rapport."""
+    used = used_keys(script_path)
+    if fn_filter is not None:
+        used = {fn: keys for fn, keys in used.items() if fn_filter.search(fn)}
+    catalogs = afia_style.load_catalogs(script_path)
+    langs = list(catalogs)
+    ref_lang = next(iter(catalogs.available()), None)
+    if ref_lang is None:
+        return [f"{afia_style.catalog_dir(script_path)} : aucun catalogue"]
+    ref = catalogs[ref_lang]
+    script = os.path.basename(script_path)
+    problems = []
+    for lang in langs:
+        L = catalogs[lang]
+        for fn_name, keys in used.items():
+            for key, line in sorted(keys.items(), key=lambda kv: kv[1]):
+                if key not in L:
+                    problems.append(f"[{lang}] manquante  {key}  ({script}:{line}, {fn_name})")
+                elif lang != ref_lang and key in ref:
+                    problem = shape_mismatch(L[key], ref[key], key)
+                    if problem:
+                        problems.append(f"[{lang}] {problem}  (référence {ref_lang}, {fn_name})")
+    return list(dict.fromkeys(problems))
+
+
+def check(chapters, fn_filter=None):
+    """{chapitre: problèmes} pour les chapitres donnés ({chapitre: script})."""
+    return {chapter: check_chapter(path, fn_filter) for chapter, path in chapters.items()}
+
+
+def report(problems):
+    """Lignes de rapport ; vide si aucun problème."""
+    lines = []
+    for chapter, chapter_problems in problems.items():
+        if chapter_problems:
+            lines.append(f"  ✗ chapitre {chapter}")
+            lines.extend(f"      {p}" for p in chapter_problems)
+    return lines
+
+
+def parse_args(argv=None):
+    import build_figures
+    parser = argparse.ArgumentParser(description="Vérifie les catalogues de traduction des figures.")
+    parser.add_argument("-c", "--chapters", default=",".join(build_figures.CHAPTERS),
+                        help="chapitres à vérifier, séparés par des virgules")
+    parser.add_argument("-l", "--lang", default="",
+                        help="langues à vérifier, séparées par des virgules (défaut : toutes)")
+    parser.add_argument("-k", "--filter", default="",
+                        help="expression régulière sur le nom de la fonction figN_*")
+    args = parser.parse_args(argv)
+    args.chapters = [c.strip() for c in args.chapters.split(",") if c.strip()]
+    args.lang = [lang.strip() for lang in args.lang.split(",") if lang.strip()]
+    unknown = [c for c in args.chapters if c not in build_figures.CHAPTERS]
+    if unknown:
+        parser.error(f"chapitre(s) inconnu(s) : {', '.join(unknown)}")
+    args.chapters = {c: build_figures.CHAPTERS[c] for c in args.chapters}
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    afia_style.select_langs(args.lang)
+    t0 = time.perf_counter()
+    problems = check(args.chapters, re.compile(args.filter))
+    elapsed = time.perf_counter() - t0
+    for line in report(problems):
+        print(line)
+    count = sum(len(p) for p in problems.values())
+    print(f"\n {len(problems)} chapitre(s) vérifié(s) en {elapsed * 1000:.0f} ms — "
+          f"{count} problème(s)")
+    return 1 if count else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Cache incrémental des figures
+=============================================================================
+ Chaque job (chapitre, figN_*, langue) reçoit une clé SHA-256 calculée sur :
+   - le source de la fonction et des fonctions du module qu'elle appelle
+     (save_fig, helpers…) ;
+   - les entrées du dictionnaire de langue L lues par la fonction
+     (L["..."] littéraux ; tout L si l'accès n'est pas analysable) ;
+   - les rcParams actifs après setup_style(), le source d'afia_style
+     (save_fig, savers) et les réglages de sortie (DPI, formats actifs,
+     compression et palette PNG) ;
+   - les données du module (constantes, tableaux, DataFrames), hors LANGS.
+ Une figure dont la clé n'a pas changé et dont le fichier existe encore
+ dans le répertoire de sortie courant (AFIA_OUTPUT_DIR) n'est pas
+ re-rendue. Le manifeste garde une entrée par répertoire de sortie :
+ alterner figures/ et docs/figures (--publish) n'invalide ni l'un ni
+ l'autre.
+=============================================================================
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import textwrap
+import types
+
+import matplotlib
+import numpy as np
+
+import afia_style
+import png_encode
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(ROOT_DIR, ".build_cache")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "figures.json")
+# Les rendus brouillons ont leur propre manifeste : alterner --draft et un
+# build normal ne ré-invalide pas l'autre.
+DRAFT_MANIFEST_PATH = os.path.join(CACHE_DIR, "figures_draft.json")
+
+# Globals de module ignorés dans l'empreinte des données : les traductions
+# sont hachées langue par langue via L.
+EXCLUDED_GLOBALS = {"LANGS"}
+
+
+def _feed(h, obj):
+    """Alimente le hash avec une représentation stable de obj."""
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        h.update(repr(obj).encode())
+    elif isinstance(obj, dict):
+        h.update(b"{")
+        for k in sorted(obj, key=repr):
+            _feed(h, k)
+            _feed(h, obj[k])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        h.update(type(obj).__name__.encode() + b"[")
+        for item in (sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj):
+            _feed(h, item)
+        h.update(b"]")
+    elif isinstance(obj, np.ndarray):
+        h.update(f"ndarray{obj.dtype}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif hasattr(obj, "to_numpy") and hasattr(obj, "index"):
+        # pandas DataFrame / Series
+        import pandas as pd
+        h.update(type(obj).__name__.encode())
+        _feed(h, [str(c) for c in getattr(obj, "columns", [])])
+        h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    else:
+        h.update(repr(obj).encode())
+
+
+def _is_data(obj):
+    """Vrai pour les valeurs de module qui constituent des données d'entrée."""
+    if isinstance(obj, (str, int, float, bool, dict, list, tuple, set, frozenset,
+                        np.ndarray, np.generic)):
+        return True
+    return hasattr(obj, "to_numpy") and hasattr(obj, "index")
+
+
+def _code_names(code):
+    """Noms globaux référencés par un objet code et ses code imbriqués."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def function_sources(mod, fn_name):
+    """Sources de fn_name et des fonctions du même module qu'elle appelle."""
+    seen, stack, sources = set(), [fn_name], []
+    while stack:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        obj = getattr(mod, name, None)
+        if not isinstance(obj, types.FunctionType) or obj.__module__ != mod.__name__:
+            continue
+        sources.append((name, inspect.getsource(obj)))
+        stack.extend(sorted(_code_names(obj.__code__)))
+    return sorted(sources)
+
+
+def used_lang_keys(mod, fn_name):
+    """Clés L["..."] lues par la fonction ; None si L est utilisé autrement."""
+    keys = set()
+    for _, src in function_sources(mod, fn_name):
+        tree = ast.parse(textwrap.dedent(src))
+        parents = {child: node for node in ast.walk(tree) for child in ast.iter_child_nodes(node)}
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Name) and node.id == "L"):
+                continue
+            parent = parents.get(node)
+            if (isinstance(parent, ast.Subscript) and parent.value is node
+                    and isinstance(parent.slice, ast.Constant)
+                    and isinstance(parent.slice.value, str)):
+                keys.add(parent.slice.value)
+            else:
+                return None
+    return keys
+
+
+def module_data_digest(mod):
+    """Empreinte des données de module (hors fonctions, modules et LANGS)."""
+    cached = getattr(mod, "_figure_cache_data_digest", None)
+    if cached is not None:
+        return cached
+    h = hashlib.sha256()
+    for name in sorted(vars(mod)):
+        if name.startswith("_") or name in EXCLUDED_GLOBALS:
+            continue
+        obj = getattr(mod, name)
+        if _is_data(obj):
+            _feed(h, name)
+            _feed(h, obj)
+    digest = h.hexdigest()
+    mod._figure_cache_data_digest = digest
+    return digest
+
+
+def style_digest():
+    """Empreinte du module de style partagé et de sa feuille afia.mplstyle."""
+    h = hashlib.sha256()
+    for path in (afia_style.__file__, afia_style.STYLE_PATH):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _spec_key(mod, fn_name, L, rc_params, settings):
+    h = hashlib.sha256()
+    _feed(h, matplotlib.__version__)
+    _feed(h, function_sources(mod, fn_name))
+    keys = used_lang_keys(mod, fn_name)
+    _feed(h, L if keys is None else {k: L.get(k) for k in keys})
+    _feed(h, {k: str(v) for k, v in rc_params.items()})
+    _feed(h, settings)
+    h.update(style_digest().encode())
+    h.update(module_data_digest(mod).encode())
+    return h.hexdigest()
+
+
+def job_key(mod, fn_name, L, rc_params):
+    """Clé de cache d'un job : hash du code, de L, du style et des données."""
+    return _spec_key(mod, fn_name, L, rc_params,
+                     [afia_style.DPI, afia_style.SAVEFIG_KW, afia_style.ACTIVE_SAVERS,
+                      png_encode.LEVEL, png_encode.PALETTE])
+
+
+def layout_key(mod, fn_name, L, rc_params):
+    """Clé de la mise en page (figure_layout) : comme job_key, hors formats et encodage."""
+    return _spec_key(mod, fn_name, L, rc_params,
+                     ["layout", afia_style.DPI, afia_style.SAVEFIG_KW])
+
+
+def job_id(job):
+    chapter, fn_name, lang_key = job
+    return f"{chapter}/{fn_name}/{lang_key}"
+
+
+def manifest_id(job, output_dir=None):
+    """Entrée du job dans le manifeste : job_id préfixé du répertoire de sortie."""
+    return f"{os.path.abspath(output_dir or afia_style.OUTPUT_DIR)}#{job_id(job)}"
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Manifeste {manifest_id: {"key": ..., "path": ...}} ; vide s'il n'existe pas."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def is_fresh(manifest, job, key):
+    """Vrai si le job a déjà été rendu avec cette clé dans OUTPUT_DIR et que le fichier existe."""
+    entry = manifest.get(manifest_id(job))
+    return (entry is not None and entry.get("key") == key
+            and entry.get("path") is not None and os.path.exists(entry["path"]))
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Dérivés web (WebP / AVIF) des figures
+=============================================================================
+ Usage  : python figure_derivatives.py                  # docs/figures
+          python figure_derivatives.py --src ../figures --out ../figures/web
+          python figure_derivatives.py --widths 480,960 --formats webp
+ Output : <out>/<figure>-<largeur>.<format> + <out>/manifest.json
+=============================================================================
+ Chaque PNG à la racine de --src (300 DPI, ~3000 px de large), ceux que
+ charge la galerie de docs/index.html, est décliné en quelques largeurs et
+ formats modernes ; les copies des sous-dossiers de chapitre de
+ docs/figures n'en ont pas. manifest.json décrit, pour chaque PNG, ses
+ dimensions et les fichiers disponibles par format, dans l'ordre des
+ largeurs — de quoi construire un srcset :
+
+   {"Fig_1.1_Energy_DataCenters_FR.png": {
+       "width": 3303, "height": 2000,
+       "avif": [["web/Fig_1.1_Energy_DataCenters_FR-480.avif", 480], ...],
+       "webp": [...]}}
+
+ Comme pour les figures (figure_cache.py), une clé SHA-256 est calculée sur
+ le contenu du PNG source et les réglages ; les dérivés d'une figure
+ inchangée ne sont pas régénérés. Les dérivés d'un PNG disparu sont supprimés.
+=============================================================================
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+import figure_cache
+
+ROOT_DIR = figure_cache.ROOT_DIR
+SRC_DIR = os.path.join(ROOT_DIR, "docs", "figures")
+WEB_SUBDIR = "web"
+CACHE_PATH = os.path.join(figure_cache.CACHE_DIR, "derivatives.json")
+
+# Largeurs en pixels : vignette mobile, écran courant, écran haute densité.
+WIDTHS = (480, 960, 1600)
+FORMATS = ("avif", "webp")
+QUALITY = {"avif": 55, "webp": 80}
+SAVE_KW = {"avif": {"speed": 6}, "webp": {"method": 4}}
+
+
+def source_pngs(src_dir):
+    """Noms des PNG à la racine de src_dir (sans les sous-dossiers)."""
+    return sorted(name for name in os.listdir(src_dir)
+                  if name.endswith(".png") and os.path.isfile(os.path.join(src_dir, name)))
+
+
+def derivative_key(path, widths, formats):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read())
+    figure_cache._feed(h, [list(widths), list(formats),
+                           {fmt: [QUALITY[fmt], SAVE_KW[fmt]] for fmt in formats}])
+    return h.hexdigest()
+
+
+def make_derivatives(src_path, stem, widths, formats):
+    """Écrit les dérivés de src_path ; renvoie l'entrée du manifeste (chemins absolus)."""
+    with Image.open(src_path) as img:
+        img = img.convert("RGB")
+    entry = {"width": img.width, "height": img.height}
+    # Jamais d'agrandissement ; une source plus étroite que la plus petite
+    # largeur donne un seul dérivé à sa taille.
+    sizes = sorted({min(w, img.width) for w in widths})
+    os.makedirs(os.path.dirname(stem), exist_ok=True)
+    for width in sizes:
+        height = round(img.height * width / img.width)
+        small = img if width == img.width else img.resize((width, height), Image.Resampling.LANCZOS)
+        for fmt in formats:
+            path = f"{stem}-{width}.{fmt}"
+            small.save(path, format=fmt.upper(), quality=QUALITY[fmt], **SAVE_KW[fmt])
+            entry.setdefault(fmt, []).append([path, width])
+    return entry
+
+
+def _outputs(entry):
+    return [path for fmt in FORMATS for path, _ in (entry or {}).get(fmt, [])]
+
+
+def _remove(paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def _run(args):
+    return args[0], make_derivatives(*args[1:])
+
+
+def build(src_dir=SRC_DIR, out_dir=None, widths=WIDTHS, formats=FORMATS, force=False,
+          workers=None):
+    """Met à jour les dérivés et out_dir/manifest.json ; renvoie (générés, à jour)."""
+    out_dir = out_dir or os.path.join(src_dir, WEB_SUBDIR)
+    cache = figure_cache.load_manifest(CACHE_PATH)
+    sources = source_pngs(src_dir)
+    keys, todo = {}, []
+    for rel in sources:
+        src_path = os.path.abspath(os.path.join(src_dir, rel))
+        keys[rel] = key = derivative_key(src_path, widths, formats)
+        entry = cache.get(src_path)
+        if force or entry is None or entry.get("key") != key \
+                or not all(os.path.exists(p) for p in _outputs(entry)):
+            _remove(_outputs(entry))
+            stem = os.path.join(out_dir, os.path.splitext(rel)[0])
+            todo.append((rel, src_path, stem, widths, formats))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) < 2:
+        results = [_run(task) for task in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            results = list(pool.map(_run, todo))
+    for rel, entry in results:
+        print(f"  ✓ {rel}")
+        cache[os.path.abspath(os.path.join(src_dir, rel))] = dict(entry, key=keys[rel])
+
+    # Sources disparues : suppression de leurs dérivés.
+    live = {os.path.abspath(os.path.join(src_dir, rel)) for rel in sources}
+    prefix = os.path.abspath(src_dir) + os.sep
+    for src_path in [p for p in cache if p.startswith(prefix) and p not in live]:
+        _remove(_outputs(cache.pop(src_path)))
+    figure_cache.save_manifest(cache, CACHE_PATH)
+
+    manifest = {}
+    for rel in sources:
+        entry = cache[os.path.abspath(os.path.join(src_dir, rel))]
+        manifest[rel.replace(os.sep, "/")] = dict(
+            {"width": entry["width"], "height": entry["height"]},
+            **{fmt: [[os.path.relpath(p, src_dir).replace(os.sep, "/"), w]
+                     for p, w in entry.get(fmt, [])] for fmt in formats})
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return len(todo), len(sources) - len(todo)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Dérivés WebP / AVIF et manifeste srcset.")
+    parser.add_argument("--src", default=SRC_DIR, help="dossier des PNG sources (défaut : docs/figures)")
+    parser.add_argument("--out", default=None, help="dossier des dérivés (défaut : <src>/web)")
+    parser.add_argument("--widths", default=",".join(map(str, WIDTHS)),
+                        help="largeurs en pixels (défaut : %(default)s)")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help="formats parmi avif, webp (défaut : %(default)s)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="nombre de processus (défaut : nombre de cœurs)")
+    parser.add_argument("--force", action="store_true", help="régénère tous les dérivés")
+    args = parser.parse_args(argv)
+    args.widths = tuple(sorted(int(w) for w in args.widths.split(",") if w.strip()))
+    args.formats = tuple(f.strip() for f in args.formats.split(",") if f.strip())
+    unknown = [f for f in args.formats if f not in FORMATS]
+    if unknown or not args.formats or not args.widths:
+        parser.error(f"format(s) inconnu(s) ou liste vide : {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    t0 = time.perf_counter()
+    print("=" * 70)
+    print(f" DÉRIVÉS WEB — {', '.join(args.formats)} × {', '.join(map(str, args.widths))} px")
+    print("=" * 70)
+    made, fresh = build(args.src, args.out, args.widths, args.formats, args.force, args.jobs)
+    print(f"\n{'='*70}")
+    print(f" Total : {made} figures déclinées, {fresh} à jour, "
+          f"en {time.perf_counter() - t0:.1f} s")
+    print(f"{'='*70}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
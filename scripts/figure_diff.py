@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Régressions visuelles des figures publiées
+=============================================================================
+ Usage  : python figure_diff.py                       # figures/ vs docs/figures
+          python figure_diff.py ../figures/Fig_5.2_*.png --diff-dir /tmp/d
+          python figure_diff.py --all                 # affiche aussi les inchangées
+ Output : liste des figures modifiées ; code de sortie 1 s'il y en a
+=============================================================================
+ Chaque PNG rendu est comparé à la figure de même nom sous docs/figures
+ (le dossier racine, servi par le site, avant les sous-dossiers) :
+
+   identique  : mêmes octets ou mêmes pixels ;
+   invisible  : écarts ≤ --tolerance niveaux sur au plus --max-fraction des
+                pixels, empreintes perceptuelles voisines (bruit
+                d'anticrénelage, version de FreeType…) ;
+   modifiée   : tout autre écart, avec le rectangle qui l'englobe ;
+   dimensions : taille différente — seule la distance entre empreintes
+                perceptuelles (pHash 64 bits, DCT 32×32) est calculable ;
+   nouvelle   : pas de figure de référence.
+
+ Avec --diff-dir, une image par figure modifiée montre la nouvelle version
+ estompée et les pixels changés en rouge.
+=============================================================================
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+BASELINE_DIR = os.path.join(ROOT_DIR, "docs", "figures")
+RENDER_DIR = os.path.join(ROOT_DIR, "figures")
+
+TOLERANCE = 8           # niveaux (0-255) par canal
+MAX_FRACTION = 1e-4     # part des pixels au-delà de TOLERANCE
+PHASH_SIZE = 32
+PHASH_KEEP = 8
+PHASH_TOLERANCE = 4     # bits sur 64 : les coefficients proches de la médiane basculent
+
+CHANGED = ("modifiée", "dimensions", "nouvelle")
+
+
+def baseline_index(root=BASELINE_DIR):
+    """{nom de fichier: chemin} des PNG de référence, racine en priorité."""
+    index = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.endswith(".png"):
+                index.setdefault(name, os.path.join(dirpath, name))
+    return index
+
+
+def load_rgb(path):
+    """Pixels RGB (uint8) ; la transparence est composée sur fond blanc."""
+    with Image.open(path) as img:
+        if img.mode in ("RGBA", "LA", "P"):
+            img = img.convert("RGBA")
+            background = Image.new("RGBA", img.size, "white")
+            img = Image.alpha_composite(background, img)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        return np.asarray(img)
+
+
+def _dct_matrix(n):
+    k = np.arange(n)[:, None]
+    m = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n))
+    m[0] /= np.sqrt(2)
+    return m * np.sqrt(2 / n)
+
+
+_DCT = _dct_matrix(PHASH_SIZE)
+
+
+def phash(rgb):
+    """Empreinte perceptuelle 64 bits : signe des basses fréquences de la DCT."""
+    gray = Image.fromarray(rgb).convert("L")
+    # Réduction entière (moyenne de blocs) avant le filtre LANCZOS, bien plus
+    # rapide sur des images de 3000 px.
+    factor = max(1, min(gray.size) // (PHASH_SIZE * 4))
+    gray = gray.reduce(factor).resize((PHASH_SIZE, PHASH_SIZE), Image.Resampling.LANCZOS)
+    coeffs = _DCT @ np.asarray(gray, dtype=np.float64) @ _DCT.T
+    low = coeffs[:PHASH_KEEP, :PHASH_KEEP].ravel()
+    bits = low > np.median(low[1:])
+    return int.from_bytes(np.packbits(bits).tobytes(), "big")
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+def diff_image(new, mask, path):
+    """Nouvelle figure estompée, pixels changés en rouge."""
+    out = (255 - (255 - new.astype(np.uint16)) // 4).astype(np.uint8)
+    out[mask] = (220, 0, 0)
+    Image.fromarray(out).save(path, compress_level=1)
+
+
+def compare(new_path, base_path, tolerance=TOLERANCE, max_fraction=MAX_FRACTION,
+            diff_dir=None):
+    """Compare un rendu à sa référence ; renvoie un dict de résultat."""
+    result = {"name": os.path.basename(new_path), "path": new_path, "baseline": base_path}
+    if base_path is None:
+        return dict(result, status="nouvelle")
+    with open(new_path, "rb") as f1, open(base_path, "rb") as f2:
+        if f1.read() == f2.read():
+            return dict(result, status="identique")
+
+    new, base = load_rgb(new_path), load_rgb(base_path)
+    if new.shape != base.shape:
+        return dict(result, status="dimensions", phash_distance=hamming(phash(new), phash(base)),
+                    size=[new.shape[1], new.shape[0]], baseline_size=[base.shape[1], base.shape[0]])
+    if np.array_equal(new, base):
+        return dict(result, status="identique")
+
+    # |new - base| en uint8 sans conversion, puis maximum sur les canaux.
+    delta = np.maximum(new, base) - np.minimum(new, base)
+    delta = np.maximum(np.maximum(delta[..., 0], delta[..., 1]), delta[..., 2])
+    max_delta = int(delta.max())
+    distance = hamming(phash(new), phash(base))
+    result["phash_distance"] = distance
+    mask = delta > tolerance
+    fraction = float(mask.mean())
+    result.update(max_delta=max_delta, fraction=round(fraction, 6))
+    if fraction <= max_fraction and distance <= PHASH_TOLERANCE:
+        return dict(result, status="invisible")
+
+    rows, cols = np.nonzero(mask if mask.any() else delta)
+    result.update(status="modifiée",
+                  bbox=[int(cols.min()), int(rows.min()), int(cols.max()) + 1, int(rows.max()) + 1])
+    if diff_dir:
+        os.makedirs(diff_dir, exist_ok=True)
+        result["diff"] = os.path.join(diff_dir, result["name"])
+        diff_image(new, mask, result["diff"])
+    return result
+
+
+def _compare(args):
+    return compare(*args)
+
+
+def check(paths, baseline_dir=BASELINE_DIR, tolerance=TOLERANCE, max_fraction=MAX_FRACTION,
+          diff_dir=None, workers=None):
+    """Compare chaque PNG de paths à sa référence ; résultats dans l'ordre de paths."""
+    index = baseline_index(baseline_dir)
+    tasks = [(p, index.get(os.path.basename(p)), tolerance, max_fraction, diff_dir)
+             for p in paths]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(tasks) < 2:
+        return [_compare(t) for t in tasks]
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        return list(pool.map(_compare, tasks, chunksize=4))
+
+
+def describe(result):
+    """Ligne de rapport d'un résultat."""
+    status = result["status"]
+    line = f"  {status:<10} {result['name']}"
+    if status == "modifiée":
+        line += (f"  ({result['fraction'] * 100:.3f} % des pixels, écart max "
+                 f"{result['max_delta']}, zone {tuple(result['bbox'])}, "
+                 f"pHash {result['phash_distance']}/64)")
+    elif status == "dimensions":
+        line += (f"  ({'×'.join(map(str, result['baseline_size']))} → "
+                 f"{'×'.join(map(str, result['size']))}, pHash {result['phash_distance']}/64)")
+    elif status == "invisible":
+        line += f"  (écart max {result['max_delta']})"
+    if result.get("diff"):
+        line += f"\n             → {result['diff']}"
+    return line
+
+
+def _png_paths(args):
+    paths = []
+    for arg in args:
+        if os.path.isdir(arg):
+            paths.extend(os.path.join(arg, n) for n in sorted(os.listdir(arg)) if n.endswith(".png"))
+        else:
+            paths.append(arg)
+    return paths
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare les figures rendues à docs/figures.")
+    parser.add_argument("paths", nargs="*", default=[RENDER_DIR],
+                        help="PNG ou dossiers à vérifier (défaut : figures/)")
+    parser.add_argument("--baseline", default=BASELINE_DIR,
+                        help="dossier des figures de référence (défaut : docs/figures)")
+    parser.add_argument("--tolerance", type=int, default=TOLERANCE,
+                        help=f"écart par canal ignoré (défaut : {TOLERANCE})")
+    parser.add_argument("--max-fraction", type=float, default=MAX_FRACTION,
+                        help=f"part de pixels au-delà de la tolérance (défaut : {MAX_FRACTION})")
+    parser.add_argument("--diff-dir", default=None,
+                        help="écrit une image des différences par figure modifiée")
+    parser.add_argument("--all", action="store_true", help="affiche aussi les figures inchangées")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="nombre de processus (défaut : nombre de cœurs)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = check(_png_paths(args.paths), args.baseline, args.tolerance,
+                    args.max_fraction, args.diff_dir, args.jobs)
+    changed = [r for r in results if r["status"] in CHANGED]
+    for result in (results if args.all else changed):
+        print(describe(result))
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    print(f"\n {len(results)} figures : "
+          + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+    return 1 if changed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
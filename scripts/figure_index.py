@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Index des figures (figures.json)
+=============================================================================
+ Usage  : python figure_index.py             # docs/figures/figures.json
+          python figure_index.py ../figures/figures.json
+ Output : l'index, recalculé d'après les fichiers présents (sans rendu)
+=============================================================================
+ Écrit par build_figures.py à côté des PNG (OUTPUT_DIR/figures.json) et lu
+ par docs/index.html :
+
+   {"figures": [
+     {"chapter": "3", "number": "3.5", "lang": "fr", "suffix": "FR",
+      "file": "Fig_3.5_CACI_Calibration_FR.png", "sha256": "…",
+      "bytes": 231504, "width": 3315, "height": 2048,
+      "function": "generate_chapitre3_graphs.fig5_caci_calibration",
+      "title": "…"}, …]}
+
+ file est toujours le PNG quand il a été rendu, quel que soit l'ordre de
+ --format (width / height en pixels) ; les autres formats actifs du même
+ rendu sont dans "formats" : {"svg": "Fig_….svg", "pdf": …}.
+
+ sha256 porte sur le contenu du fichier : la page l'utilise comme paramètre
+ de cache-busting, une figure inchangée garde la même URL d'un déploiement
+ à l'autre. Les entrées des figures non construites sont conservées.
+
+ En ligne de commande, l'index existant est relu et chaque entrée dont le
+ fichier est encore là est recalculée (hash, taille, titre) ; les autres
+ sont retirées. docs/figures garde ainsi un index fidèle aux PNG publiés
+ sans les re-rendre.
+=============================================================================
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+import afia_style
+import figure_cache
+import figure_report
+
+INDEX_NAME = "figures.json"
+PUBLISHED_INDEX = os.path.join(figure_cache.ROOT_DIR, "docs", "figures", INDEX_NAME)
+
+# Clés de titre des dictionnaires L selon les chapitres (fig1_title, f1_title…).
+TITLE_KEYS = ("fig{n}_title", "f{n}_title", "a{n}_title")
+
+_FIG_NUM_RE = re.compile(r"^fig(\d+)_")
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def figure_title(L, n, title_args=None):
+    """Titre de la figure n dans L, mis en forme comme dans la figure.
+
+    title_args : TITLE_ARGS du module ({clé: arguments de .format()}) pour
+    les titres à champ variable (« … sur {} spécifications »).
+    """
+    title_args = title_args or {}
+    for pattern in TITLE_KEYS:
+        key = pattern.format(n=n)
+        title = L.get(key)
+        if isinstance(title, str):
+            if key in title_args:
+                title = title.format(*title_args[key])
+            return " ".join(title.split())
+    return None
+
+
+def figure_entry(mod, chapter, fn_name, lang_key, path, index_dir):
+    """Entrée d'index d'un rendu : son PNG, et les autres formats actifs dans formats.
+
+    path est le chemin du manifeste (premier format de --format) ; sans PNG
+    rendu, l'entrée décrit ce fichier-là.
+    """
+    n = int(_FIG_NUM_RE.match(fn_name).group(1))
+    L = mod.LANGS[lang_key]
+    png = afia_style.format_path(path, "png")
+    if os.path.exists(png):
+        path = png
+    width, height = figure_report.png_size(path) if path.endswith(".png") else (None, None)
+    entry = {
+        "chapter": chapter,
+        "number": f"{'A' if chapter == 'annexe' else chapter}.{n}",
+        "lang": lang_key,
+        "suffix": L["suffix"],
+        "file": os.path.relpath(path, index_dir).replace(os.sep, "/"),
+        "sha256": file_sha256(path),
+        "bytes": os.path.getsize(path),
+        "width": width,
+        "height": height,
+        "function": f"{mod.__name__}.{fn_name}",
+    }
+    others = {fmt: os.path.relpath(other, index_dir).replace(os.sep, "/")
+              for fmt in afia_style.ACTIVE_SAVERS
+              for other in [afia_style.format_path(path, fmt)]
+              if other != path and os.path.exists(other)}
+    if others:
+        entry["formats"] = others
+    title = figure_title(L, n, getattr(mod, "TITLE_ARGS", None))
+    if title:
+        entry["title"] = title
+    return entry
+
+
+def _order(entry):
+    """Ordre de l'index : module, numéro de figure, langue."""
+    return (entry["function"].split(".")[0], int(entry["number"].split(".")[-1]), entry["lang"])
+
+
+def load_index(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("figures", [])
+    except (OSError, ValueError, AttributeError):
+        return []
+
+
+def write_index(path, jobs, manifest, load_chapter):
+    """Met à jour l'index pour les jobs donnés ; renvoie le nombre d'entrées.
+
+    manifest est le manifeste du cache ({manifest_id: {"path": …}}) ; les
+    jobs sans fichier rendu dans OUTPUT_DIR sont omis.
+    """
+    index_dir = os.path.dirname(os.path.abspath(path))
+    fresh = []
+    for chapter, fn_name, lang_key in jobs:
+        entry = manifest.get(figure_cache.manifest_id((chapter, fn_name, lang_key)), {})
+        rendered = entry.get("path")
+        if rendered and os.path.exists(rendered):
+            fresh.append(figure_entry(load_chapter(chapter), chapter, fn_name, lang_key,
+                                      rendered, index_dir))
+    replaced = {(e["function"], e["lang"]) for e in fresh}
+    entries = [e for e in load_index(path)
+               if (e.get("function"), e.get("lang")) not in replaced
+               and os.path.exists(os.path.join(index_dir, e.get("file", "")))] + fresh
+    entries.sort(key=_order)
+    figure_cache.save_manifest({"figures": entries}, path)
+    return len(entries)
+
+
+def refresh(path, load_chapter):
+    """Recalcule les entrées de l'index d'après les fichiers présents ; renvoie leur nombre."""
+    index_dir = os.path.dirname(os.path.abspath(path))
+    entries = []
+    for e in load_index(path):
+        file_path = os.path.join(index_dir, e.get("file", ""))
+        if not os.path.isfile(file_path):
+            continue
+        fn_name = e["function"].split(".")[1]
+        entries.append(figure_entry(load_chapter(e["chapter"]), e["chapter"], fn_name,
+                                    e["lang"], file_path, index_dir))
+    entries.sort(key=_order)
+    figure_cache.save_manifest({"figures": entries}, path)
+    return len(entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Recalcule figures.json d'après les fichiers présents.")
+    parser.add_argument("index", nargs="?", default=PUBLISHED_INDEX,
+                        help="index à recalculer (défaut : docs/figures/figures.json)")
+    args = parser.parse_args(argv)
+    import build_figures
+    count = refresh(args.index, build_figures.load_chapter)
+    print(f" {args.index} : {count} figure(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
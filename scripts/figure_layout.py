@@ -0,0 +1,137 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Cadrage serré (bbox_inches='tight') mis en cache
+=============================================================================
+ Avec bbox_inches='tight', savefig commence par une passe de mise en page
+ (draw sans tracé + get_tightbbox) pour mesurer la figure, puis la rend :
+ 0,03 à 0,2 s par figure à 300 DPI. Passer à savefig le même rectangle,
+ déjà calculé, donne exactement les mêmes pixels en sautant cette passe.
+
+ build_figures.py déclare, avant chaque rendu, la clé de mise en page du
+ job (set_key, figure_cache.layout_key : code, textes L, données, style,
+ DPI — pas les formats ni l'encodage). bbox_inches() renvoie alors le
+ rectangle mémorisé pour cette clé, ou le calcule et l'enregistre dans
+ .build_cache/layouts.jsonl (une ligne JSON par clé, ajoutée par chaque
+ processus ; compact() élimine les doublons et les plus anciennes).
+
+ La réutilisation est exacte et non approchée : un cadrage décalé d'une
+ fraction de pixel change l'anticrénelage de toute l'image, et la sortie
+ ne serait plus la même selon l'état du cache. Une autre langue ou une
+ figure modifiée a donc sa propre entrée ; pas de réutilisation d'une
+ langue à l'autre avec tolérance (les titres et libellés traduits n'ont
+ pas la même emprise, et vérifier l'écart coûterait la passe à éviter).
+
+ Portée : un job dont la clé de mise en page est connue a en général aussi
+ une clé de cache inchangée, et figure_cache le saute. Le cache ne sert
+ donc qu'aux re-rendus à l'identique : --force, changement de format ou
+ d'encodage PNG. Gain mesuré : ~10 % du temps d'un --force (chapitre 6ter,
+ 12,8 s → 11,4 s), loin de la moitié du coût de tracé ; un build ordinaire
+ n'en tire rien. Sans clé (scripts de chapitre
+ lancés seuls), ou si la figure a un moteur de mise en page, savefig
+ garde bbox_inches='tight'. set_enabled(False) coupe le cache pour tout le
+ processus (benchmark_figures.py : la passe de mesure est chronométrée et
+ layouts.jsonl n'est pas touché).
+=============================================================================
+"""
+
+import json
+import os
+import threading
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.transforms import Bbox
+
+# Même dossier que figure_cache.CACHE_DIR, sans l'importer : figure_cache
+# importe afia_style, qui importe ce module.
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.path.join(ROOT_DIR, ".build_cache", "layouts.jsonl")
+MAX_ENTRIES = 4000
+
+_key = None
+_enabled = True
+_layouts = None
+_lock = threading.Lock()
+
+
+def set_key(key):
+    """Clé de mise en page des prochaines sauvegardes (None : pas de cache)."""
+    global _key
+    _key = key
+
+
+def set_enabled(enabled):
+    """Active ou coupe le cache de cadrage, quelle que soit la clé."""
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def _load():
+    global _layouts
+    if _layouts is None:
+        _layouts = {}
+        try:
+            with open(CACHE_PATH, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        key, extents = json.loads(line)
+                    except ValueError:
+                        continue
+                    _layouts.pop(key, None)
+                    _layouts[key] = extents
+        except OSError:
+            pass
+    return _layouts
+
+
+def tight_bbox(fig, dpi):
+    """Rectangle (pouces) que savefig(dpi=dpi, bbox_inches='tight') recadrerait."""
+    if not isinstance(fig.canvas, FigureCanvasAgg):
+        FigureCanvasAgg(fig)
+    old_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        renderer = fig.canvas.get_renderer()
+        with renderer._draw_disabled():
+            fig.draw(renderer)
+        bbox = fig.get_tightbbox(renderer)
+    finally:
+        fig.dpi = old_dpi
+    pad = matplotlib.rcParams["savefig.pad_inches"]
+    return bbox.padded(pad, pad)
+
+
+def bbox_inches(fig, dpi):
+    """Bbox à passer à savefig : mémorisée pour la clé courante, sinon 'tight'."""
+    if not _enabled or _key is None or fig.get_layout_engine() is not None:
+        return "tight"
+    with _lock:
+        extents = _load().get(_key)
+    if extents is not None:
+        # Coins stockés tels quels (repr JSON exact) : pas d'arrondi x0 + w.
+        return Bbox([extents[:2], extents[2:]])
+    bbox = tight_bbox(fig, dpi)
+    extents = [float(v) for v in bbox.extents]
+    with _lock:
+        _layouts[_key] = extents
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps([_key, extents]) + "\n")
+    return bbox
+
+
+def compact(max_entries=MAX_ENTRIES):
+    """Réécrit le cache sans doublons, en gardant les max_entries plus récentes."""
+    global _layouts
+    _layouts = None
+    layouts = _load()
+    keep = list(layouts.items())[-max_entries:]
+    if not keep:
+        return 0
+    tmp = CACHE_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for key, extents in keep:
+            f.write(json.dumps([key, extents]) + "\n")
+    os.replace(tmp, CACHE_PATH)
+    _layouts = dict(keep)
+    return len(keep)
@@ -0,0 +1,84 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — PDF vectoriel multi-pages par chapitre et langue
+=============================================================================
+ Avec build_figures.py --chapter-pdf, chaque chapitre produit, à côté des
+ PNG, un PDF par langue dans OUTPUT_DIR/pdf : Figures_<chapitre>_<suffixe>.pdf
+ (ex. Figures_5_FR.pdf, Figures_annexe_PT-BR.pdf), une page par figure dans
+ l'ordre des numéros, au cadrage serré de chaque figure. C'est l'entrée
+ unique du chapitre pour la mise en page de docs/pdf : textes et tracés
+ restent vectoriels, sans PNG à re-compresser.
+
+ L'écriture est en flux (PdfPages) : chaque figure est construite, ajoutée
+ comme page puis fermée avant la suivante ; seules les polices, sous-
+ ensemblées à la fermeture du fichier, restent en mémoire. Le fichier est
+ écrit sous un nom temporaire puis renommé, et ses métadonnées sont celles
+ des PDF de afia_style (sans dates ni versions) : mêmes figures, mêmes
+ octets.
+
+ Un PDF de chapitre est un job (chapitre, CHAPTER_PDF, langue) du manifeste
+ du cache ; sa clé (chapter_key) combine les clés des figures qu'il
+ contient : il n'est réécrit que si l'une d'elles a changé.
+=============================================================================
+"""
+
+import contextlib
+import hashlib
+import os
+
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+
+import afia_style
+
+# Pseudo-fonction des jobs de PDF de chapitre (ne correspond à aucun figN_*).
+CHAPTER_PDF = "chapter_pdf"
+PDF_DIR_NAME = "pdf"
+
+
+def chapter_pdf_path(chapter, lang_suffix):
+    return os.path.join(afia_style.OUTPUT_DIR, PDF_DIR_NAME,
+                        f"Figures_{chapter}_{lang_suffix}.pdf")
+
+
+def chapter_key(figure_keys):
+    """Clé d'un PDF de chapitre : clés de ses figures, dans l'ordre des pages."""
+    h = hashlib.sha256()
+    with open(__file__, "rb") as f:
+        h.update(f.read())
+    for key in figure_keys:
+        h.update(key.encode())
+    return h.hexdigest()
+
+
+@contextlib.contextmanager
+def capture_save_fig(mod):
+    """Remplace temporairement mod.save_fig pour récupérer (fig, name)."""
+    captured = []
+    original = mod.save_fig
+    mod.save_fig = lambda fig, name, suffix: captured.append((fig, name))
+    try:
+        yield captured
+    finally:
+        mod.save_fig = original
+
+
+def write_chapter_pdf(mod, fn_names, lang_key, path):
+    """Construit les figures fn_names du module, une page chacune ; renvoie path."""
+    L = mod.LANGS[lang_key]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    try:
+        with PdfPages(tmp, metadata=afia_style.VECTOR_METADATA["pdf"]) as pdf:
+            for fn_name in fn_names:
+                with capture_save_fig(mod) as captured:
+                    getattr(mod, fn_name)(L, lang_key)
+                for fig, _ in captured:
+                    pdf.savefig(fig, dpi=afia_style.DPI, **afia_style.SAVEFIG_KW)
+                    plt.close(fig)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    print(f"  ✓ {path}")
+    return path
@@ -0,0 +1,179 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Rapport de construction des figures
+=============================================================================
+ savefig_timed() remplace fig.savefig() dans les savers d'afia_style et
+ ajoute une ligne JSON par figure au rapport de construction :
+
+   {"name": ..., "path": ..., "dpi": 300,
+    "bbox_s": ..., "draw_s": ..., "encode_s": ..., "total_s": ...,
+    "bytes": ..., "width": ..., "height": ...[, "unchanged": true]}
+
+   bbox_s   : passe de mesure de bbox_inches='tight' (draw sans rendu
+              + get_tightbbox) ;
+   draw_s   : rendu Agg de la figure recadrée ;
+   encode_s : reste de savefig (compression PNG ou écriture SVG / PDF,
+              et écriture disque). Pour les PNG, l'encodage se fait hors
+              du fil de rendu (render_rgba_timed + png_encode.py) et
+              encode_s est le temps passé dans le thread d'encodage.
+
+ Le rapport est écrit dans REPORT_PATH, ou dans le fichier désigné par la
+ variable d'environnement AFIA_FIGURE_REPORT.
+=============================================================================
+"""
+
+import functools
+import io
+import json
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_PATH = os.path.join(ROOT_DIR, ".build_cache", "figure_report.jsonl")
+
+# Les entrées PNG sont ajoutées depuis les threads d'encodage.
+_append_lock = threading.Lock()
+
+
+def report_path():
+    return os.environ.get("AFIA_FIGURE_REPORT", REPORT_PATH)
+
+
+def png_size(path):
+    """(largeur, hauteur) lues dans l'en-tête IHDR d'un PNG."""
+    with open(path, "rb") as f:
+        head = f.read(24)
+    if head[:8] != b"\x89PNG\r\n\x1a\n":
+        return None, None
+    return struct.unpack(">II", head[16:24])
+
+
+def _timed_method(fig, attr, calls):
+    """Chronomètre les appels à fig.<attr> (surcharge d'instance temporaire)."""
+    method = getattr(fig, attr)
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            calls.append((attr, time.perf_counter() - t0))
+
+    setattr(fig, attr, wrapper)
+
+
+def _savefig_phases(fig, target, **savefig_kw):
+    """fig.savefig(target) instrumenté ; renvoie (bbox_s, draw_s, total_s)."""
+    calls = []
+    _timed_method(fig, "draw", calls)
+    _timed_method(fig, "get_tightbbox", calls)
+    t0 = time.perf_counter()
+    try:
+        fig.savefig(target, **savefig_kw)
+    finally:
+        total = time.perf_counter() - t0
+        vars(fig).pop("draw", None)
+        vars(fig).pop("get_tightbbox", None)
+
+    # Avec bbox_inches='tight', savefig appelle draw() deux fois : une passe de
+    # mesure sans rendu, puis le rendu final. Seul le dernier est compté en draw_s.
+    draws = [dt for attr, dt in calls if attr == "draw"]
+    draw_s = draws[-1] if draws else 0.0
+    bbox_s = sum(draws[:-1]) + sum(dt for attr, dt in calls if attr == "get_tightbbox")
+    return bbox_s, draw_s, total
+
+
+def _entry(path, dpi, bbox_s, draw_s, total):
+    return {
+        "name": os.path.basename(path),
+        "path": os.path.abspath(path),
+        "dpi": dpi,
+        "bbox_s": round(bbox_s, 4),
+        "draw_s": round(draw_s, 4),
+        "encode_s": round(max(total - bbox_s - draw_s, 0.0), 4),
+        "total_s": round(total, 4),
+    }
+
+
+def complete_entry(entry, path):
+    """Ajoute taille et dimensions du fichier écrit puis enregistre l'entrée."""
+    width, height = png_size(path) if str(path).endswith(".png") else (None, None)
+    entry = dict(entry, bytes=os.path.getsize(path), width=width, height=height)
+    append_entry(entry)
+    return entry
+
+
+def savefig_timed(fig, path, **savefig_kw):
+    """fig.savefig(path, **savefig_kw) instrumenté ; renvoie l'entrée du rapport."""
+    timings = _savefig_phases(fig, path, **savefig_kw)
+    return complete_entry(_entry(path, savefig_kw.get("dpi"), *timings), path)
+
+
+def render_rgba_timed(fig, path, layout_s=0.0, **savefig_kw):
+    """Rendu Agg seul (sans encodage) ; renvoie (tampon RGBA, entrée partielle).
+
+    path est le fichier qui sera écrit plus tard ; l'entrée est complétée par
+    complete_entry() une fois l'encodage terminé (voir png_encode.py).
+    layout_s : temps de cadrage passé avant savefig (figure_layout), compté
+    en bbox_s.
+    """
+    # Une figure fermée par pyplot (plt.close, ré-étiquetage) n'a plus qu'un
+    # FigureCanvasBase, sans renderer : on lui rattache un canvas Agg.
+    if not isinstance(fig.canvas, FigureCanvasAgg):
+        FigureCanvasAgg(fig)
+    buf = io.BytesIO()
+    timings = _savefig_phases(fig, buf, format="rgba", **savefig_kw)
+    # Le renderer du canvas est encore celui du rendu recadré qui vient d'avoir
+    # lieu : il donne les dimensions du tampon brut.
+    renderer = fig.canvas.renderer
+    width, height = int(renderer.width), int(renderer.height)
+    rgba = np.frombuffer(buf.getvalue(), np.uint8).reshape(height, width, 4)
+    bbox_s, draw_s, total = timings
+    return rgba, _entry(path, savefig_kw.get("dpi"), bbox_s + layout_s, draw_s, total + layout_s)
+
+
+def append_entry(entry, path=None):
+    """Ajoute une ligne au rapport (append atomique d'une ligne courte)."""
+    path = path or report_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with _append_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_report(path=None):
+    path = path or report_path()
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except OSError:
+        return []
+
+
+def summarize(entries, top=5):
+    """Lignes de résumé : totaux et figures les plus lentes / les plus lourdes."""
+    if not entries:
+        return []
+    lines = [
+        f" Rapport : {len(entries)} figures, "
+        f"{sum(e['total_s'] for e in entries):.1f} s de savefig "
+        f"(bbox {sum(e['bbox_s'] for e in entries):.1f} s, "
+        f"draw {sum(e['draw_s'] for e in entries):.1f} s, "
+        f"encode {sum(e['encode_s'] for e in entries):.1f} s), "
+        f"{sum(e['bytes'] for e in entries) / 1e6:.1f} Mo",
+    ]
+    unchanged = sum(1 for e in entries if e.get("unchanged"))
+    if unchanged:
+        lines.append(f" {unchanged} fichier(s) identique(s) non réécrit(s)")
+    lines.append(" Plus lentes :")
+    for e in sorted(entries, key=lambda e: e["total_s"], reverse=True)[:top]:
+        lines.append(f"   {e['total_s']:6.2f} s  {e['name']}")
+    lines.append(" Plus lourdes :")
+    for e in sorted(entries, key=lambda e: e["bytes"], reverse=True)[:top]:
+        lines.append(f"   {e['bytes'] / 1e3:6.0f} ko  {e['name']}  ({e['width']}×{e['height']})")
+    return lines
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Serveur de rendu pré-chauffé
+=============================================================================
+ Usage  : python figure_server.py serve &              # démarre le serveur
+          python figure_server.py build -c 5 --draft   # = build_figures.py …
+          python figure_server.py status | stop
+ Output : celle de build_figures.py, dans le terminal du client
+=============================================================================
+ Un lancement à froid de build_figures.py paie ≈ 2,8 s d'imports avant la
+ première figure : matplotlib et son gestionnaire de polices (≈ 0,8 s),
+ puis numpy, pandas, scipy, statsmodels et linearmodels pour l'annexe
+ (≈ 2 s). Le serveur les importe une fois, charge les polices d'afia.mplstyle
+ (rendu d'une figure jetable) puis attend sur un socket Unix local
+ (.build_cache/render.sock, ou $AFIA_RENDER_SOCKET).
+
+ Chaque requête `build` transmet les arguments, le répertoire courant,
+ l'environnement et les descripteurs stdin/stdout/stderr du client. Le
+ serveur se duplique (fork) : l'enfant hérite des imports chauds, adopte
+ l'environnement du client et exécute build_figures.main(), dont la sortie
+ s'affiche directement chez le client ; les processus de rendu (-j) sont
+ eux-mêmes issus de cet enfant. Les modules du dépôt (afia_style, figure_*,
+ chapitres) ne sont pas pré-chargés : ils lisent l'environnement à l'import
+ et sont importés à neuf par chaque requête (≈ 0,25 s), si bien qu'une
+ modification de code est prise en compte sans redémarrer le serveur et
+ qu'aucun état ne passe d'un build au suivant.
+
+ Les requêtes sont traitées une à une (deux builds ne se disputent pas le
+ manifeste du cache). Un Ctrl-C du client interrompt son build. Sans
+ serveur à l'écoute, `build` lance build_figures.py dans le processus
+ courant, comme un appel direct.
+=============================================================================
+"""
+
+import argparse
+import atexit
+import importlib
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(SCRIPTS_DIR)
+SOCKET_ENV = "AFIA_RENDER_SOCKET"
+SOCKET_PATH = os.environ.get(SOCKET_ENV,
+                             os.path.join(ROOT_DIR, ".build_cache", "render.sock"))
+
+# Bibliothèques tierces importées par le serveur ; celles qui manquent sont
+# simplement ignorées (l'annexe échouera alors comme à froid).
+PRELOAD = ("numpy", "pandas", "PIL.Image", "matplotlib.pyplot", "matplotlib.font_manager",
+           "scipy.stats", "statsmodels.api", "linearmodels.panel")
+
+# En-tête de message : longueur du JSON qui suit.
+HEADER = struct.Struct("!I")
+KILL_GRACE_S = 5.0
+
+
+# ─── Protocole ──────────────────────────────────────────────────────────────
+def _recv_exact(sock, size, data=b""):
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("connexion fermée en cours de message")
+        data += chunk
+    return data
+
+
+def send_request(sock, request, fds):
+    """Envoie la requête (JSON) et les descripteurs fds au serveur."""
+    payload = json.dumps(request).encode("utf-8")
+    socket.send_fds(sock, [HEADER.pack(len(payload)) + payload], fds)
+
+
+def recv_request(sock):
+    """Reçoit une requête ; renvoie (requête, descripteurs)."""
+    data, fds, _, _ = socket.recv_fds(sock, 65536, 3)
+    data = _recv_exact(sock, HEADER.size, data)
+    (size,) = HEADER.unpack_from(data)
+    data = _recv_exact(sock, HEADER.size + size, data)
+    return json.loads(data[HEADER.size:].decode("utf-8")), fds
+
+
+def connect(path=SOCKET_PATH):
+    """Socket connecté au serveur, ou None si aucun serveur n'écoute."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        sock.close()
+        return None
+    return sock
+
+
+# ─── Serveur ────────────────────────────────────────────────────────────────
+def preload():
+    """Importe PRELOAD et charge les polices du style ; renvoie la durée."""
+    t0 = time.perf_counter()
+    import matplotlib
+    matplotlib.use('Agg')
+    for name in PRELOAD:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    import matplotlib.pyplot as plt
+    # Figure jetable : recherche et ouverture des polices (regular, gras,
+    # monospace, mathtext), mises en cache par matplotlib pour les enfants.
+    with plt.style.context(os.path.join(SCRIPTS_DIR, "afia.mplstyle")):
+        fig, ax = plt.subplots()
+        ax.set_title("Aa", fontweight="bold")
+        ax.text(0.5, 0.5, "Aa", family="monospace")
+        ax.set_xlabel(r"$\alpha_i + \beta$")
+        fig.canvas.draw()
+        plt.close(fig)
+    import gc
+    gc.collect()
+    # Objets du serveur partagés en copie sur écriture avec les enfants.
+    gc.freeze()
+    return time.perf_counter() - t0
+
+
+def _run_child(request, fds):
+    """Exécute build_figures.main() dans l'enfant ; ne revient pas."""
+    code = 1
+    try:
+        os.setpgid(0, 0)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        sys.stdout.reconfigure(line_buffering=True)
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        sys.argv = [os.path.join(SCRIPTS_DIR, "build_figures.py")] + request["argv"]
+        import build_figures
+        code = build_figures.main(request["argv"])
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else (exc.code is not None)
+    except KeyboardInterrupt:
+        code = 130
+    except BaseException:
+        import traceback
+        traceback.print_exc()
+    finally:
+        try:
+            # Encodages PNG en attente (png_encode) et autres fins de processus.
+            atexit._run_exitfuncs()
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code or 0)
+
+
+def _wait_child(pid, conn):
+    """Attend l'enfant ; l'interrompt si le client se déconnecte."""
+    deadline = None
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status)
+        if deadline is None:
+            readable, _, _ = select.select([conn], [], [], 0.1)
+            if readable and not conn.recv(1):
+                # Client parti (Ctrl-C) : le groupe de l'enfant, pool compris.
+                os.killpg(pid, signal.SIGINT)
+                deadline = time.monotonic() + KILL_GRACE_S
+        elif time.monotonic() > deadline:
+            os.killpg(pid, signal.SIGKILL)
+            deadline = float("inf")
+        else:
+            time.sleep(0.1)
+
+
+def handle(conn, listener):
+    """Traite une requête (build, status ou stop) ; renvoie False pour stop."""
+    request, fds = recv_request(conn)
+    command = request.get("command")
+    if command == "stop":
+        conn.sendall(b"0\n")
+        return False
+    if command == "status":
+        conn.sendall(f"0 pid={os.getpid()} python={sys.version.split()[0]}\n".encode())
+        return True
+    pid = os.fork()
+    if pid == 0:
+        listener.close()
+        conn.close()
+        _run_child(request, fds)
+    for fd in fds:
+        os.close(fd)
+    code = _wait_child(pid, conn)
+    try:
+        conn.sendall(f"{code}\n".encode())
+    except OSError:
+        pass
+    return True
+
+
+def serve(path=SOCKET_PATH):
+    """Pré-charge les bibliothèques puis traite les requêtes jusqu'à stop."""
+    sock = connect(path)
+    if sock is not None:
+        sock.close()
+        print(f" Serveur déjà à l'écoute sur {path}", file=sys.stderr)
+        return 1
+    elapsed = preload()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        os.remove(path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o077)
+    try:
+        listener.bind(path)
+    finally:
+        os.umask(old_umask)
+    listener.listen()
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    print(f" Serveur de rendu prêt en {elapsed:.1f} s — {path} (pid {os.getpid()})",
+          flush=True)
+    try:
+        running = True
+        while running:
+            conn, _ = listener.accept()
+            with conn:
+                try:
+                    running = handle(conn, listener)
+                except (OSError, ValueError) as exc:
+                    print(f"  ✗ requête rejetée : {exc}", file=sys.stderr, flush=True)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        if os.path.exists(path):
+            os.remove(path)
+    return 0
+
+
+# ─── Client ─────────────────────────────────────────────────────────────────
+def request(command, argv=(), path=SOCKET_PATH):
+    """Envoie une commande au serveur ; renvoie (code, réponse) ou None."""
+    sock = connect(path)
+    if sock is None:
+        return None
+    with sock:
+        payload = {"command": command, "argv": list(argv), "cwd": os.getcwd(),
+                   "env": dict(os.environ)}
+        send_request(sock, payload, [0, 1, 2] if command == "build" else [])
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                return 1, "serveur interrompu"
+            reply += chunk
+    code, _, text = reply.decode().strip().partition(" ")
+    return int(code), text
+
+
+def build(argv, path=SOCKET_PATH):
+    """build_figures.py argv, via le serveur s'il écoute, sinon sur place."""
+    try:
+        reply = request("build", argv, path)
+    except KeyboardInterrupt:
+        return 130
+    if reply is not None:
+        return reply[0]
+    print(f" (aucun serveur sur {path} : build dans ce processus)", file=sys.stderr)
+    import build_figures
+    return build_figures.main(argv)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serveur de rendu des figures pré-chauffé.")
+    parser.add_argument("command", choices=("serve", "build", "status", "stop"))
+    parser.add_argument("--socket", default=SOCKET_PATH,
+                        help=f"socket Unix du serveur (défaut : {SOCKET_ENV} ou "
+                             ".build_cache/render.sock)")
+    args, rest = parser.parse_known_args(argv)
+    if args.command == "serve":
+        return serve(args.socket)
+    if args.command == "build":
+        return build(rest, args.socket)
+    reply = request(args.command, path=args.socket)
+    if reply is None:
+        print(f" Aucun serveur sur {args.socket}")
+        return 1
+    code, text = reply
+    print(f" {text or 'arrêté'}")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Surveillance des sources pour build_figures --watch
+=============================================================================
+ Scrutation périodique (mtime et taille, sans dépendance) des dossiers des
+ scripts de chapitre — catalogues locales/ compris — et des données CSV de
+ caci-dashboard/public/data. Les chemins modifiés sont classés :
+
+   script ou catalogue d'un chapitre : ce chapitre est recalculé ; seuls
+       les jobs dont la clé de cache a changé sont rendus (la clé couvre le
+       code de la fonction, les textes L qu'elle lit et les données) ;
+   CSV : contenu hors clé de cache — chapitres dont le source cite le nom
+       du fichier, toutes leurs figures re-rendues ;
+   autre module chargé par le pilote (afia_style, figure_*…) ou feuille
+       afia.mplstyle : redémarrage du pilote.
+=============================================================================
+"""
+
+import os
+import time
+
+import afia_style
+import figure_cache
+
+DATA_DIR = os.path.join(figure_cache.ROOT_DIR, "caci-dashboard", "public", "data")
+WATCHED_EXT = (".py", ".json", ".csv", ".mplstyle")
+POLL_S = 0.25
+# Un éditeur peut écrire un fichier en plusieurs fois : on attend un état
+# stable pendant SETTLE_S avant de reconstruire.
+SETTLE_S = 0.15
+
+
+def watch_roots(chapters):
+    """Dossiers surveillés : ceux des scripts de chapitre et des données."""
+    roots = {os.path.dirname(os.path.abspath(path)) for path in chapters.values()}
+    roots.add(os.path.dirname(os.path.abspath(afia_style.STYLE_PATH)))
+    if os.path.isdir(DATA_DIR):
+        roots.add(DATA_DIR)
+    return sorted(roots)
+
+
+def snapshot(roots):
+    """{chemin: (mtime_ns, taille)} des fichiers surveillés sous roots."""
+    files = {}
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".") and d != "__pycache__"]
+            for name in filenames:
+                if name.endswith(WATCHED_EXT):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    files[path] = (st.st_mtime_ns, st.st_size)
+    return files
+
+
+def changed_paths(before, after):
+    return sorted(p for p in before.keys() | after.keys() if before.get(p) != after.get(p))
+
+
+def wait_for_change(roots, before, poll_s=POLL_S, settle_s=SETTLE_S):
+    """Attend une modification puis un état stable ; renvoie (état, chemins modifiés)."""
+    after = before
+    while after == before:
+        time.sleep(poll_s)
+        after = snapshot(roots)
+    while True:
+        time.sleep(settle_s)
+        settled = snapshot(roots)
+        if settled == after:
+            return after, changed_paths(before, after)
+        after = settled
+
+
+def _mentions(script_path, name):
+    try:
+        with open(script_path, encoding="utf-8") as f:
+            return name in f.read()
+    except OSError:
+        return False
+
+
+def classify(paths, chapters, loaded_files):
+    """Classe les chemins modifiés ; renvoie ({chapitre: forcer}, redémarrer).
+
+    chapters : {chapitre: script} surveillés ; loaded_files : fichiers des
+    modules chargés par le pilote.
+    """
+    touched, restart = {}, False
+    catalog_dirs = {afia_style.catalog_dir(path) + os.sep: chapter
+                    for chapter, path in chapters.items()}
+    scripts = {os.path.abspath(path): chapter for chapter, path in chapters.items()}
+    for path in map(os.path.abspath, paths):
+        catalog = next((c for d, c in catalog_dirs.items() if path.startswith(d)), None)
+        if path in scripts:
+            touched.setdefault(scripts[path], False)
+        elif catalog is not None:
+            touched.setdefault(catalog, False)
+        elif path.endswith(".csv"):
+            for chapter, script in chapters.items():
+                if _mentions(script, os.path.basename(path)):
+                    touched[chapter] = True
+        elif path in loaded_files or path == os.path.abspath(afia_style.STYLE_PATH):
+            restart = True
+    return touched, restart
@@ -6,39 +6,29 @@
 =============================================================================
  Auteur : Script généré pour l'annexe économétrique
  Usage  : python generate_caci_graphs_multilingual.py
- Output : 15 PNG files (5 figures × 3 langues)
+ Output : 18 PNG files (6 figures × 3 langues)
 =============================================================================
 """
 
 import matplotlib
 matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 import numpy as np
-import pandas as pd
-import statsmodels.api as sm
-from linearmodels.panel import PanelOLS, RandomEffects
-from scipy import stats
 import os
 import warnings
+
+import afia_style
+import caci_fits
+import caci_panel
+import caci_specs
+from afia_style import (US_COLOR, EU_COLOR, FR_COLOR, CN_COLOR, ACCENT1,
+                        save_fig, setup_style)
 warnings.filterwarnings('ignore')
 
-# ─── Configuration ──────────────────────────────────────────────────────────
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-os.makedirs(OUTPUT_DIR, exist_ok=True)
-DPI = 300
-
-# Couleurs
-US_COLOR = "#1B4F72"
-EU_COLOR = "#D4AC0D"
-CN_COLOR = "#C0392B"
-FR_COLOR = "#2E86C1"
-ACCENT1 = "#148F77"
+# Couleurs propres à l'annexe
 ACCENT2 = "#E74C3C"
 ACCENT3 = "#F39C12"
 ACCENT4 = "#27AE60"
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
 
 color_map = {
     'USA': US_COLOR, 'China': CN_COLOR, 'UK': FR_COLOR, 'Germany': EU_COLOR,
@@ -47,97 +37,15 @@ color_map = {
     'Brazil': ACCENT4, 'Sweden': EU_COLOR,
 }
 
-plt.rcParams.update({
-    'font.family': 'DejaVu Sans', 'font.size': 11,
-    'axes.facecolor': BG_COLOR, 'figure.facecolor': 'white',
-    'axes.grid': True, 'grid.color': GRID_COLOR, 'grid.alpha': 0.7,
-    'axes.spines.top': False, 'axes.spines.right': False,
-})
 
 # ─── Traductions ────────────────────────────────────────────────────────────
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        # Fig A.1
-        "a1_title": "Fig. A.1 — Corrélation CACI–Productivité IA (2024)\nTaille des bulles ∝ PIB",
-        "a1_xlabel": "ln(CACI)",
-        "a1_ylabel": "ln(Productivité IA sectorielle)",
-        "a1_legend": "Droite OLS",
-        "a1_source": "Source : panel 12 pays, calibration auteur. β = {:.3f} (p < 0.01)",
-        # Fig A.2
-        "a2_title": "Fig. A.2 — Trajectoires CACI par pays (2020–2024)",
-        "a2_xlabel": "Année",
-        "a2_ylabel": "CACI (×10⁻⁶)",
-        "a2_source": "Source : panel calibré, élaboration auteur",
-        # Fig A.3
-        "a3_title": "Fig. A.3 — Stabilité du coefficient CACI\nà travers les spécifications (IC 95%)",
-        "a3_xlabel": "Coefficient β (ln CACI → ln Productivité IA)",
-        "a3_models": ['M1 : OLS Pooled', 'M2 : Effets Fixes', 'M3 : Effets Aléatoires'],
-        # Fig A.4
-        "a4_title": "Fig. A.4 — Diagnostic des résidus",
-        "a4_qq": "QQ-plot des résidus (OLS)",
-        "a4_resid": "Résidus vs valeurs ajustées",
-        "a4_fitted": "Valeurs prédites",
-        "a4_residlabel": "Résidus",
-        # Fig A.5
-        "a5_title": "Fig. A.5 — Avantage compute US mesuré par le CACI (2024)\nRatio = combien de fois les US disposent de plus de compute effectif",
-        "a5_xlabel": "Ratio CACI(US) / CACI(pays)",
-        "a5_source": "Source : calcul CACI auteur, calibration Epoch AI / IEA / Banque mondiale",
-    },
-    "en": {
-        "suffix": "EN",
-        "a1_title": "Fig. A.1 — CACI–AI Productivity Correlation (2024)\nBubble size ∝ GDP",
-        "a1_xlabel": "ln(CACI)",
-        "a1_ylabel": "ln(AI sectoral productivity)",
-        "a1_legend": "OLS fit",
-        "a1_source": "Source: 12-country panel, author calibration. β = {:.3f} (p < 0.01)",
-        "a2_title": "Fig. A.2 — CACI Trajectories by Country (2020–2024)",
-        "a2_xlabel": "Year",
-        "a2_ylabel": "CACI (×10⁻⁶)",
-        "a2_source": "Source: calibrated panel, author's elaboration",
-        "a3_title": "Fig. A.3 — CACI Coefficient Stability\nAcross Specifications (95% CI)",
-        "a3_xlabel": "Coefficient β (ln CACI → ln AI Productivity)",
-        "a3_models": ['M1: OLS Pooled', 'M2: Fixed Effects', 'M3: Random Effects'],
-        "a4_title": "Fig. A.4 — Residuals Diagnostics",
-        "a4_qq": "QQ-plot of residuals (OLS)",
-        "a4_resid": "Residuals vs fitted values",
-        "a4_fitted": "Fitted values",
-        "a4_residlabel": "Residuals",
-        "a5_title": "Fig. A.5 — US Compute Advantage Measured by CACI (2024)\nRatio = how many times the US has more effective compute",
-        "a5_xlabel": "Ratio CACI(US) / CACI(country)",
-        "a5_source": "Source: CACI calculation by author, Epoch AI / IEA / World Bank calibration",
-    },
-    "pt": {
-        "suffix": "PT",
-        "a1_title": "Fig. A.1 — Correlação CACI–Produtividade IA (2024)\nTamanho das bolhas ∝ PIB",
-        "a1_xlabel": "ln(CACI)",
-        "a1_ylabel": "ln(Produtividade setorial de IA)",
-        "a1_legend": "Ajuste OLS",
-        "a1_source": "Fonte: painel de 12 países, calibração do autor. β = {:.3f} (p < 0,01)",
-        "a2_title": "Fig. A.2 — Trajetórias CACI por país (2020–2024)",
-        "a2_xlabel": "Ano",
-        "a2_ylabel": "CACI (×10⁻⁶)",
-        "a2_source": "Fonte: painel calibrado, elaboração do autor",
-        "a3_title": "Fig. A.3 — Estabilidade do coeficiente CACI\nentre especificações (IC 95%)",
-        "a3_xlabel": "Coeficiente β (ln CACI → ln Produtividade IA)",
-        "a3_models": ['M1: OLS Pooled', 'M2: Efeitos Fixos', 'M3: Efeitos Aleatórios'],
-        "a4_title": "Fig. A.4 — Diagnóstico dos resíduos",
-        "a4_qq": "QQ-plot dos resíduos (OLS)",
-        "a4_resid": "Resíduos vs valores ajustados",
-        "a4_fitted": "Valores previstos",
-        "a4_residlabel": "Resíduos",
-        "a5_title": "Fig. A.5 — Vantagem de compute dos EUA medida pelo CACI (2024)\nRazão = quantas vezes os EUA têm mais compute efetivo",
-        "a5_xlabel": "Razão CACI(EUA) / CACI(país)",
-        "a5_source": "Fonte: cálculo CACI do autor, calibração Epoch AI / IEA / Banco Mundial",
-    },
-}
+# Un catalogue JSON par langue (locales/caci_graphs_multilingual/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 1. RECONSTRUCT PANEL & MODELS (same as original script)
 # ═══════════════════════════════════════════════════════════════════════════
 
-np.random.seed(42)
-
 countries = [
     "USA", "China", "UK", "Germany", "France", "Japan",
     "South Korea", "India", "Canada", "Netherlands", "Brazil", "Sweden"
@@ -176,77 +84,49 @@ prod_growth = {
     "Canada": 0.15, "Netherlands": 0.11, "Brazil": 0.08, "Sweden": 0.14,
 }
 
-rows = []
-for c in countries:
-    F_24, E_24, GDP_24, L_24, PROD_24 = base_data[c]
-    for y in years:
-        t = 2024 - y
-        F = F_24 / ((1 + compute_growth[c]) ** t)
-        E = E_24 / ((1 + energy_growth) ** t)
-        GDP = GDP_24 / ((1 + gdp_growth[c]) ** t)
-        L = L_24 * (1 - 0.05 * t)
-        PROD = PROD_24 / ((1 + prod_growth[c]) ** t)
-        noise = lambda: 1 + np.random.uniform(-0.05, 0.05)
-        F *= noise(); E *= noise(); PROD *= noise()
-        CACI = (F / E) / (GDP * 1e6 * L)
-        RD = GDP * np.random.uniform(0.015, 0.035)
-        INTERNET = min(98, 60 + np.random.uniform(15, 38))
-        REGULATION = np.random.uniform(0, 1)
-        EXPORT_CTRL = 0
-        if c == "China" and y >= 2022: EXPORT_CTRL = 1
-        elif c in ["India", "Brazil"] and y >= 2024: EXPORT_CTRL = 0.5
-        rows.append({
-            'country': c, 'year': y,
-            'F_petaflops': F, 'E_cost_mwh': E,
-            'GDP_T_usd': GDP, 'L_ai_thousands': L,
-            'CACI': CACI, 'PROD_ai_pct': PROD,
-            'RD_T_usd': RD, 'internet_pct': INTERNET,
-            'regulation_idx': REGULATION, 'export_control': EXPORT_CTRL,
-            'ln_CACI': np.log(CACI + 1e-10), 'ln_PROD': np.log(PROD + 0.01),
-            'ln_F': np.log(F),
-            'ln_GDP_pc': np.log(GDP * 1e12 / (L * 1000 * 50)),
-        })
-
-df = pd.DataFrame(rows)
+export_controls = {"China": (2022, 1), "India": (2024, 0.5), "Brazil": (2024, 0.5)}
+
+# Paramètres du panel, repris par caci_montecarlo.py pour les réplications.
+calibration = dict(countries=countries, years=years, base_data=base_data,
+                   compute_growth=compute_growth, energy_growth=energy_growth,
+                   gdp_growth=gdp_growth, prod_growth=prod_growth,
+                   export_controls=export_controls)
+
+# Flux de l'ancien np.random.seed(42) : panel publié à l'identique.
+df = caci_panel.panel_frame(
+    caci_panel.simulate_panel(**calibration, rng=np.random.RandomState(42)),
+    countries, years)
 
 # ─── Estimate models ───
-X_ols = df[['ln_CACI', 'ln_GDP_pc', 'regulation_idx', 'export_control']].copy()
-X_ols = sm.add_constant(X_ols)
-y_ols = df['ln_PROD']
-ols_model = sm.OLS(y_ols, X_ols).fit(cov_type='HC1')
+# Relus dans .build_cache/models tant que le panel ne change pas (caci_fits.py).
+ols_model = caci_fits.fitted(
+    df, 'OLS', 'ln_PROD', ['ln_CACI', 'ln_GDP_pc', 'regulation_idx', 'export_control'],
+    constant=True, cov_type='HC1')
 
-df_panel = df.set_index(['country', 'year'])
 exog_vars = ['ln_CACI', 'regulation_idx', 'export_control']
 
-fe_model = PanelOLS(
-    df_panel['ln_PROD'], df_panel[exog_vars],
-    entity_effects=True, time_effects=True, check_rank=False
-).fit(cov_type='clustered', cluster_entity=True)
+fe_model = caci_fits.fitted(
+    df, 'PanelOLS', 'ln_PROD', exog_vars,
+    entity_effects=True, time_effects=True, cov_type='clustered', cluster_entity=True)
+
+re_model = caci_fits.fitted(
+    df, 'RandomEffects', 'ln_PROD', exog_vars,
+    constant=True, cov_type='clustered', cluster_entity=True)
 
-re_model = RandomEffects(
-    df_panel['ln_PROD'], sm.add_constant(df_panel[exog_vars]),
-    check_rank=False
-).fit(cov_type='clustered', cluster_entity=True)
+# Multivers contrôles × estimateur × échantillon, en moindres carrés par lots (caci_specs.py).
+spec_curve = caci_specs.curve(caci_specs.run(df))
+
+# Arguments de .format() des titres à champ variable, repris par figure_index.py.
+TITLE_ARGS = {'a6_title': (len(spec_curve),)}
 
-print(f"Panel: {len(countries)} pays × {len(years)} ans = {len(df)} observations")
-print(f"OLS β(CACI) = {ols_model.params['ln_CACI']:.4f}")
-print(f"FE  β(CACI) = {fe_model.params['ln_CACI']:.4f}")
-print(f"RE  β(CACI) = {re_model.params['ln_CACI']:.4f}")
 
 # ═══════════════════════════════════════════════════════════════════════════
 # 2. GENERATE FIGURES IN 3 LANGUAGES
 # ═══════════════════════════════════════════════════════════════════════════
 
-all_files = []
-
-for lang_key, L in LANGS.items():
-    print(f"\n{'─'*50}")
-    print(f" Langue : {L['suffix']}")
-    print(f"{'─'*50}")
-
-    sfx = f"_{L['suffix']}"
 
-    # ═══ Fig A.1 : Scatter CACI vs Productivité ═══
+# ═══ Fig A.1 : Scatter CACI vs Productivité ═══
+def fig1_caci_vs_productivity(L, lang_key):
     fig, ax = plt.subplots(figsize=(12, 8))
     for c in countries:
         mask = (df['country'] == c) & (df['year'] == 2024)
@@ -271,13 +151,11 @@ for lang_key, L in LANGS.items():
     ax.legend(fontsize=10)
     ax.text(0.5, -0.08, L['a1_source'].format(ols_model.params['ln_CACI']),
             transform=ax.transAxes, ha='center', fontsize=8, color='gray', fontstyle='italic')
-    fname = os.path.join(OUTPUT_DIR, f"Fig_A1_CACI_vs_Productivity{sfx}.png")
-    fig.savefig(fname, dpi=DPI, bbox_inches='tight', facecolor='white')
-    plt.close()
-    all_files.append(fname)
-    print(f"  ✓ Fig A.1 {L['suffix']}")
+    return save_fig(fig, "Fig_A1_CACI_vs_Productivity", L["suffix"])
 
-    # ═══ Fig A.2 : Trajectoires CACI ═══
+
+# ═══ Fig A.2 : Trajectoires CACI ═══
+def fig2_caci_trajectories(L, lang_key):
     fig, ax = plt.subplots(figsize=(13, 7))
     focus = ["USA", "China", "Germany", "France", "Japan", "India", "Brazil", "Sweden"]
     for c in focus:
@@ -292,13 +170,11 @@ for lang_key, L in LANGS.items():
     ax.set_xticks(years)
     ax.text(0.5, -0.08, L['a2_source'],
             transform=ax.transAxes, ha='center', fontsize=8, color='gray', fontstyle='italic')
-    fname = os.path.join(OUTPUT_DIR, f"Fig_A2_CACI_Trajectories{sfx}.png")
-    fig.savefig(fname, dpi=DPI, bbox_inches='tight', facecolor='white')
-    plt.close()
-    all_files.append(fname)
-    print(f"  ✓ Fig A.2 {L['suffix']}")
+    return save_fig(fig, "Fig_A2_CACI_Trajectories", L["suffix"])
+
 
-    # ═══ Fig A.3 : Coefficient Plot ═══
+# ═══ Fig A.3 : Coefficient Plot ═══
+def fig3_coefficient_plot(L, lang_key):
     fig, ax = plt.subplots(figsize=(11, 7))
     models_names = L['a3_models']
     coefs = [ols_model.params['ln_CACI'], fe_model.params['ln_CACI'], re_model.params['ln_CACI']]
@@ -320,13 +196,12 @@ for lang_key, L in LANGS.items():
     ax.set_title(L['a3_title'], fontsize=13, fontweight='bold', pad=20)
     ax.set_ylim(-0.6, 2.8)
     ax.legend(loc='lower left', fontsize=9)
-    fname = os.path.join(OUTPUT_DIR, f"Fig_A3_Coefficient_Plot{sfx}.png")
-    fig.savefig(fname, dpi=DPI, bbox_inches='tight', facecolor='white')
-    plt.close()
-    all_files.append(fname)
-    print(f"  ✓ Fig A.3 {L['suffix']}")
+    return save_fig(fig, "Fig_A3_Coefficient_Plot", L["suffix"])
 
-    # ═══ Fig A.4 : Residuals Diagnostic ═══
+
+# ═══ Fig A.4 : Residuals Diagnostic ═══
+def fig4_residuals(L, lang_key):
+    import statsmodels.api as sm
     fig, axes = plt.subplots(1, 2, figsize=(13, 5.5))
     resid = ols_model.resid
     sm.qqplot(resid, line='45', ax=axes[0], markersize=5, color=US_COLOR, alpha=0.6)
@@ -342,13 +217,11 @@ for lang_key, L in LANGS.items():
 
     fig.suptitle(L['a4_title'], fontsize=13, fontweight='bold', y=1.02)
     fig.tight_layout()
-    fname = os.path.join(OUTPUT_DIR, f"Fig_A4_Residuals{sfx}.png")
-    fig.savefig(fname, dpi=DPI, bbox_inches='tight', facecolor='white')
-    plt.close()
-    all_files.append(fname)
-    print(f"  ✓ Fig A.4 {L['suffix']}")
+    return save_fig(fig, "Fig_A4_Residuals", L["suffix"])
+
 
-    # ═══ Fig A.5 : Ratio CACI(US)/CACI(r) ═══
+# ═══ Fig A.5 : Ratio CACI(US)/CACI(r) ═══
+def fig5_caci_ratios(L, lang_key):
     fig, ax = plt.subplots(figsize=(13, 7))
     caci_2024 = df[df['year'] == 2024][['country', 'CACI']].set_index('country')
     us_caci = caci_2024.loc['USA', 'CACI']
@@ -369,19 +242,101 @@ for lang_key, L in LANGS.items():
     ax.axvline(x=1, color='gray', linewidth=1, linestyle=':', alpha=0.5)
     ax.text(0.5, -0.08, L['a5_source'],
             transform=ax.transAxes, ha='center', fontsize=8, color='gray', fontstyle='italic')
-    fname = os.path.join(OUTPUT_DIR, f"Fig_A5_CACI_Ratios{sfx}.png")
-    fig.savefig(fname, dpi=DPI, bbox_inches='tight', facecolor='white')
-    plt.close()
-    all_files.append(fname)
-    print(f"  ✓ Fig A.5 {L['suffix']}")
+    return save_fig(fig, "Fig_A5_CACI_Ratios", L["suffix"])
+
+
+# ═══ Fig A.6 : Courbe de spécification ═══
+def fig6_specification_curve(L, lang_key):
+    fig, (ax, ax_dots) = plt.subplots(2, 1, figsize=(14, 10), sharex=True,
+                                      gridspec_kw={'height_ratios': [2, 3], 'hspace': 0.05})
+    x = np.arange(len(spec_curve))
+    sig = spec_curve['significant'].to_numpy()
+    for mask, col, label in ((sig, US_COLOR, L['a6_significant']),
+                             (~sig, '#AAAAAA', L['a6_not_significant'])):
+        ax.vlines(x[mask], spec_curve['low'][mask], spec_curve['high'][mask],
+                  color=col, alpha=0.15, linewidth=0.6)
+        ax.scatter(x[mask], spec_curve['beta'][mask], s=6, color=col, label=label, zorder=3)
+
+    retained = ((spec_curve['estimator'] == 'ols') & (spec_curve['sample'] == 'all') &
+                (spec_curve['n_controls'] == 3) & spec_curve['ln_GDP_pc'] &
+                spec_curve['regulation_idx'] & spec_curve['export_control'])
+    i = int(np.flatnonzero(retained)[0])
+    ax.scatter(i, spec_curve['beta'][i], marker='*', s=200, color=CN_COLOR,
+               edgecolors='white', linewidth=1, zorder=5, label=L['a6_annex'])
+    ax.axhline(y=0, color='gray', linewidth=1, linestyle='--', alpha=0.6)
+    ax.set_ylabel(L['a6_ylabel'], fontsize=11, fontweight='bold')
+    ax.set_title(L['a6_title'].format(*TITLE_ARGS['a6_title']), fontsize=13, fontweight='bold')
+    ax.legend(loc='upper left', fontsize=9)
+
+    # Une ligne par choix : contrôles, estimateurs, échantillons.
+    from_year = spec_curve['from_year'].dropna().iloc[0]
+    n_dropped = spec_curve['dropped'].nunique()
+    rows = ([(spec_curve[c], name) for c, name in zip(caci_specs.CONTROLS, L['a6_controls'])] +
+            [(spec_curve['estimator'] == e, name)
+             for e, name in zip(caci_specs.ESTIMATORS, L['a6_estimators'])] +
+            [(spec_curve['sample'] == k, name.format(v))
+             for k, name, v in zip(('all', 'from', 'drop'), L['a6_samples'],
+                                   (None, from_year, n_dropped))])
+    group_colors = [US_COLOR] * len(caci_specs.CONTROLS) + [EU_COLOR] * len(caci_specs.ESTIMATORS) \
+        + [ACCENT4] * 3
+    y_pos = np.arange(len(rows))[::-1]
+    for (mask, _), y, col in zip(rows, y_pos, group_colors):
+        ax_dots.scatter(x[mask.to_numpy()], np.full(mask.sum(), y), marker='|', s=40,
+                        color=col, linewidth=0.5)
+    ax_dots.set_yticks(y_pos)
+    ax_dots.set_yticklabels([name for _, name in rows], fontsize=9)
+    ax_dots.set_ylim(-0.7, len(rows) - 0.3)
+    bounds = np.cumsum([0, len(caci_specs.CONTROLS), len(caci_specs.ESTIMATORS), 3])
+    for start, stop, group in zip(bounds[:-1], bounds[1:], L['a6_groups']):
+        ax_dots.axhline(y=len(rows) - stop - 0.5, color='gray', linewidth=0.8, alpha=0.5)
+        ax_dots.text(1.01, len(rows) - (start + stop) / 2 - 0.5, group,
+                     transform=ax_dots.get_yaxis_transform(), va='center',
+                     fontsize=10, fontweight='bold', rotation=-90)
+    ax_dots.set_xlabel(L['a6_xlabel'], fontsize=11, fontweight='bold')
+    ax_dots.set_xlim(-len(x) * 0.01, len(x) * 1.01)
+    ax_dots.text(0.5, -0.14, L['a6_source'].format((spec_curve['beta'] > 0).mean(), sig.mean()),
+                 transform=ax_dots.transAxes, ha='center', fontsize=8, color='gray',
+                 fontstyle='italic')
+    return save_fig(fig, "Fig_A6_Specification_Curve", L["suffix"])
+
 
 # ═══════════════════════════════════════════════════════════════════════════
-# 3. COPY TO OUTPUTS
+# 3. MAIN
 # ═══════════════════════════════════════════════════════════════════════════
 
-print(f"\n{'='*60}")
-print(f" {len(all_files)} graphiques générés (5 figures × 3 langues)")
-print(f" Output : {os.path.abspath(OUTPUT_DIR)}")
-print(f"{'='*60}")
-for f in sorted(all_files):
-    print(f"  ✓ {os.path.basename(f)}")
+def main():
+    setup_style()
+
+    print(f"Panel: {len(countries)} pays × {len(years)} ans = {len(df)} observations")
+    print(f"OLS β(CACI) = {ols_model.params['ln_CACI']:.4f}")
+    print(f"FE  β(CACI) = {fe_model.params['ln_CACI']:.4f}")
+    print(f"RE  β(CACI) = {re_model.params['ln_CACI']:.4f}")
+    print(f"Courbe de spécification : {len(spec_curve)} spécifications")
+
+    all_files = []
+
+    for lang_key, L in LANGS.items():
+        print(f"\n{'─'*50}")
+        print(f" Langue : {L['suffix']}")
+        print(f"{'─'*50}")
+
+        all_files.append(fig1_caci_vs_productivity(L, lang_key))
+        all_files.append(fig2_caci_trajectories(L, lang_key))
+        all_files.append(fig3_coefficient_plot(L, lang_key))
+        all_files.append(fig4_residuals(L, lang_key))
+        all_files.append(fig5_caci_ratios(L, lang_key))
+        all_files.append(fig6_specification_curve(L, lang_key))
+
+    print(f"\n{'='*60}")
+    print(f" {len(all_files)} graphiques générés (6 figures × {len(LANGS)} langue(s))")
+    print(f" Output : {os.path.abspath(afia_style.OUTPUT_DIR)}")
+    print(f"{'='*60}")
+    for f in sorted(all_files):
+        print(f"  ✓ {os.path.basename(f)}")
+
+    return all_files
+
+
+if __name__ == "__main__":
+    afia_style.parse_cli()
+    main()
@@ -16,209 +16,22 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
+
+import afia_style
+from afia_style import US_COLOR, EU_COLOR, CN_COLOR, ACCENT1, save_fig, setup_style
 
 # ─── Configuration ──────────────────────────────────────────────────────────
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
 FIGSIZE_WIDE = (12, 6.5)
 FIGSIZE_SQUARE = (10, 7)
 FIGSIZE_TALL = (11, 8)
 
 # Couleurs palette professionnelle
-US_COLOR = "#1B4F72"       # Bleu foncé (US)
-EU_COLOR = "#D4AC0D"       # Or/jaune (EU)
-FR_COLOR = "#2E86C1"       # Bleu moyen (France)
-CN_COLOR = "#C0392B"       # Rouge (Chine)
-ACCENT1 = "#148F77"        # Vert teal
 ACCENT2 = "#884EA0"        # Violet
 ACCENT3 = "#E67E22"        # Orange
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
 
 # ─── Traductions ────────────────────────────────────────────────────────────
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        "fig1_title": "Consommation électrique mondiale des data centers\n(Projection IEA 2022-2030)",
-        "fig1_ylabel": "TWh / an",
-        "fig1_label_total": "Total data centers",
-        "fig1_label_ai": "Dont IA (estimation)",
-        "fig1_source": "Source : IEA Energy and AI (2025), IEA-4E (2025)",
-        "fig1_annot_2024": "415 TWh\n(2024)",
-        "fig1_annot_2030": "945 TWh\n(2030, scén. base)",
-
-        "fig2_title": "Marché mondial des semi-conducteurs\n(Projection 2020-2030)",
-        "fig2_ylabel": "Milliards USD",
-        "fig2_label_total": "Total semi-conducteurs",
-        "fig2_label_ai": "Dont puces IA (estimation)",
-        "fig2_source": "Sources : SIA/WSTS, McKinsey (2026), Deloitte (2026), AMD",
-        "fig2_cagr": "CAGR ~13%",
-
-        "fig3_title": "Compute Gap : capacité de calcul IA par unité de PIB\n(États-Unis vs Union Européenne, 2024)",
-        "fig3_ylabel": "Indice relatif (UE = 1)",
-        "fig3_labels": ["États-Unis", "Union Européenne"],
-        "fig3_source": "Sources : Hawkins et al. (2025), Fed Board (2025), estimations auteur",
-        "fig3_annot": "×15",
-
-        "fig4_title": "Taux d'adoption de l'IA par les entreprises\n(États-Unis vs Union Européenne, 2025)",
-        "fig4_ylabel": "% d'entreprises utilisant l'IA",
-        "fig4_cats": ["Petites entreprises", "Grandes entreprises"],
-        "fig4_legend": ["États-Unis", "Union Européenne"],
-        "fig4_source": "Sources : Parlement européen (2025), US Chamber of Commerce (2025)",
-
-        "fig5_title": "Domination américaine sur les points d'étranglement\nde la chaîne de valeur IA (2025)",
-        "fig5_cats": ["GPU data centers\n(Nvidia)", "Infrastructure\ncloud", "Capital-risque\nIA générative"],
-        "fig5_ylabel": "Part de marché contrôlée par des acteurs US (%)",
-        "fig5_source": "Sources : OCDE (2025), Fed Board (2025), Bruegel (2024)",
-        "fig5_label": "Part US",
-
-        "fig6_title": "Cadre théorique intégré : du protectionnisme technologique\nà la divergence de compétitivité",
-        "fig6_boxes": [
-            "PROTECTIONNISME\nTECHNOLOGIQUE US\n(Export controls,\ntarifs, quotas)",
-            "RESTRICTION\nDU COMPUTE\nEUROPÉEN\n(Compute gap ×15)",
-            "DIVERGENCE DE\nPRODUCTIVITÉ\n(J-curve retardée,\ncoûts accrus)",
-            "DÉPENDANCE\nSTRATÉGIQUE\n(Vendor lock-in\ngéopolitique)"
-        ],
-        "fig6_amplifiers": ["Énergie\n(coûts ×2-3 vs US)", "Robotique IA\n(demande ×2 compute)"],
-        "fig6_theories": [
-            "Weaponized\nInterdependence\n(Farrell & Newman)",
-            "GPT & J-Curve\n(Brynjolfsson et al.)",
-            "Concentration\n& Rentes\n(Martens, OCDE)",
-            "Souveraineté\nnumérique\n(Mügge, Hawkins)"
-        ],
-        "fig6_source": "Élaboration auteur — Cadre théorique, section 1.3",
-        "fig6_amp_label": "AMPLIFICATEURS",
-    },
-    "en": {
-        "suffix": "EN",
-        "fig1_title": "Global Data Center Electricity Consumption\n(IEA Projection 2022-2030)",
-        "fig1_ylabel": "TWh / year",
-        "fig1_label_total": "Total data centers",
-        "fig1_label_ai": "Of which AI (estimate)",
-        "fig1_source": "Source: IEA Energy and AI (2025), IEA-4E (2025)",
-        "fig1_annot_2024": "415 TWh\n(2024)",
-        "fig1_annot_2030": "945 TWh\n(2030, base sc.)",
-
-        "fig2_title": "Global Semiconductor Market\n(Projection 2020-2030)",
-        "fig2_ylabel": "Billion USD",
-        "fig2_label_total": "Total semiconductors",
-        "fig2_label_ai": "Of which AI chips (estimate)",
-        "fig2_source": "Sources: SIA/WSTS, McKinsey (2026), Deloitte (2026), AMD",
-        "fig2_cagr": "CAGR ~13%",
-
-        "fig3_title": "Compute Gap: AI Computing Capacity per GDP Unit\n(United States vs European Union, 2024)",
-        "fig3_ylabel": "Relative Index (EU = 1)",
-        "fig3_labels": ["United States", "European Union"],
-        "fig3_source": "Sources: Hawkins et al. (2025), Fed Board (2025), author estimates",
-        "fig3_annot": "×15",
-
-        "fig4_title": "AI Adoption Rate by Enterprises\n(United States vs European Union, 2025)",
-        "fig4_ylabel": "% of enterprises using AI",
-        "fig4_cats": ["Small enterprises", "Large enterprises"],
-        "fig4_legend": ["United States", "European Union"],
-        "fig4_source": "Sources: European Parliament (2025), US Chamber of Commerce (2025)",
-
-        "fig5_title": "US Dominance Over AI Value Chain Chokepoints\n(2025)",
-        "fig5_cats": ["Data center GPUs\n(Nvidia)", "Cloud\ninfrastructure", "Generative AI\nventure capital"],
-        "fig5_ylabel": "Market share controlled by US players (%)",
-        "fig5_source": "Sources: OECD (2025), Fed Board (2025), Bruegel (2024)",
-        "fig5_label": "US share",
-
-        "fig6_title": "Integrated Theoretical Framework: From Technological Protectionism\nto Competitiveness Divergence",
-        "fig6_boxes": [
-            "US TECHNOLOGICAL\nPROTECTIONISM\n(Export controls,\ntariffs, quotas)",
-            "RESTRICTION OF\nEUROPEAN\nCOMPUTE\n(Compute gap ×15)",
-            "PRODUCTIVITY\nDIVERGENCE\n(Delayed J-curve,\nhigher costs)",
-            "STRATEGIC\nDEPENDENCE\n(Geopolitical\nvendor lock-in)"
-        ],
-        "fig6_amplifiers": ["Energy\n(costs ×2-3 vs US)", "AI Robotics\n(×2 compute demand)"],
-        "fig6_theories": [
-            "Weaponized\nInterdependence\n(Farrell & Newman)",
-            "GPT & J-Curve\n(Brynjolfsson et al.)",
-            "Concentration\n& Rents\n(Martens, OECD)",
-            "Digital\nSovereignty\n(Mügge, Hawkins)"
-        ],
-        "fig6_source": "Author's elaboration — Theoretical framework, section 1.3",
-        "fig6_amp_label": "AMPLIFIERS",
-    },
-    "pt": {
-        "suffix": "PT-BR",
-        "fig1_title": "Consumo Global de Eletricidade em Data Centers\n(Projeção IEA 2022-2030)",
-        "fig1_ylabel": "TWh / ano",
-        "fig1_label_total": "Total data centers",
-        "fig1_label_ai": "Dos quais IA (estimativa)",
-        "fig1_source": "Fonte: IEA Energy and AI (2025), IEA-4E (2025)",
-        "fig1_annot_2024": "415 TWh\n(2024)",
-        "fig1_annot_2030": "945 TWh\n(2030, cen. base)",
-
-        "fig2_title": "Mercado Global de Semicondutores\n(Projeção 2020-2030)",
-        "fig2_ylabel": "Bilhões USD",
-        "fig2_label_total": "Total semicondutores",
-        "fig2_label_ai": "Dos quais chips IA (estimativa)",
-        "fig2_source": "Fontes: SIA/WSTS, McKinsey (2026), Deloitte (2026), AMD",
-        "fig2_cagr": "CAGR ~13%",
-
-        "fig3_title": "Compute Gap: Capacidade de Cálculo IA por Unidade de PIB\n(Estados Unidos vs União Europeia, 2024)",
-        "fig3_ylabel": "Índice Relativo (UE = 1)",
-        "fig3_labels": ["Estados Unidos", "União Europeia"],
-        "fig3_source": "Fontes: Hawkins et al. (2025), Fed Board (2025), estimativas do autor",
-        "fig3_annot": "×15",
-
-        "fig4_title": "Taxa de Adoção de IA pelas Empresas\n(Estados Unidos vs União Europeia, 2025)",
-        "fig4_ylabel": "% de empresas usando IA",
-        "fig4_cats": ["Pequenas empresas", "Grandes empresas"],
-        "fig4_legend": ["Estados Unidos", "União Europeia"],
-        "fig4_source": "Fontes: Parlamento Europeu (2025), US Chamber of Commerce (2025)",
-
-        "fig5_title": "Dominância Americana nos Pontos de Estrangulamento\nda Cadeia de Valor da IA (2025)",
-        "fig5_cats": ["GPUs data center\n(Nvidia)", "Infraestrutura\ncloud", "Capital de risco\nIA generativa"],
-        "fig5_ylabel": "Participação de mercado controlada por atores dos EUA (%)",
-        "fig5_source": "Fontes: OCDE (2025), Fed Board (2025), Bruegel (2024)",
-        "fig5_label": "Participação EUA",
-
-        "fig6_title": "Quadro Teórico Integrado: Do Protecionismo Tecnológico\nà Divergência de Competitividade",
-        "fig6_boxes": [
-            "PROTECIONISMO\nTECNOLÓGICO EUA\n(Controles exportação,\ntarifas, cotas)",
-            "RESTRIÇÃO DO\nCOMPUTE\nEUROPEU\n(Compute gap ×15)",
-            "DIVERGÊNCIA DE\nPRODUTIVIDADE\n(J-curve atrasada,\ncustos elevados)",
-            "DEPENDÊNCIA\nESTRATÉGICA\n(Vendor lock-in\ngeopolítico)"
-        ],
-        "fig6_amplifiers": ["Energia\n(custos ×2-3 vs EUA)", "Robótica IA\n(demanda ×2 compute)"],
-        "fig6_theories": [
-            "Weaponized\nInterdependence\n(Farrell & Newman)",
-            "GPT & J-Curve\n(Brynjolfsson et al.)",
-            "Concentração\n& Rendas\n(Martens, OCDE)",
-            "Soberania\nDigital\n(Mügge, Hawkins)"
-        ],
-        "fig6_source": "Elaboração do autor — Quadro teórico, seção 1.3",
-        "fig6_amp_label": "AMPLIFICADORES",
-    }
-}
-
-
-def setup_style():
-    """Style commun pour tous les graphiques."""
-    plt.rcParams.update({
-        'font.family': 'DejaVu Sans',
-        'font.size': 11,
-        'axes.facecolor': BG_COLOR,
-        'figure.facecolor': 'white',
-        'axes.grid': True,
-        'grid.color': GRID_COLOR,
-        'grid.alpha': 0.7,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-    })
-
-
-def save_fig(fig, name, lang_suffix):
-    """Sauvegarde avec nom normalisé."""
-    path = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}.png")
-    fig.savefig(path, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {path}")
-    return path
+# Un catalogue JSON par langue (locales/chapitre1/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -504,7 +317,6 @@ def fig6_theoretical_framework(L, lang_key):
 # MAIN — Génération pour les 3 langues
 # ═══════════════════════════════════════════════════════════════════════════
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
 
     print("=" * 70)
@@ -526,7 +338,7 @@ def main():
         all_files.append(fig6_theoretical_framework(L, lang_key))
 
     print(f"\n{'='*70}")
-    print(f" Total : {len(all_files)} fichiers générés dans {OUTPUT_DIR}/")
+    print(f" Total : {len(all_files)} fichiers générés dans {afia_style.OUTPUT_DIR}/")
     print(f"{'='*70}")
 
     # Résumé des insertions
@@ -560,4 +372,5 @@ def main():
 
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
@@ -15,25 +15,19 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
+
+import afia_style
+from afia_style import (US_COLOR, EU_COLOR, FR_COLOR, CN_COLOR, ACCENT1,
+                        GRID_COLOR, save_fig)
 
 # ─── Configuration ──────────────────────────────────────────────────────────
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
 FIGSIZE_WIDE = (13, 7)
 FIGSIZE_SQUARE = (10, 7)
 
 # Couleurs
-US_COLOR = "#1B4F72"
-EU_COLOR = "#D4AC0D"
-FR_COLOR = "#2E86C1"
-CN_COLOR = "#C0392B"
-ACCENT1 = "#148F77"
 ACCENT2 = "#884EA0"
 ACCENT3 = "#E67E22"
 ACCENT4 = "#2C3E50"
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
 
 # Couleurs scénarios
 SC_A = "#3498DB"  # Dérive lente (bleu)
@@ -42,241 +36,13 @@ SC_C = "#E74C3C"  # Vassalisation (rouge)
 SC_D = "#8E44AD"  # Guerre froide (violet)
 
 # ─── Traductions ────────────────────────────────────────────────────────────
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        # Fig 2.1 — Architecture méthodologique
-        "fig1_title": "Architecture méthodologique de l'étude",
-        "fig1_retro": "VOLET RÉTROSPECTIF\n2020–2026",
-        "fig1_retro_sub": "Diagnostic empirique\n(Chapitre III)",
-        "fig1_prosp": "VOLET PROSPECTIF\n2026–2030",
-        "fig1_prosp_sub": "Scénarios\n(Chapitre V)",
-        "fig1_sources": ["Sources primaires\n(IEA, SIA, BIS)", "Sources académiques\n(Bruegel, Carnegie)", "Sources industry\n(McKinsey, Deloitte)"],
-        "fig1_metrics": "6 Métriques\nde divergence\n+ CACI",
-        "fig1_scenarios": "4 Scénarios\n(Matrice 2×2)",
-        "fig1_output": "Recommandations\n(Chapitre VII)",
-        "fig1_method": "Méthode mixte : quantitative descriptive + scenario planning (Schwartz, 1991)",
-        "fig1_source": "Élaboration auteur — Section 2.1",
-
-        # Fig 2.2 — Matrice 2×2 scénarios
-        "fig2_title": "Matrice 2×2 des scénarios 2026–2030",
-        "fig2_xaxis": "Capacité de réponse européenne →",
-        "fig2_yaxis": "← Intensité du protectionnisme US",
-        "fig2_xlabels": ["EU PASSIVE", "EU ACTIVE (riposte)"],
-        "fig2_ylabels": ["US statu quo\nrenforcé", "US durcissement\nagressif"],
-        "fig2_scenarios": [
-            ("A — Dérive lente", "Gap stable\nDépendance croissante\nVassalisation douce"),
-            ("B — Rattrapage partiel", "EU investit massivement\nGap réduit\nAutonomie renforcée"),
-            ("C — Vassalisation", "Quotas GPU EU\nProductivité −25%\nDélocalisations massives"),
-            ("D — Guerre froide techno.", "Fragmentation bloc\nCoûts élevés\nAutonomie forcée"),
-        ],
-        "fig2_source": "Élaboration auteur — Section 2.3, inspiré de Schwartz (1991)",
-
-        # Fig 2.3 — 6 Métriques de divergence
-        "fig3_title": "Tableau de bord : les six métriques de divergence US/EU",
-        "fig3_metrics": ["M1\nCompute\nGap", "M2\nCoût relatif\ndu FLOP", "M3\nDépendance\nCloud",
-                         "M4\nProductivité\nIA sectorielle", "M5\nContrainte\nÉnergétique", "M6\nDélocalisations\nIA"],
-        "fig3_values_label": "Situation actuelle (2025-2026)",
-        "fig3_values": ["×15\n(US/EU)", "×2-3\n(EU/US)", "~70%\nsur infra US",
-                        "+12% US\nvs +3% EU", "Critique\n(20% projets\nretardés EU)", "~8%\nprojets EU\nvers US"],
-        "fig3_source": "Élaboration auteur — Section 2.4.1",
-
-        # Fig 2.4 — CACI décomposé
-        "fig4_title": "Décomposition du Compute-Adjusted\nCompetitiveness Index (CACI)",
-        "fig4_formula": "CACI(r) = [ F(r) × E(r)⁻¹ ] / [ PIB(r) × L(r) ]",
-        "fig4_components": [
-            ("F(r)", "FLOPs IA installés\net accessibles", "Epoch AI, CFG,\nTop500, Hawkins\net al. (2025)"),
-            ("E(r)⁻¹", "Inverse du coût\nénergétique (€/MWh)", "Eurostat, EIA,\nIEA (2025)"),
-            ("PIB(r)", "Produit Intérieur\nBrut (normalisation)", "Banque mondiale,\nEurostat"),
-            ("L(r)", "Capital humain IA\n(diplômés STEM)", "OCDE, LinkedIn\nEconomic Graph"),
-        ],
-        "fig4_interpret": "Ratio CACI(US)/CACI(EU) = avantage concurrentiel relatif",
-        "fig4_source": "Élaboration auteur — Section 2.4.2",
-        "fig4_numerator": "NUMÉRATEUR\n(capacité effective)",
-        "fig4_denominator": "DÉNOMINATEUR\n(normalisation)",
-
-        # Fig 2.5 — Sources et triangulation
-        "fig5_title": "Triangulation des sources : classification et biais",
-        "fig5_cats": ["Sources primaires\nofficielless", "Sources académiques\n/ think tanks", "Sources industry\n/ consulting"],
-        "fig5_fiab": [9, 7.5, 5.5],
-        "fig5_couv": [6, 7, 8.5],
-        "fig5_biais": [3, 5, 8],
-        "fig5_fiab_label": "Fiabilité factuelle",
-        "fig5_couv_label": "Couverture données",
-        "fig5_biais_label": "Risque de biais",
-        "fig5_source": "Élaboration auteur — Section 2.2",
-
-        # Fig 2.6 — Périmètre temporel et géographique
-        "fig6_title": "Périmètre de l'étude : axes temporel, géographique\net technologique",
-        "fig6_time_label": "AXE TEMPOREL",
-        "fig6_retro": "Diagnostic rétrospectif\n2020 → 2026",
-        "fig6_prosp": "Projection prospective\n2026 → 2030",
-        "fig6_geo_label": "AXE GÉOGRAPHIQUE",
-        "fig6_geo_main": ["États-Unis\n(focus principal)", "Union Européenne\n(focus principal)", "France\n(focus spécifique)"],
-        "fig6_geo_sec": ["Chine\n(variable\ncontextuelle)", "Japon / Corée\n/ Taïwan\n(chaîne appro.)"],
-        "fig6_tech_label": "AXE TECHNOLOGIQUE",
-        "fig6_tech": ["IA de frontière\n(modèles fondation)", "GPU / ASIC\n(semi-conducteurs)", "Data centers\n& Énergie", "Robotique IA\n(amplificateur)"],
-        "fig6_source": "Élaboration auteur — Section 2.5",
-    },
-    "en": {
-        "suffix": "EN",
-        "fig1_title": "Study Methodological Architecture",
-        "fig1_retro": "RETROSPECTIVE\n2020–2026",
-        "fig1_retro_sub": "Empirical Diagnosis\n(Chapter III)",
-        "fig1_prosp": "PROSPECTIVE\n2026–2030",
-        "fig1_prosp_sub": "Scenarios\n(Chapter V)",
-        "fig1_sources": ["Primary sources\n(IEA, SIA, BIS)", "Academic sources\n(Bruegel, Carnegie)", "Industry sources\n(McKinsey, Deloitte)"],
-        "fig1_metrics": "6 Divergence\nMetrics\n+ CACI",
-        "fig1_scenarios": "4 Scenarios\n(2×2 Matrix)",
-        "fig1_output": "Recommendations\n(Chapter VII)",
-        "fig1_method": "Mixed method: descriptive quantitative + scenario planning (Schwartz, 1991)",
-        "fig1_source": "Author's elaboration — Section 2.1",
-
-        "fig2_title": "2×2 Scenario Matrix 2026–2030",
-        "fig2_xaxis": "European Response Capacity →",
-        "fig2_yaxis": "← US Protectionism Intensity",
-        "fig2_xlabels": ["EU PASSIVE", "EU ACTIVE (response)"],
-        "fig2_ylabels": ["US reinforced\nstatus quo", "US aggressive\nhardening"],
-        "fig2_scenarios": [
-            ("A — Slow Drift", "Stable gap\nGrowing dependence\nSoft vassalization"),
-            ("B — Partial Catch-up", "EU invests massively\nGap reduced\nEnhanced autonomy"),
-            ("C — Vassalization", "GPU quotas for EU\nProductivity −25%\nMass relocations"),
-            ("D — Tech Cold War", "Western bloc\nfragmentation\nHigh costs, forced autonomy"),
-        ],
-        "fig2_source": "Author's elaboration — Section 2.3, inspired by Schwartz (1991)",
-
-        "fig3_title": "Dashboard: Six US/EU Divergence Metrics",
-        "fig3_metrics": ["M1\nCompute\nGap", "M2\nRelative\nFLOP Cost", "M3\nCloud\nDependence",
-                         "M4\nSectoral AI\nProductivity", "M5\nEnergy\nConstraint", "M6\nAI\nRelocations"],
-        "fig3_values_label": "Current situation (2025-2026)",
-        "fig3_values": ["×15\n(US/EU)", "×2-3\n(EU/US)", "~70%\non US infra",
-                        "+12% US\nvs +3% EU", "Critical\n(20% EU projects\ndelayed)", "~8%\nEU projects\nto US"],
-        "fig3_source": "Author's elaboration — Section 2.4.1",
-
-        "fig4_title": "Decomposition of the Compute-Adjusted\nCompetitiveness Index (CACI)",
-        "fig4_formula": "CACI(r) = [ F(r) × E(r)⁻¹ ] / [ GDP(r) × L(r) ]",
-        "fig4_components": [
-            ("F(r)", "Installed & accessible\nAI FLOPs", "Epoch AI, CFG,\nTop500, Hawkins\net al. (2025)"),
-            ("E(r)⁻¹", "Inverse energy cost\n(€/MWh)", "Eurostat, EIA,\nIEA (2025)"),
-            ("GDP(r)", "Gross Domestic\nProduct (normalization)", "World Bank,\nEurostat"),
-            ("L(r)", "AI Human Capital\n(STEM graduates)", "OECD, LinkedIn\nEconomic Graph"),
-        ],
-        "fig4_interpret": "CACI(US)/CACI(EU) ratio = relative competitive advantage",
-        "fig4_source": "Author's elaboration — Section 2.4.2",
-        "fig4_numerator": "NUMERATOR\n(effective capacity)",
-        "fig4_denominator": "DENOMINATOR\n(normalization)",
-
-        "fig5_title": "Source Triangulation: Classification and Bias",
-        "fig5_cats": ["Primary official\nsources", "Academic /\nthink tank sources", "Industry /\nconsulting sources"],
-        "fig5_fiab": [9, 7.5, 5.5],
-        "fig5_couv": [6, 7, 8.5],
-        "fig5_biais": [3, 5, 8],
-        "fig5_fiab_label": "Factual reliability",
-        "fig5_couv_label": "Data coverage",
-        "fig5_biais_label": "Bias risk",
-        "fig5_source": "Author's elaboration — Section 2.2",
-
-        "fig6_title": "Study Scope: Temporal, Geographic\nand Technological Axes",
-        "fig6_time_label": "TEMPORAL AXIS",
-        "fig6_retro": "Retrospective diagnosis\n2020 → 2026",
-        "fig6_prosp": "Prospective projection\n2026 → 2030",
-        "fig6_geo_label": "GEOGRAPHIC AXIS",
-        "fig6_geo_main": ["United States\n(primary focus)", "European Union\n(primary focus)", "France\n(specific focus)"],
-        "fig6_geo_sec": ["China\n(contextual\nvariable)", "Japan / Korea\n/ Taiwan\n(supply chain)"],
-        "fig6_tech_label": "TECHNOLOGICAL AXIS",
-        "fig6_tech": ["Frontier AI\n(foundation models)", "GPU / ASIC\n(semiconductors)", "Data centers\n& Energy", "AI Robotics\n(amplifier)"],
-        "fig6_source": "Author's elaboration — Section 2.5",
-    },
-    "pt": {
-        "suffix": "PT-BR",
-        "fig1_title": "Arquitetura Metodológica do Estudo",
-        "fig1_retro": "COMPONENTE\nRETROSPECTIVO\n2020–2026",
-        "fig1_retro_sub": "Diagnóstico Empírico\n(Capítulo III)",
-        "fig1_prosp": "COMPONENTE\nPROSPECTIVO\n2026–2030",
-        "fig1_prosp_sub": "Cenários\n(Capítulo V)",
-        "fig1_sources": ["Fontes primárias\n(IEA, SIA, BIS)", "Fontes acadêmicas\n(Bruegel, Carnegie)", "Fontes industry\n(McKinsey, Deloitte)"],
-        "fig1_metrics": "6 Métricas\nde divergência\n+ CACI",
-        "fig1_scenarios": "4 Cenários\n(Matriz 2×2)",
-        "fig1_output": "Recomendações\n(Capítulo VII)",
-        "fig1_method": "Método misto: quantitativo descritivo + planejamento por cenários (Schwartz, 1991)",
-        "fig1_source": "Elaboração do autor — Seção 2.1",
-
-        "fig2_title": "Matriz 2×2 de Cenários 2026–2030",
-        "fig2_xaxis": "Capacidade de resposta europeia →",
-        "fig2_yaxis": "← Intensidade do protecionismo EUA",
-        "fig2_xlabels": ["UE PASSIVA", "UE ATIVA (resposta)"],
-        "fig2_ylabels": ["EUA status quo\nreforçado", "EUA endurecimento\nagressivo"],
-        "fig2_scenarios": [
-            ("A — Deriva lenta", "Gap estável\nDependência crescente\nVassalização suave"),
-            ("B — Recuperação parcial", "UE investe maciçamente\nGap reduzido\nAutonomia reforçada"),
-            ("C — Vassalização", "Cotas GPU UE\nProdutividade −25%\nDeslocalizações massivas"),
-            ("D — Guerra fria tecno.", "Fragmentação bloco\nCustos elevados\nAutonomia forçada"),
-        ],
-        "fig2_source": "Elaboração do autor — Seção 2.3, inspirado em Schwartz (1991)",
-
-        "fig3_title": "Painel: Seis Métricas de Divergência EUA/UE",
-        "fig3_metrics": ["M1\nCompute\nGap", "M2\nCusto relativo\ndo FLOP", "M3\nDependência\nCloud",
-                         "M4\nProdutividade\nIA setorial", "M5\nRestrição\nEnergética", "M6\nDeslocalizações\nIA"],
-        "fig3_values_label": "Situação atual (2025-2026)",
-        "fig3_values": ["×15\n(EUA/UE)", "×2-3\n(UE/EUA)", "~70%\nem infra EUA",
-                        "+12% EUA\nvs +3% UE", "Crítico\n(20% projetos\natrasados UE)", "~8%\nprojetos UE\npara EUA"],
-        "fig3_source": "Elaboração do autor — Seção 2.4.1",
-
-        "fig4_title": "Decomposição do Compute-Adjusted\nCompetitiveness Index (CACI)",
-        "fig4_formula": "CACI(r) = [ F(r) × E(r)⁻¹ ] / [ PIB(r) × L(r) ]",
-        "fig4_components": [
-            ("F(r)", "FLOPs IA instalados\ne acessíveis", "Epoch AI, CFG,\nTop500, Hawkins\net al. (2025)"),
-            ("E(r)⁻¹", "Inverso do custo\nenergético (€/MWh)", "Eurostat, EIA,\nIEA (2025)"),
-            ("PIB(r)", "Produto Interno\nBruto (normalização)", "Banco Mundial,\nEurostat"),
-            ("L(r)", "Capital humano IA\n(graduados STEM)", "OCDE, LinkedIn\nEconomic Graph"),
-        ],
-        "fig4_interpret": "Razão CACI(EUA)/CACI(UE) = vantagem competitiva relativa",
-        "fig4_source": "Elaboração do autor — Seção 2.4.2",
-        "fig4_numerator": "NUMERADOR\n(capacidade efetiva)",
-        "fig4_denominator": "DENOMINADOR\n(normalização)",
-
-        "fig5_title": "Triangulação de Fontes: Classificação e Vieses",
-        "fig5_cats": ["Fontes primárias\noficiais", "Fontes acadêmicas\n/ think tanks", "Fontes industry\n/ consultoria"],
-        "fig5_fiab": [9, 7.5, 5.5],
-        "fig5_couv": [6, 7, 8.5],
-        "fig5_biais": [3, 5, 8],
-        "fig5_fiab_label": "Confiabilidade factual",
-        "fig5_couv_label": "Cobertura de dados",
-        "fig5_biais_label": "Risco de viés",
-        "fig5_source": "Elaboração do autor — Seção 2.2",
-
-        "fig6_title": "Escopo do Estudo: Eixos Temporal, Geográfico\ne Tecnológico",
-        "fig6_time_label": "EIXO TEMPORAL",
-        "fig6_retro": "Diagnóstico retrospectivo\n2020 → 2026",
-        "fig6_prosp": "Projeção prospectiva\n2026 → 2030",
-        "fig6_geo_label": "EIXO GEOGRÁFICO",
-        "fig6_geo_main": ["Estados Unidos\n(foco principal)", "União Europeia\n(foco principal)", "França\n(foco específico)"],
-        "fig6_geo_sec": ["China\n(variável\ncontextual)", "Japão / Coreia\n/ Taiwan\n(cadeia suprim.)"],
-        "fig6_tech_label": "EIXO TECNOLÓGICO",
-        "fig6_tech": ["IA de fronteira\n(modelos fundação)", "GPU / ASIC\n(semicondutores)", "Data centers\n& Energia", "Robótica IA\n(amplificador)"],
-        "fig6_source": "Elaboração do autor — Seção 2.5",
-    }
-}
+# Un catalogue JSON par langue (locales/chapitre2/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 
 def setup_style():
-    plt.rcParams.update({
-        'font.family': 'DejaVu Sans',
-        'font.size': 11,
-        'axes.facecolor': BG_COLOR,
-        'figure.facecolor': 'white',
-        'axes.grid': False,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-    })
-
-
-def save_fig(fig, name, lang_suffix):
-    path = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}.png")
-    fig.savefig(path, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {path}")
-    return path
+    """Style commun, sans grille par défaut."""
+    afia_style.setup_style({'axes.grid': False})
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -633,7 +399,6 @@ def fig6_study_scope(L, lang_key):
 # MAIN
 # ═══════════════════════════════════════════════════════════════════════════
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
 
     print("=" * 70)
@@ -655,7 +420,7 @@ def main():
         all_files.append(fig6_study_scope(L, lang_key))
 
     print(f"\n{'='*70}")
-    print(f" Total : {len(all_files)} fichiers générés dans {OUTPUT_DIR}/")
+    print(f" Total : {len(all_files)} fichiers générés dans {afia_style.OUTPUT_DIR}/")
     print(f"{'='*70}")
 
     print("""
@@ -688,4 +453,5 @@ def main():
 
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
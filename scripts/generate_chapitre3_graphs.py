@@ -15,194 +15,23 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
 
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
+import afia_style
+from afia_style import US_COLOR, EU_COLOR, CN_COLOR, ACCENT1, save_fig
+
 
 # Couleurs
-US_COLOR = "#1B4F72"
-EU_COLOR = "#D4AC0D"
-CN_COLOR = "#C0392B"
-FR_COLOR = "#2E86C1"
-ACCENT1 = "#148F77"
 ACCENT2 = "#884EA0"
 ACCENT3 = "#E67E22"
 REST_COLOR = "#95A5A6"
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
-
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        # Fig 3.1 — Conso data centers par région
-        "f1_title": "Consommation électrique des data centers par région\n(2020–2030, TWh)",
-        "f1_ylabel": "TWh / an",
-        "f1_us": "États-Unis", "f1_cn": "Chine", "f1_eu": "UE", "f1_rest": "Reste du monde",
-        "f1_source": "Source : IEA Energy and AI (2025), Tableau 4 du chapitre",
-        "f1_proj": "← Projection →",
-
-        # Fig 3.2 — Ventes semi-conducteurs
-        "f2_title": "Ventes mondiales de semi-conducteurs 2020–2026\n(Md$, SIA/WSTS)",
-        "f2_ylabel": "Milliards USD",
-        "f2_logic": "Puces logiques (GPU, CPU, ASIC)",
-        "f2_memory": "Mémoires (DRAM, NAND)",
-        "f2_other": "Autres (analogique, discret, capteurs)",
-        "f2_source": "Sources : SIA/WSTS (fév. 2026), Tableau 5 du chapitre",
-        "f2_growth": "Croissance annuelle",
-
-        # Fig 3.3 — Répartition compute GPU
-        "f3_title": "Répartition géographique de la performance\ndes clusters GPU (2019–2025)",
-        "f3_ylabel": "Part de la performance mondiale (%)",
-        "f3_us": "États-Unis", "f3_cn": "Chine", "f3_eu": "UE", "f3_rest": "Reste du monde",
-        "f3_source": "Sources : Epoch AI / Pilz et al. (2025), GeoCoded/Sanchez (2025)",
-        "f3_note": "Ratio US/EU ≈ 15:1 en 2025",
-
-        # Fig 3.4 — Frise chronologique réglementaire
-        "f4_title": "Chronologie des mesures US sur les semi-conducteurs et l'IA\n(2022–2026) : de l'export control au protectionnisme tarifaire",
-        "f4_events": [
-            ("Oct.\n2022", "Export controls BIS\nGPU avancés, SME\nCible : Chine", "Biden"),
-            ("Oct.\n2023", "Renforcement seuils\n+40 pays, A800/H800\ncapturés", "Biden"),
-            ("Déc.\n2024", "Vague 3 : 24 types SME\nHBM, 140 entités", "Biden"),
-            ("Janv.\n2025", "AI Diffusion Rule\nModèles + Cloud\n120 pays, 3 tiers", "Biden"),
-            ("Juil.\n2025", "America's AI\nAction Plan\nDérégulation US", "Trump"),
-            ("Janv.\n2026", "Section 232\nTarif 25% GPU\nExemption US", "Trump"),
-        ],
-        "f4_source": "Sources : BIS, White House, Pillsbury Law (2026), Gibson Dunn (2026)",
-        "f4_phase_d": "Denial strategy\n(déni d'accès)",
-        "f4_phase_c": "Capture strategy\n(protectionnisme offensif)",
-
-        # Fig 3.5 — Calibration CACI
-        "f5_title": "Calibration du CACI : décomposition de l'avantage US\n(2024–2025)",
-        "f5_components": ["Compute\ninstallé\n(F ratio)", "Coût\nénergétique\n(E ratio)", "CACI\nrésultant\n(fourchette)"],
-        "f5_ylabel": "Ratio US / EU",
-        "f5_source": "Élaboration auteur — Section 3.3.3, données Epoch AI, IEA, Eurostat",
-
-        # Fig 3.6 — Synthèse indicateurs domination US
-        "f6_title": "Synthèse : indicateurs de la domination US\nen compute IA (2024–2025)",
-        "f6_indicators": ["Performance\nclusters GPU", "Secteur privé\ncompute IA", "Consommation\ndata centers",
-                          "Investissement\nIA 2025", "Puissance\npuces IA"],
-        "f6_us_vals": [75, 65, 45, 85, 70],
-        "f6_eu_vals": [5, 3, 15, 5, 4],
-        "f6_cn_vals": [15, 12, 25, 8, 18],
-        "f6_ylabel": "Part mondiale (%)",
-        "f6_source": "Sources : Epoch AI, IEA, GeoCoded/Sanchez, estimations auteur",
-    },
-    "en": {
-        "suffix": "EN",
-        "f1_title": "Data Center Electricity Consumption by Region\n(2020–2030, TWh)",
-        "f1_ylabel": "TWh / year",
-        "f1_us": "United States", "f1_cn": "China", "f1_eu": "EU", "f1_rest": "Rest of world",
-        "f1_source": "Source: IEA Energy and AI (2025), Chapter Table 4",
-        "f1_proj": "← Projection →",
-
-        "f2_title": "Global Semiconductor Sales 2020–2026\n(Bn$, SIA/WSTS)",
-        "f2_ylabel": "Billion USD",
-        "f2_logic": "Logic chips (GPU, CPU, ASIC)",
-        "f2_memory": "Memory (DRAM, NAND)",
-        "f2_other": "Other (analog, discrete, sensors)",
-        "f2_source": "Sources: SIA/WSTS (Feb. 2026), Chapter Table 5",
-        "f2_growth": "Annual growth",
-
-        "f3_title": "Geographic Distribution of GPU Cluster\nPerformance (2019–2025)",
-        "f3_ylabel": "Share of global performance (%)",
-        "f3_us": "United States", "f3_cn": "China", "f3_eu": "EU", "f3_rest": "Rest of world",
-        "f3_source": "Sources: Epoch AI / Pilz et al. (2025), GeoCoded/Sanchez (2025)",
-        "f3_note": "US/EU ratio ≈ 15:1 in 2025",
-
-        "f4_title": "Timeline of US Semiconductor & AI Measures\n(2022–2026): From Export Controls to Tariff Protectionism",
-        "f4_events": [
-            ("Oct.\n2022", "BIS Export Controls\nAdvanced GPUs, SME\nTarget: China", "Biden"),
-            ("Oct.\n2023", "Threshold update\n+40 countries, A800/H800\ncaptured", "Biden"),
-            ("Dec.\n2024", "Wave 3: 24 SME types\nHBM, 140 entities", "Biden"),
-            ("Jan.\n2025", "AI Diffusion Rule\nModels + Cloud\n120 countries, 3 tiers", "Biden"),
-            ("Jul.\n2025", "America's AI\nAction Plan\nUS deregulation", "Trump"),
-            ("Jan.\n2026", "Section 232\n25% GPU tariff\nUS exemption", "Trump"),
-        ],
-        "f4_source": "Sources: BIS, White House, Pillsbury Law (2026), Gibson Dunn (2026)",
-        "f4_phase_d": "Denial strategy\n(access denial)",
-        "f4_phase_c": "Capture strategy\n(offensive protectionism)",
-
-        "f5_title": "CACI Calibration: Decomposition of US Advantage\n(2024–2025)",
-        "f5_components": ["Installed\ncompute\n(F ratio)", "Energy\ncost\n(E ratio)", "Resulting\nCACI\n(range)"],
-        "f5_ylabel": "US / EU Ratio",
-        "f5_source": "Author's elaboration — Section 3.3.3, Epoch AI, IEA, Eurostat data",
-
-        "f6_title": "Summary: US Dominance Indicators\nin AI Compute (2024–2025)",
-        "f6_indicators": ["GPU cluster\nperformance", "Private sector\nAI compute", "Data center\nconsumption",
-                          "AI investment\n2025", "AI chip\npower"],
-        "f6_us_vals": [75, 65, 45, 85, 70],
-        "f6_eu_vals": [5, 3, 15, 5, 4],
-        "f6_cn_vals": [15, 12, 25, 8, 18],
-        "f6_ylabel": "Global share (%)",
-        "f6_source": "Sources: Epoch AI, IEA, GeoCoded/Sanchez, author estimates",
-    },
-    "pt": {
-        "suffix": "PT-BR",
-        "f1_title": "Consumo de Eletricidade em Data Centers por Região\n(2020–2030, TWh)",
-        "f1_ylabel": "TWh / ano",
-        "f1_us": "Estados Unidos", "f1_cn": "China", "f1_eu": "UE", "f1_rest": "Resto do mundo",
-        "f1_source": "Fonte: IEA Energy and AI (2025), Tabela 4 do capítulo",
-        "f1_proj": "← Projeção →",
-
-        "f2_title": "Vendas Globais de Semicondutores 2020–2026\n(Bi$, SIA/WSTS)",
-        "f2_ylabel": "Bilhões USD",
-        "f2_logic": "Chips lógicos (GPU, CPU, ASIC)",
-        "f2_memory": "Memórias (DRAM, NAND)",
-        "f2_other": "Outros (analógico, discreto, sensores)",
-        "f2_source": "Fontes: SIA/WSTS (fev. 2026), Tabela 5 do capítulo",
-        "f2_growth": "Crescimento anual",
-
-        "f3_title": "Distribuição Geográfica do Desempenho\ndos Clusters GPU (2019–2025)",
-        "f3_ylabel": "Participação no desempenho global (%)",
-        "f3_us": "Estados Unidos", "f3_cn": "China", "f3_eu": "UE", "f3_rest": "Resto do mundo",
-        "f3_source": "Fontes: Epoch AI / Pilz et al. (2025), GeoCoded/Sanchez (2025)",
-        "f3_note": "Razão EUA/UE ≈ 15:1 em 2025",
-
-        "f4_title": "Cronologia das Medidas dos EUA sobre Semicondutores e IA\n(2022–2026): Do Controle de Exportação ao Protecionismo Tarifário",
-        "f4_events": [
-            ("Out.\n2022", "Controles BIS\nGPUs avançadas, SME\nAlvo: China", "Biden"),
-            ("Out.\n2023", "Atualização limites\n+40 países, A800/H800\ncapturados", "Biden"),
-            ("Dez.\n2024", "Onda 3: 24 tipos SME\nHBM, 140 entidades", "Biden"),
-            ("Jan.\n2025", "AI Diffusion Rule\nModelos + Cloud\n120 países, 3 níveis", "Biden"),
-            ("Jul.\n2025", "America's AI\nAction Plan\nDesregulação EUA", "Trump"),
-            ("Jan.\n2026", "Seção 232\nTarifa 25% GPU\nIsenção EUA", "Trump"),
-        ],
-        "f4_source": "Fontes: BIS, White House, Pillsbury Law (2026), Gibson Dunn (2026)",
-        "f4_phase_d": "Denial strategy\n(negação de acesso)",
-        "f4_phase_c": "Capture strategy\n(protecionismo ofensivo)",
-
-        "f5_title": "Calibração do CACI: Decomposição da Vantagem EUA\n(2024–2025)",
-        "f5_components": ["Compute\ninstalado\n(razão F)", "Custo\nenergético\n(razão E)", "CACI\nresultante\n(faixa)"],
-        "f5_ylabel": "Razão EUA / UE",
-        "f5_source": "Elaboração do autor — Seção 3.3.3, dados Epoch AI, IEA, Eurostat",
-
-        "f6_title": "Síntese: Indicadores de Dominância dos EUA\nem Compute IA (2024–2025)",
-        "f6_indicators": ["Desempenho\nclusters GPU", "Setor privado\ncompute IA", "Consumo\ndata centers",
-                          "Investimento\nIA 2025", "Potência\nchips IA"],
-        "f6_us_vals": [75, 65, 45, 85, 70],
-        "f6_eu_vals": [5, 3, 15, 5, 4],
-        "f6_cn_vals": [15, 12, 25, 8, 18],
-        "f6_ylabel": "Participação global (%)",
-        "f6_source": "Fontes: Epoch AI, IEA, GeoCoded/Sanchez, estimativas do autor",
-    }
-}
 
+# Un catalogue JSON par langue (locales/chapitre3/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
-def setup_style():
-    plt.rcParams.update({
-        'font.family': 'DejaVu Sans', 'font.size': 11,
-        'axes.facecolor': BG_COLOR, 'figure.facecolor': 'white',
-        'axes.grid': True, 'grid.color': GRID_COLOR, 'grid.alpha': 0.5,
-        'axes.spines.top': False, 'axes.spines.right': False,
-    })
 
-def save_fig(fig, name, sfx):
-    p = os.path.join(OUTPUT_DIR, f"{name}_{sfx}.png")
-    fig.savefig(p, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {p}")
-    return p
+def setup_style():
+    """Style commun, grille plus légère."""
+    afia_style.setup_style({'grid.alpha': 0.5})
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -484,7 +313,6 @@ def fig6_dominance_synthesis(L, lk):
 
 # ═══════════════════════════════════════════════════════════════════════════
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
 
     print("=" * 70)
@@ -530,4 +358,5 @@ def main():
     return all_files
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
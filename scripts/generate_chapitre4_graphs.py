@@ -12,158 +12,21 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
 
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
+import afia_style
+from afia_style import US_COLOR, EU_COLOR, FR_COLOR, CN_COLOR, ACCENT1, save_fig
 
-US_COLOR = "#1B4F72"; EU_COLOR = "#D4AC0D"; CN_COLOR = "#C0392B"
-FR_COLOR = "#2E86C1"; ACCENT1 = "#148F77"; ACCENT2 = "#884EA0"
+
+ACCENT2 = "#884EA0"
 ACCENT3 = "#E67E22"; ACCENT4 = "#2C3E50"; REST_COLOR = "#95A5A6"
-BG_COLOR = "#FAFBFC"; GRID_COLOR = "#E0E0E0"
-
-LANGS = {
-  "fr": {
-    "suffix": "FR",
-    # Fig 4.1 — Coûts training exponentiels
-    "f1_title": "Explosion des coûts d'entraînement des modèles IA\n(2017–2030, estimation)",
-    "f1_ylabel": "Coût d'entraînement (USD, échelle log)",
-    "f1_source": "Sources : Epoch AI, Martens/Bruegel (2024), Cottier et al. (2024)",
-    "f1_note": "Infrastructure ≈ 10× coût training",
-    # Fig 4.2 — Cloud EU dominé par US
-    "f2_title": "Marché cloud européen : domination des hyperscalers US\n(2017–2024)",
-    "f2_ylabel": "Milliards € / Part de marché (%)",
-    "f2_us3": "AWS + Azure + GCP", "f2_eu": "Fournisseurs EU", "f2_other": "Autres",
-    "f2_market": "Taille marché (€ Md)", "f2_source": "Source : Synergy Research Group (juil. 2025)",
-    # Fig 4.3 — Gap productivité
-    "f3_title": "Productivité IA : potentiel théorique vs réalisable\n(États-Unis vs Union Européenne)",
-    "f3_ylabel": "Croissance productivité (%/an)",
-    "f3_cats": ["Potentiel\nthéorique\n(scén. accéléré)", "Potentiel\nréalisable\n(sous contrainte\ncompute)"],
-    "f3_us": "États-Unis", "f3_eu": "Union Européenne",
-    "f3_gap": "Gap\n−1,5 à −2\npts/an",
-    "f3_source": "Sources : McKinsey (2024, 2025), FMI (2025), calibration CACI auteur",
-    # Fig 4.4 — Chaîne de valeur IA gen (présence EU)
-    "f4_title": "Chaîne de valeur de l'IA générative :\nprésence européenne par segment",
-    "f4_segments": ["Semi-conducteurs\nIA (GPU/ASIC)", "Plateformes\nCloud IA", "Modèles de\nfondation",
-                    "Outils de\ndéveloppement", "Applications\nsectorielles", "Semi-conducteurs\nspécialisés",
-                    "Intégration\nindustrielle", "Services\nprofessionnels"],
-    "f4_eu_presence": [2, 5, 8, 10, 70, 55, 65, 50],  # % EU presence
-    "f4_ylabel": "Présence européenne estimée (%)",
-    "f4_source": "Sources : McKinsey (2024), Omdia/Informa, estimations auteur",
-    "f4_absent": "EU quasi\nabsente", "f4_compet": "EU\ncompétitive",
-    # Fig 4.5 — Cercle vicieux renforçant
-    "f5_title": "Le cercle auto-renforçant de l'avantage concurrentiel US",
-    "f5_boxes": ["ASYMÉTRIE\nDE COMPUTE\n(×15 US/EU)",
-                 "COÛTS TRAINING\nDIFFÉRENCIÉS\n(×2,4–3,6)",
-                 "DÉPENDANCE\nCLOUD US\n(70% marché EU)",
-                 "PRODUCTIVITÉ\nCONTRAINTE\n(−1,5 pts/an)",
-                 "CAPTATION\nDES RENTES\n(first-mover)"],
-    "f5_center": "PROTECTIONNISME\nSECTION 232\n(institutionnalise\nl'avantage)",
-    "f5_source": "Élaboration auteur — Synthèse §4.5",
-    # Fig 4.6 — Déficit investissement EU vs US
-    "f6_title": "Écart d'investissement technologique\nÉtats-Unis vs Europe (2021–2025)",
-    "f6_cats": ["R&D + Capex\ncorporate\n(annuel)", "Startups &\nScale-ups\n(annuel)", "Infrastructure\nIA 2025\n(Big Tech)",
-                "Capex cloud\nen Europe\n(US providers)"],
-    "f6_us": [1200, 380, 320, 40],  # Md$
-    "f6_eu": [500, 80, 20, 5],
-    "f6_ylabel": "Milliards USD / an",
-    "f6_source": "Sources : McKinsey (2026), IEA (2025), Synergy Research (2025)",
-    "f6_us_label": "États-Unis", "f6_eu_label": "Union Européenne",
-  },
-  "en": {
-    "suffix": "EN",
-    "f1_title": "Explosion of AI Model Training Costs\n(2017–2030, estimate)",
-    "f1_ylabel": "Training cost (USD, log scale)",
-    "f1_source": "Sources: Epoch AI, Martens/Bruegel (2024), Cottier et al. (2024)",
-    "f1_note": "Infrastructure ≈ 10× training cost",
-    "f2_title": "European Cloud Market: US Hyperscaler Dominance\n(2017–2024)",
-    "f2_ylabel": "Billion € / Market share (%)",
-    "f2_us3": "AWS + Azure + GCP", "f2_eu": "EU providers", "f2_other": "Others",
-    "f2_market": "Market size (€ Bn)", "f2_source": "Source: Synergy Research Group (Jul. 2025)",
-    "f3_title": "AI Productivity: Theoretical vs Achievable Potential\n(United States vs European Union)",
-    "f3_ylabel": "Productivity growth (%/year)",
-    "f3_cats": ["Theoretical\npotential\n(accelerated sc.)", "Achievable\npotential\n(compute-\nconstrained)"],
-    "f3_us": "United States", "f3_eu": "European Union",
-    "f3_gap": "Gap\n−1.5 to −2\npts/year",
-    "f3_source": "Sources: McKinsey (2024, 2025), IMF (2025), author CACI calibration",
-    "f4_title": "Generative AI Value Chain:\nEuropean Presence by Segment",
-    "f4_segments": ["AI Semiconductors\n(GPU/ASIC)", "Cloud AI\nPlatforms", "Foundation\nModels",
-                    "Development\nTools", "Sectoral\nApplications", "Specialized\nSemiconductors",
-                    "Industrial\nIntegration", "Professional\nServices"],
-    "f4_eu_presence": [2, 5, 8, 10, 70, 55, 65, 50],
-    "f4_ylabel": "Estimated European presence (%)",
-    "f4_source": "Sources: McKinsey (2024), Omdia/Informa, author estimates",
-    "f4_absent": "EU nearly\nabsent", "f4_compet": "EU\ncompetitive",
-    "f5_title": "The Self-Reinforcing Cycle of US Competitive Advantage",
-    "f5_boxes": ["COMPUTE\nASYMMETRY\n(×15 US/EU)",
-                 "DIFFERENTIATED\nTRAINING COSTS\n(×2.4–3.6)",
-                 "US CLOUD\nDEPENDENCE\n(70% EU market)",
-                 "CONSTRAINED\nPRODUCTIVITY\n(−1.5 pts/yr)",
-                 "RENT\nCAPTURE\n(first-mover)"],
-    "f5_center": "SECTION 232\nPROTECTIONISM\n(institutionalizes\nadvantage)",
-    "f5_source": "Author's elaboration — Synthesis §4.5",
-    "f6_title": "Technology Investment Gap\nUnited States vs Europe (2021–2025)",
-    "f6_cats": ["R&D + Capex\ncorporate\n(annual)", "Startups &\nScale-ups\n(annual)", "AI Infrastructure\n2025\n(Big Tech)",
-                "Cloud capex\nin Europe\n(US providers)"],
-    "f6_us": [1200, 380, 320, 40],
-    "f6_eu": [500, 80, 20, 5],
-    "f6_ylabel": "Billion USD / year",
-    "f6_source": "Sources: McKinsey (2026), IEA (2025), Synergy Research (2025)",
-    "f6_us_label": "United States", "f6_eu_label": "European Union",
-  },
-  "pt": {
-    "suffix": "PT-BR",
-    "f1_title": "Explosão dos Custos de Treinamento de Modelos IA\n(2017–2030, estimativa)",
-    "f1_ylabel": "Custo de treinamento (USD, escala log)",
-    "f1_source": "Fontes: Epoch AI, Martens/Bruegel (2024), Cottier et al. (2024)",
-    "f1_note": "Infraestrutura ≈ 10× custo treinamento",
-    "f2_title": "Mercado Cloud Europeu: Dominância dos Hyperscalers EUA\n(2017–2024)",
-    "f2_ylabel": "Bilhões € / Participação de mercado (%)",
-    "f2_us3": "AWS + Azure + GCP", "f2_eu": "Provedores UE", "f2_other": "Outros",
-    "f2_market": "Tamanho mercado (€ Bi)", "f2_source": "Fonte: Synergy Research Group (jul. 2025)",
-    "f3_title": "Produtividade IA: Potencial Teórico vs Realizável\n(Estados Unidos vs União Europeia)",
-    "f3_ylabel": "Crescimento produtividade (%/ano)",
-    "f3_cats": ["Potencial\nteórico\n(cen. acelerado)", "Potencial\nrealizável\n(sob restrição\ncompute)"],
-    "f3_us": "Estados Unidos", "f3_eu": "União Europeia",
-    "f3_gap": "Gap\n−1,5 a −2\npts/ano",
-    "f3_source": "Fontes: McKinsey (2024, 2025), FMI (2025), calibração CACI autor",
-    "f4_title": "Cadeia de Valor da IA Generativa:\nPresença Europeia por Segmento",
-    "f4_segments": ["Semicondutores\nIA (GPU/ASIC)", "Plataformas\nCloud IA", "Modelos de\nFundação",
-                    "Ferramentas de\nDesenvolvimento", "Aplicações\nSetoriais", "Semicondutores\nEspecializados",
-                    "Integração\nIndustrial", "Serviços\nProfissionais"],
-    "f4_eu_presence": [2, 5, 8, 10, 70, 55, 65, 50],
-    "f4_ylabel": "Presença europeia estimada (%)",
-    "f4_source": "Fontes: McKinsey (2024), Omdia/Informa, estimativas do autor",
-    "f4_absent": "UE quase\nausente", "f4_compet": "UE\ncompetitiva",
-    "f5_title": "O Ciclo Auto-Reforçante da Vantagem Competitiva dos EUA",
-    "f5_boxes": ["ASSIMETRIA\nDE COMPUTE\n(×15 EUA/UE)",
-                 "CUSTOS TRAINING\nDIFERENCIADOS\n(×2,4–3,6)",
-                 "DEPENDÊNCIA\nCLOUD EUA\n(70% mercado UE)",
-                 "PRODUTIVIDADE\nRESTRINGIDA\n(−1,5 pts/ano)",
-                 "CAPTURA\nDE RENDAS\n(first-mover)"],
-    "f5_center": "PROTECIONISMO\nSEÇÃO 232\n(institucionaliza\na vantagem)",
-    "f5_source": "Elaboração do autor — Síntese §4.5",
-    "f6_title": "Déficit de Investimento Tecnológico\nEstados Unidos vs Europa (2021–2025)",
-    "f6_cats": ["P&D + Capex\ncorporativo\n(anual)", "Startups &\nScale-ups\n(anual)", "Infraestrutura\nIA 2025\n(Big Tech)",
-                "Capex cloud\nna Europa\n(provedores EUA)"],
-    "f6_us": [1200, 380, 320, 40],
-    "f6_eu": [500, 80, 20, 5],
-    "f6_ylabel": "Bilhões USD / ano",
-    "f6_source": "Fontes: McKinsey (2026), IEA (2025), Synergy Research (2025)",
-    "f6_us_label": "Estados Unidos", "f6_eu_label": "União Europeia",
-  }
-}
+
+# Un catalogue JSON par langue (locales/chapitre4/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 def setup_style():
-    plt.rcParams.update({'font.family':'DejaVu Sans','font.size':11,
-        'axes.facecolor':BG_COLOR,'figure.facecolor':'white',
-        'axes.grid':True,'grid.color':GRID_COLOR,'grid.alpha':0.5,
-        'axes.spines.top':False,'axes.spines.right':False})
+    """Style commun, grille plus légère."""
+    afia_style.setup_style({'grid.alpha': 0.5})
 
-def save_fig(fig, name, sfx):
-    p = os.path.join(OUTPUT_DIR, f"{name}_{sfx}.png")
-    fig.savefig(p, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig); print(f"  ✓ {p}"); return p
 
 # ═══════════════════════════════════════════════════════════════════════════
 # FIG 4.1 — Coûts training exponentiels (log scale)
@@ -421,7 +284,6 @@ def fig6_investment_gap(L, lk):
 
 
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
     print("="*70+"\n CHAPITRE IV — Génération des graphiques en 3 langues\n"+"="*70)
     all_files = []
@@ -462,4 +324,5 @@ def main():
     return all_files
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
@@ -10,151 +10,20 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
-import os
 
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
-US_COLOR="#1B4F72"; EU_COLOR="#D4AC0D"; CN_COLOR="#C0392B"
-ACCENT1="#148F77"; ACCENT2="#884EA0"; ACCENT3="#E67E22"; ACCENT4="#2C3E50"
+import afia_style
+from afia_style import US_COLOR, CN_COLOR, save_fig
+
+ACCENT2="#884EA0"; ACCENT3="#E67E22"; ACCENT4="#2C3E50"
 SC_A="#3498DB"; SC_B="#E74C3C"; SC_C="#27AE60"; SC_D="#8E44AD"
-BG_COLOR="#FAFBFC"; GRID_COLOR="#E0E0E0"
-
-LANGS = {
- "fr": {
-  "suffix":"FR",
-  # Fig 5.1 — Trajectoire CACI 4 scénarios (G5)
-  "f1_title":"Trajectoires du ratio CACI(US)/CACI(EU)\n2025–2030 par scénario",
-  "f1_ylabel":"Ratio CACI(US) / CACI(EU)",
-  "f1_sc":["A — Statu quo renforcé","B — Fracture numérique","C — Partenariat asymétrique","D — Souveraineté contestée"],
-  "f1_source":"Élaboration auteur — Section 5.7.1, calibration CACI",
-  "f1_danger":"Zone de décrochage\nirréversible",
-  # Fig 5.2 — Points de bascule chronologie (G6)
-  "f2_title":"Chronologie des points de bascule 2026–2030\net fenêtres décisionnelles",
-  "f2_events":[
-    ("Avr.\n2026","Rapport Phase 1\nNégociations US-UE","Modéré\nvs Agressif"),
-    ("Juil.\n2026","Rapport Commerce\nSur semi data centers","Extension\ntarifs ?"),
-    ("2027","Premières Gigafactories\nopérationnelles ?","Proactif\nvs Réactif"),
-    ("2028","POINT CRITIQUE\nDemande > Capacité EU","Moment de\nvérité"),
-    ("2029-30","Premiers SMR nucléaires\nRISC-V maturité ?","Autonomie\nà long terme"),
-  ],
-  "f2_source":"Élaboration auteur — Section 5.7.2-5.7.3",
-  "f2_window":"Fenêtre décisionnelle critique",
-  # Fig 5.3 — Heatmap 6 métriques × 4 scénarios
-  "f3_title":"Synthèse : 6 métriques × 4 scénarios (2030)",
-  "f3_metrics":["M1 Compute\nratio","M2 Coût\nFLOP","M3 Cloud\nUS (%)","M4 Product.\nEU (%/an)","M5 Énergie\nEU (TWh)","M6 CACI\nratio"],
-  "f3_scenarios":["A\nStatu quo","B\nFracture","C\nPartenariat","D\nSouveraineté"],
-  "f3_source":"Élaboration auteur — Tableau 11",
-  # Fig 5.4 — Éléments prédéterminés
-  "f4_title":"Les 4 éléments prédéterminés (EP)\nstructurant tous les scénarios",
-  "f4_items":[("EP1","Croissance exponentielle\ndemande compute IA","Ventes semis ×2 en 2 ans\nPuces IA doublent / 7 mois"),
-              ("EP2","Concentration persistante\ncompute aux USA","Ratio 15:1 US/EU\nDélais data centers 18-36 mois"),
-              ("EP3","Tension énergétique\ncroissante","415→945 TWh (2024→2030)\nCoûts EU 2-3× plus élevés"),
-              ("EP4","Section 232\nen place","Base légale confirmée\nRapport Commerce juil. 2026")],
-  "f4_source":"Élaboration auteur — Section 5.1",
-  # Fig 5.5 — M1 Compute ratio par scénario (barres)
-  "f5_title":"Ratio compute installé US/EU (M1)\nProjection 2030 par scénario",
-  "f5_ylabel":"Ratio US / EU",
-  "f5_baseline":"2025\n(actuel)",
-  "f5_source":"Élaboration auteur — Sections 5.3-5.6",
-  # Fig 5.6 — Matrice 2×2 actualisée avec probabilités
-  "f6_title":"Matrice 2×2 actualisée : scénarios, probabilités\net CACI 2030",
-  "f6_prob":["40-50%","15-20%","15-20%","15-20%"],
-  "f6_caci":["10-15:1","20-35:1","4-7:1","8-12:1"],
-  "f6_xlabels":["EU RÉACTIVE","EU PROACTIVE"],
-  "f6_ylabels":["US MODÉRÉ","US AGRESSIF"],
-  "f6_scenarios":["A — Statu quo\nrenforcé","B — Fracture\nnumérique","C — Partenariat\nasymétrique","D — Souveraineté\ncontestée"],
-  "f6_source":"Élaboration auteur — Section 5.7",
- },
- "en": {
-  "suffix":"EN",
-  "f1_title":"CACI(US)/CACI(EU) Ratio Trajectories\n2025–2030 by Scenario",
-  "f1_ylabel":"CACI(US) / CACI(EU) Ratio",
-  "f1_sc":["A — Reinforced Status Quo","B — Digital Fracture","C — Asymmetric Partnership","D — Contested Sovereignty"],
-  "f1_source":"Author's elaboration — Section 5.7.1, CACI calibration",
-  "f1_danger":"Irreversible\ndecoupling zone",
-  "f2_title":"Tipping Points Timeline 2026–2030\nand Decision Windows",
-  "f2_events":[
-    ("Apr.\n2026","Phase 1 Report\nUS-EU Negotiations","Moderate\nvs Aggressive"),
-    ("Jul.\n2026","Commerce Report\nOn DC semiconductors","Tariff\nextension?"),
-    ("2027","First Gigafactories\noperational?","Proactive\nvs Reactive"),
-    ("2028","CRITICAL POINT\nDemand > EU Capacity","Moment of\ntruth"),
-    ("2029-30","First nuclear SMRs\nRISC-V maturity?","Long-term\nautonomy"),
-  ],
-  "f2_source":"Author's elaboration — Section 5.7.2-5.7.3",
-  "f2_window":"Critical decision window",
-  "f3_title":"Summary: 6 Metrics × 4 Scenarios (2030)",
-  "f3_metrics":["M1 Compute\nratio","M2 FLOP\ncost","M3 US Cloud\n(%)","M4 EU Prod.\n(%/yr)","M5 EU Energy\n(TWh)","M6 CACI\nratio"],
-  "f3_scenarios":["A\nStatus Quo","B\nFracture","C\nPartnership","D\nSovereignty"],
-  "f3_source":"Author's elaboration — Table 11",
-  "f4_title":"The 4 Predetermined Elements (PE)\nStructuring All Scenarios",
-  "f4_items":[("PE1","Exponential growth\nAI compute demand","Semi sales ×2 in 2 yrs\nAI chips double / 7 months"),
-              ("PE2","Persistent US\ncompute concentration","15:1 US/EU ratio\nDC build delays 18-36 months"),
-              ("PE3","Growing energy\ntension","415→945 TWh (2024→2030)\nEU costs 2-3× higher"),
-              ("PE4","Section 232\nin place","Legal basis confirmed\nCommerce report Jul. 2026")],
-  "f4_source":"Author's elaboration — Section 5.1",
-  "f5_title":"Installed Compute Ratio US/EU (M1)\n2030 Projection by Scenario",
-  "f5_ylabel":"US / EU Ratio",
-  "f5_baseline":"2025\n(current)",
-  "f5_source":"Author's elaboration — Sections 5.3-5.6",
-  "f6_title":"Updated 2×2 Matrix: Scenarios, Probabilities\nand CACI 2030",
-  "f6_prob":["40-50%","15-20%","15-20%","15-20%"],
-  "f6_caci":["10-15:1","20-35:1","4-7:1","8-12:1"],
-  "f6_xlabels":["EU REACTIVE","EU PROACTIVE"],
-  "f6_ylabels":["US MODERATE","US AGGRESSIVE"],
-  "f6_scenarios":["A — Reinforced\nStatus Quo","B — Digital\nFracture","C — Asymmetric\nPartnership","D — Contested\nSovereignty"],
-  "f6_source":"Author's elaboration — Section 5.7",
- },
- "pt": {
-  "suffix":"PT-BR",
-  "f1_title":"Trajetórias do Ratio CACI(EUA)/CACI(UE)\n2025–2030 por Cenário",
-  "f1_ylabel":"Razão CACI(EUA) / CACI(UE)",
-  "f1_sc":["A — Status Quo Reforçado","B — Fratura Digital","C — Parceria Assimétrica","D — Soberania Contestada"],
-  "f1_source":"Elaboração do autor — Seção 5.7.1, calibração CACI",
-  "f1_danger":"Zona de desacoplamento\nirreversível",
-  "f2_title":"Cronologia dos Pontos de Inflexão 2026–2030\ne Janelas Decisórias",
-  "f2_events":[
-    ("Abr.\n2026","Relatório Fase 1\nNegociações EUA-UE","Moderado\nvs Agressivo"),
-    ("Jul.\n2026","Relatório Comércio\nSobre semi DCs","Extensão\ntarifas?"),
-    ("2027","Primeiras Gigafábricas\noperacionais?","Proativo\nvs Reativo"),
-    ("2028","PONTO CRÍTICO\nDemanda > Capacidade UE","Momento da\nverdade"),
-    ("2029-30","Primeiros SMRs nucleares\nRISC-V maturidade?","Autonomia\nlongo prazo"),
-  ],
-  "f2_source":"Elaboração do autor — Seção 5.7.2-5.7.3",
-  "f2_window":"Janela decisória crítica",
-  "f3_title":"Síntese: 6 Métricas × 4 Cenários (2030)",
-  "f3_metrics":["M1 Razão\ncompute","M2 Custo\nFLOP","M3 Cloud\nEUA (%)","M4 Prod.\nUE (%/ano)","M5 Energia\nUE (TWh)","M6 Razão\nCACI"],
-  "f3_scenarios":["A\nStatus Quo","B\nFratura","C\nParceria","D\nSoberania"],
-  "f3_source":"Elaboração do autor — Tabela 11",
-  "f4_title":"Os 4 Elementos Predeterminados (EP)\nEstruturando Todos os Cenários",
-  "f4_items":[("EP1","Crescimento exponencial\ndemanda compute IA","Vendas semi ×2 em 2 anos\nChips IA dobram / 7 meses"),
-              ("EP2","Concentração persistente\ncompute nos EUA","Razão 15:1 EUA/UE\nPrazos DCs 18-36 meses"),
-              ("EP3","Tensão energética\ncrescente","415→945 TWh (2024→2030)\nCustos UE 2-3× mais altos"),
-              ("EP4","Seção 232\nem vigor","Base legal confirmada\nRelatório Comércio jul. 2026")],
-  "f4_source":"Elaboração do autor — Seção 5.1",
-  "f5_title":"Razão Compute Instalado EUA/UE (M1)\nProjeção 2030 por Cenário",
-  "f5_ylabel":"Razão EUA / UE",
-  "f5_baseline":"2025\n(atual)",
-  "f5_source":"Elaboração do autor — Seções 5.3-5.6",
-  "f6_title":"Matriz 2×2 Atualizada: Cenários, Probabilidades\ne CACI 2030",
-  "f6_prob":["40-50%","15-20%","15-20%","15-20%"],
-  "f6_caci":["10-15:1","20-35:1","4-7:1","8-12:1"],
-  "f6_xlabels":["UE REATIVA","UE PROATIVA"],
-  "f6_ylabels":["EUA MODERADO","EUA AGRESSIVO"],
-  "f6_scenarios":["A — Status Quo\nReforçado","B — Fratura\nDigital","C — Parceria\nAssimétrica","D — Soberania\nContestada"],
-  "f6_source":"Elaboração do autor — Seção 5.7",
- }
-}
+
+# Un catalogue JSON par langue (locales/chapitre5/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 def setup_style():
-    plt.rcParams.update({'font.family':'DejaVu Sans','font.size':11,
-        'axes.facecolor':BG_COLOR,'figure.facecolor':'white',
-        'axes.grid':True,'grid.color':GRID_COLOR,'grid.alpha':0.5,
-        'axes.spines.top':False,'axes.spines.right':False})
+    """Style commun, grille plus légère."""
+    afia_style.setup_style({'grid.alpha': 0.5})
 
-def save_fig(fig, name, sfx):
-    p=os.path.join(OUTPUT_DIR,f"{name}_{sfx}.png")
-    fig.savefig(p,dpi=DPI,bbox_inches='tight',facecolor='white',edgecolor='none')
-    plt.close(fig); print(f"  ✓ {p}"); return p
 
 # ═══════════════════════════════════════════════════════════════════════════
 # FIG 5.1 — Trajectoires CACI (G5 du texte)
@@ -396,7 +265,6 @@ def fig6_updated_matrix(L, lk):
 
 
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
     print("="*70+"\n CHAPITRE V — Génération des graphiques en 3 langues\n"+"="*70)
     all_files = []
@@ -437,4 +305,5 @@ def main():
     return all_files
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
@@ -10,119 +10,21 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
-import os
 
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
-US_COLOR="#1B4F72"; EU_COLOR="#D4AC0D"; CN_COLOR="#C0392B"
-FR_COLOR="#2E86C1"; ACCENT1="#148F77"; ACCENT2="#884EA0"
+import afia_style
+from afia_style import US_COLOR, FR_COLOR, CN_COLOR, ACCENT1, save_fig
+
+ACCENT2="#884EA0"
 ACCENT3="#E67E22"; ACCENT4="#2C3E50"; REST_COLOR="#95A5A6"
 SC_A="#3498DB"; SC_B="#E74C3C"; SC_C="#27AE60"; SC_D="#8E44AD"
-BG_COLOR="#FAFBFC"; GRID_COLOR="#E0E0E0"
-
-LANGS = {
- "fr": {
-  "suffix":"FR",
-  # Fig 6.1 — Exposition sectorielle (Tableau 12)
-  "f1_title":"Exposition sectorielle française\nà l'asymétrie de compute IA",
-  "f1_sectors":["Finance","Auto / Aéro","Santé / Pharma","Robotique / Indus.","Défense / Spatial"],
-  "f1_dims":["Intensité\ncompute","Sensibilité\ndonnées","Dépendance\ncloud US","Risque\nscénario B"],
-  "f1_source":"Élaboration auteur — Tableau 12",
-  # Fig 6.2 — Atouts vs Vulnérabilités France (Tableau 13)
-  "f2_title":"Bilan stratégique France :\natouts vs vulnérabilités dans le contexte IA",
-  "f2_atouts":["Énergie nucléaire\n65-70% mix\ncoût compétitif","Mistral AI\n€11,7 Md valoris.\nMistral Compute","Formation\nd'excellence\nENS, X, INRIA","109 Md€\nengagements\nprivés IA","1ère destination\nEU investiss.\nIA (5 ans)","AI Act :\nconformité\npar design"],
-  "f2_vulner":["Pas de champion\nhardware IA\n(GPU/ASIC)","Compute : ~5%\nglobal\nratio US/FR ~30:1","Brain drain\npost-doctorat\nvers US","Permitting lent\n24+ mois\nréseau saturé","Dépendance\ncloud US\n70-80%","AI Act :\nsurcoûts\nincertitude"],
-  "f2_source":"Élaboration auteur — Tableau 13",
-  "f2_col_a":"ATOUTS","f2_col_v":"VULNÉRABILITÉS",
-  # Fig 6.3 — Trois configurations France 2030
-  "f3_title":"La France face à trois futurs à l'horizon 2030",
-  "f3_configs":[
-    ("Config. 1","Consommatrice\ndépendante","Scénarios A & B\nAdoption IA via cloud US\nDépendance croissante\nÉcart productivité\n+5 à +15 pts cumulés"),
-    ("Config. 2","Hub énergétique\net applicatif","Scénario C\nAvantage nucléaire\nCompute local\nSouveraine en application\nÉcart contenu 1-2 pts"),
-    ("Config. 3","Pilier souveraineté\neuropéenne","Scénario D\nMobilisation inédite\n20 GW nucléaire dédié\nRISC-V / DARE\nPériode vulnérable 26-28"),
-  ],
-  "f3_source":"Élaboration auteur — Section 6.5",
-  # Fig 6.4 — Impact par type d'acteur
-  "f4_title":"Impact différencié par type d'acteur français\n(scénarios A/B vs C/D)",
-  "f4_actors":["Grands\ngroupes\n(CAC 40)","PME / ETI\nindustrielles","Startups IA\n(Mistral...)","Secteur\npublic\n/ Défense"],
-  "f4_source":"Élaboration auteur — Section 6.2",
-  # Fig 6.5 — Écosystème startup France
-  "f5_title":"Écosystème startup IA français :\nacteurs clés et positionnement",
-  "f5_source":"Sources : Mistral AI, Dealroom, CrunchBase (2025-2026)",
-  # Fig 6.6 — Productivité sectorielle impact scénarios
-  "f6_title":"Impact sur la productivité sectorielle française\nselon les scénarios (variation %/an par rapport au potentiel)",
-  "f6_sectors":["Finance","Auto/Aéro","Santé","Robotique","Défense"],
-  "f6_ylabel":"Productivité réalisée (% du potentiel théorique)",
-  "f6_source":"Élaboration auteur — Sections 6.1, 6.2",
- },
- "en": {
-  "suffix":"EN",
-  "f1_title":"French Sectoral Exposure\nto AI Compute Asymmetry",
-  "f1_sectors":["Finance","Auto / Aero","Health / Pharma","Robotics / Manuf.","Defense / Space"],
-  "f1_dims":["Compute\nintensity","Data\nsensitivity","US cloud\ndependence","Scenario B\nrisk"],
-  "f1_source":"Author's elaboration — Table 12",
-  "f2_title":"France Strategic Assessment:\nStrengths vs Vulnerabilities in the AI Context",
-  "f2_atouts":["Nuclear energy\n65-70% mix\ncompetitive cost","Mistral AI\n€11.7B valuation\nMistral Compute","Excellence in\neducation\nENS, X, INRIA","€109B private\nAI commitments","#1 EU destination\nfor AI foreign\ninvestment (5 yrs)","AI Act:\ncompliance\nby design"],
-  "f2_vulner":["No hardware AI\nchampion\n(GPU/ASIC)","Compute: ~5%\nglobal\nUS/FR ratio ~30:1","Brain drain\npost-PhD\nto US","Slow permitting\n24+ months\ngrid saturated","US cloud\ndependence\n70-80%","AI Act:\ncompliance costs\nuncertainty"],
-  "f2_source":"Author's elaboration — Table 13",
-  "f2_col_a":"STRENGTHS","f2_col_v":"VULNERABILITIES",
-  "f3_title":"France Facing Three Futures by 2030",
-  "f3_configs":[
-    ("Config. 1","Dependent\nconsumer","Scenarios A & B\nAI adoption via US cloud\nGrowing dependence\nProductivity gap\n+5 to +15 pts cumulative"),
-    ("Config. 2","Energy &\napplication hub","Scenario C\nNuclear advantage\nLocal compute\nSovereign in application\nGap contained 1-2 pts"),
-    ("Config. 3","European\nsovereignty pillar","Scenario D\nUnprecedented mobilization\n20 GW dedicated nuclear\nRISC-V / DARE\nVulnerable period 26-28"),
-  ],
-  "f3_source":"Author's elaboration — Section 6.5",
-  "f4_title":"Differentiated Impact by French Actor Type\n(Scenarios A/B vs C/D)",
-  "f4_actors":["Large\ncorporations\n(CAC 40)","SMEs / Mid-\nsized firms","AI Startups\n(Mistral...)","Public sector\n/ Defense"],
-  "f4_source":"Author's elaboration — Section 6.2",
-  "f5_title":"French AI Startup Ecosystem:\nKey Players and Positioning",
-  "f5_source":"Sources: Mistral AI, Dealroom, CrunchBase (2025-2026)",
-  "f6_title":"Impact on French Sectoral Productivity\nby Scenario (% of theoretical potential achieved)",
-  "f6_sectors":["Finance","Auto/Aero","Health","Robotics","Defense"],
-  "f6_ylabel":"Productivity achieved (% of theoretical potential)",
-  "f6_source":"Author's elaboration — Sections 6.1, 6.2",
- },
- "pt": {
-  "suffix":"PT-BR",
-  "f1_title":"Exposição Setorial Francesa\nà Assimetria de Compute IA",
-  "f1_sectors":["Finanças","Auto / Aero","Saúde / Farma","Robótica / Indúst.","Defesa / Espacial"],
-  "f1_dims":["Intensidade\ncompute","Sensibilidade\ndados","Dependência\ncloud EUA","Risco\ncenário B"],
-  "f1_source":"Elaboração do autor — Tabela 12",
-  "f2_title":"Balanço Estratégico França:\nForças vs Vulnerabilidades no Contexto IA",
-  "f2_atouts":["Energia nuclear\n65-70% mix\ncusto competitivo","Mistral AI\n€11,7 Bi valoriz.\nMistral Compute","Formação de\nexcelência\nENS, X, INRIA","€109 Bi\ncompromissos\nprivados IA","1º destino UE\ninvestim. IA\nestrangeiro (5 anos)","AI Act:\nconformidade\npor design"],
-  "f2_vulner":["Sem campeão\nhardware IA\n(GPU/ASIC)","Compute: ~5%\nglobal\nrazão EUA/FR ~30:1","Brain drain\npós-doutorado\npara EUA","Permitting lento\n24+ meses\nrede saturada","Dependência\ncloud EUA\n70-80%","AI Act:\ncustos extra\nincerteza"],
-  "f2_source":"Elaboração do autor — Tabela 13",
-  "f2_col_a":"FORÇAS","f2_col_v":"VULNERABILIDADES",
-  "f3_title":"A França Diante de Três Futuros até 2030",
-  "f3_configs":[
-    ("Config. 1","Consumidora\ndependente","Cenários A & B\nAdoção IA via cloud EUA\nDependência crescente\nDéficit produtividade\n+5 a +15 pts acumulados"),
-    ("Config. 2","Hub energético\ne aplicativo","Cenário C\nVantagem nuclear\nCompute local\nSoberana em aplicação\nDéficit contido 1-2 pts"),
-    ("Config. 3","Pilar soberania\neuropeia","Cenário D\nMobilização inédita\n20 GW nuclear dedicado\nRISC-V / DARE\nPeríodo vulnerável 26-28"),
-  ],
-  "f3_source":"Elaboração do autor — Seção 6.5",
-  "f4_title":"Impacto Diferenciado por Tipo de Ator Francês\n(Cenários A/B vs C/D)",
-  "f4_actors":["Grandes\ngrupos\n(CAC 40)","PMEs / ETIs\nindustriais","Startups IA\n(Mistral...)","Setor público\n/ Defesa"],
-  "f4_source":"Elaboração do autor — Seção 6.2",
-  "f5_title":"Ecossistema Startup IA Francês:\nAtores-Chave e Posicionamento",
-  "f5_source":"Fontes: Mistral AI, Dealroom, CrunchBase (2025-2026)",
-  "f6_title":"Impacto na Produtividade Setorial Francesa\npor Cenário (% do potencial teórico alcançado)",
-  "f6_sectors":["Finanças","Auto/Aero","Saúde","Robótica","Defesa"],
-  "f6_ylabel":"Produtividade alcançada (% do potencial teórico)",
-  "f6_source":"Elaboração do autor — Seções 6.1, 6.2",
- }
-}
+
+# Un catalogue JSON par langue (locales/chapitre6/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 def setup_style():
-    plt.rcParams.update({'font.family':'DejaVu Sans','font.size':11,
-        'axes.facecolor':BG_COLOR,'figure.facecolor':'white',
-        'axes.grid':True,'grid.color':GRID_COLOR,'grid.alpha':0.5,
-        'axes.spines.top':False,'axes.spines.right':False})
+    """Style commun, grille plus légère."""
+    afia_style.setup_style({'grid.alpha': 0.5})
 
-def save_fig(fig, name, sfx):
-    p=os.path.join(OUTPUT_DIR,f"{name}_{sfx}.png")
-    fig.savefig(p,dpi=DPI,bbox_inches='tight',facecolor='white',edgecolor='none')
-    plt.close(fig); print(f"  ✓ {p}"); return p
 
 # ═══════════════════════════════════════════════════════════════════════════
 # FIG 6.1 — Exposition sectorielle (heatmap) — Tableau 12
@@ -389,7 +291,6 @@ def fig6_sectoral_productivity(L, lk):
 
 
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
     print("="*70+"\n CHAPITRE VI — Génération des graphiques en 3 langues\n"+"="*70)
     all_files = []
@@ -430,4 +331,5 @@ def main():
     return all_files
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
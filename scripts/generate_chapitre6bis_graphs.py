@@ -24,149 +24,21 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
+
+import afia_style
+from afia_style import US_COLOR, FR_COLOR, CN_COLOR, save_fig, setup_style
 
 # ─── Configuration ──────────────────────────────────────────────────────────
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
 FIGSIZE_WIDE = (12, 6.5)
 FIGSIZE_TALL = (11, 8)
 
-US_COLOR = "#1B4F72"
-EU_COLOR = "#D4AC0D"
-FR_COLOR = "#2E86C1"
-CN_COLOR = "#C0392B"
 BR_COLOR = "#27AE60"
 LATAM_COLOR = "#1ABC9C"
-ACCENT1 = "#148F77"
 ACCENT2 = "#884EA0"
 ACCENT3 = "#E67E22"
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
-
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        "fig1_title": "Déficit d'investissement IA de l'Amérique latine\n(part PIB vs part investissement mondial IA)",
-        "fig1_ylabel": "Part mondiale (%)",
-        "fig1_cats": ["PIB mondial", "Investissement\nmondial IA", "Capacité DC\n(colocation)", "Modèles IA\nnotables", "Startups IA", "Capital-risque\nIA"],
-        "fig1_source": "Sources : CEPALC/CENIA ILIA 2025, Banque mondiale (2025)",
-        "fig1_legend": ["Amérique latine", "Pays à haut revenu"],
-        "fig1_ratio": "Ratio déficit : ×5,9",
-
-        "fig2_title": "Mégaprojets de data centers IA au Brésil\n(investissements US vs Chine, 2025-2033)",
-        "fig2_ylabel": "Capacité planifiée (GW)",
-        "fig2_source": "Sources : Bloomberg (2025), IndustrialInfo (2026), Introl (2025)",
-        "fig2_legend": ["Projets à capitaux chinois", "Projets à capitaux US/brésiliens"],
-        "fig2_projects": ["TikTok\nPecém", "Scala\nAI City", "Elea Rio\nAI City", "Microsoft\nAzure", "AWS\nSão Paulo"],
-        "fig2_annot": "Mix 83% renouvelable\nCoût: ~0,08 $/kWh",
-
-        "fig3_title": "Cinq canaux d'impact du protectionnisme IA\nsur l'Amérique du Sud",
-        "fig3_channels": ["1. Contrainte\nhardware GPU\n(caps Tier 2)", "2. Dépendance\ncloud US\nrenforcée", "3. Bifurcation\ntechnologique\nUS-Chine", "4. Brain drain\namplifié", "5. Fossé de\nproductivité\nélargi"],
-        "fig3_source": "Source : élaboration auteur, §6bis.3.2",
-        "fig3_severity": "Sévérité de l'impact",
-
-        "fig4_title": "Scénarios du Brésil face au protectionnisme IA\n(2026-2030)",
-        "fig4_scenarios": ["A' : Hub neutre\ndual US-Chine", "B' : Sanctions\nsecondaires", "C' : Alignement\npro-US", "D' : Souveraineté\nrégionale LATAM"],
-        "fig4_ylabel": "Probabilité estimée (%)",
-        "fig4_source": "Source : construction auteur, Tableau 15",
-
-        "fig5_title": "Triple fracture de l'Amérique du Sud\nface au protectionnisme IA",
-        "fig5_fractures": ["Fracture\nNord-Sud", "Fracture\nEst-Ouest", "Fracture\nintra-régionale"],
-        "fig5_source": "Source : élaboration auteur, §6bis.6",
-
-        "fig6_title": "Comparaison France vs Brésil :\natouts et vulnérabilités face au protectionnisme IA",
-        "fig6_dims": ["Atout\nénergétique", "Champion\nnational IA", "Classification\nTier", "Coût du\ncapital", "Capacité DC\ninstallée", "Autonomie\nhardware"],
-        "fig6_legend": ["France", "Brésil"],
-        "fig6_source": "Source : compilation auteur, §6bis.6",
-    },
-    "en": {
-        "suffix": "EN",
-        "fig1_title": "Latin America's AI Investment Deficit\n(GDP share vs global AI investment share)",
-        "fig1_ylabel": "Global share (%)",
-        "fig1_cats": ["Global GDP", "Global AI\ninvestment", "DC capacity\n(colocation)", "Notable AI\nmodels", "AI startups", "AI venture\ncapital"],
-        "fig1_source": "Sources: CEPALC/CENIA ILIA 2025, World Bank (2025)",
-        "fig1_legend": ["Latin America", "High-income countries"],
-        "fig1_ratio": "Deficit ratio: ×5.9",
-
-        "fig2_title": "Major AI Data Center Projects in Brazil\n(US vs Chinese investments, 2025-2033)",
-        "fig2_ylabel": "Planned capacity (GW)",
-        "fig2_source": "Sources: Bloomberg (2025), IndustrialInfo (2026), Introl (2025)",
-        "fig2_legend": ["Chinese-backed projects", "US/Brazilian-backed projects"],
-        "fig2_projects": ["TikTok\nPecém", "Scala\nAI City", "Elea Rio\nAI City", "Microsoft\nAzure", "AWS\nSão Paulo"],
-        "fig2_annot": "83% renewable mix\nCost: ~$0.08/kWh",
-
-        "fig3_title": "Five Channels of AI Protectionism Impact\non South America",
-        "fig3_channels": ["1. GPU hardware\nconstraint\n(Tier 2 caps)", "2. Reinforced\nUS cloud\ndependency", "3. US-China\ntechnological\nbifurcation", "4. Amplified\nbrain drain", "5. Widened\nproductivity\ngap"],
-        "fig3_source": "Source: author's elaboration, §6bis.3.2",
-        "fig3_severity": "Impact severity",
-
-        "fig4_title": "Brazil's Scenarios Facing AI Protectionism\n(2026-2030)",
-        "fig4_scenarios": ["A': Neutral dual\nhub US-China", "B': Secondary\nsanctions", "C': Pro-US\nalignment", "D': Regional\nLATAM sovereignty"],
-        "fig4_ylabel": "Estimated probability (%)",
-        "fig4_source": "Source: author construction, Table 15",
-
-        "fig5_title": "South America's Triple Fracture\nFacing AI Protectionism",
-        "fig5_fractures": ["North-South\nfracture", "East-West\nfracture", "Intra-regional\nfracture"],
-        "fig5_source": "Source: author's elaboration, §6bis.6",
-
-        "fig6_title": "France vs Brazil Comparison:\nAssets and Vulnerabilities Facing AI Protectionism",
-        "fig6_dims": ["Energy\nasset", "National AI\nchampion", "Tier\nclassification", "Cost of\ncapital", "Installed DC\ncapacity", "Hardware\nautonomy"],
-        "fig6_legend": ["France", "Brazil"],
-        "fig6_source": "Source: author compilation, §6bis.6",
-    },
-    "pt": {
-        "suffix": "PT-BR",
-        "fig1_title": "Déficit de Investimento em IA da América Latina\n(participação no PIB vs investimento mundial em IA)",
-        "fig1_ylabel": "Participação mundial (%)",
-        "fig1_cats": ["PIB mundial", "Investimento\nmundial IA", "Capacidade DC\n(colocation)", "Modelos IA\nnotáveis", "Startups IA", "Capital de\nrisco IA"],
-        "fig1_source": "Fontes: CEPAL/CENIA ILIA 2025, Banco Mundial (2025)",
-        "fig1_legend": ["América Latina", "Países de alta renda"],
-        "fig1_ratio": "Razão do déficit: ×5,9",
-
-        "fig2_title": "Megaprojetos de Data Centers IA no Brasil\n(investimentos EUA vs China, 2025-2033)",
-        "fig2_ylabel": "Capacidade planejada (GW)",
-        "fig2_source": "Fontes: Bloomberg (2025), IndustrialInfo (2026), Introl (2025)",
-        "fig2_legend": ["Projetos com capital chinês", "Projetos com capital EUA/brasileiro"],
-        "fig2_projects": ["TikTok\nPecém", "Scala\nAI City", "Elea Rio\nAI City", "Microsoft\nAzure", "AWS\nSão Paulo"],
-        "fig2_annot": "Mix 83% renovável\nCusto: ~US$ 0,08/kWh",
-
-        "fig3_title": "Cinco Canais de Impacto do Protecionismo de IA\nna América do Sul",
-        "fig3_channels": ["1. Restrição\nhardware GPU\n(caps Tier 2)", "2. Dependência\nde cloud EUA\nreforçada", "3. Bifurcação\ntecnológica\nEUA-China", "4. Fuga de\ncérebros\namplificada", "5. Fosso de\nprodutividade\nampliado"],
-        "fig3_source": "Fonte: elaboração do autor, §6bis.3.2",
-        "fig3_severity": "Severidade do impacto",
-
-        "fig4_title": "Cenários do Brasil Face ao Protecionismo de IA\n(2026-2030)",
-        "fig4_scenarios": ["A': Hub neutro\ndual EUA-China", "B': Sanções\nsecundárias", "C': Alinhamento\npró-EUA", "D': Soberania\nregional LATAM"],
-        "fig4_ylabel": "Probabilidade estimada (%)",
-        "fig4_source": "Fonte: construção do autor, Tabela 15",
-
-        "fig5_title": "Tripla Fratura da América do Sul\nFace ao Protecionismo de IA",
-        "fig5_fractures": ["Fratura\nNorte-Sul", "Fratura\nLeste-Oeste", "Fratura\nintra-regional"],
-        "fig5_source": "Fonte: elaboração do autor, §6bis.6",
-
-        "fig6_title": "Comparação França vs Brasil:\nAtivos e Vulnerabilidades Face ao Protecionismo de IA",
-        "fig6_dims": ["Ativo\nenergético", "Campeão\nnacional IA", "Classificação\nTier", "Custo do\ncapital", "Capacidade DC\ninstalada", "Autonomia\nhardware"],
-        "fig6_legend": ["França", "Brasil"],
-        "fig6_source": "Fonte: compilação do autor, §6bis.6",
-    }
-}
-
-
-def setup_style():
-    plt.rcParams.update({
-        'font.family': 'DejaVu Sans', 'font.size': 11,
-        'axes.facecolor': BG_COLOR, 'figure.facecolor': 'white',
-        'axes.grid': True, 'grid.color': GRID_COLOR, 'grid.alpha': 0.7,
-        'axes.spines.top': False, 'axes.spines.right': False,
-    })
-
-def save_fig(fig, name, lang_suffix):
-    path = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}.png")
-    fig.savefig(path, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {path}")
-    return path
+
+# Un catalogue JSON par langue (locales/chapitre6bis/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -426,7 +298,6 @@ def fig6_france_brazil_radar(L, lang_key):
 
 
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
     print("=" * 70)
     print(" CHAPITRE VI BIS — Génération des graphiques en 3 langues")
@@ -440,7 +311,7 @@ def main():
         all_files.append(fig4_brazil_scenarios(L, lang_key))
         all_files.append(fig5_triple_fracture(L, lang_key))
         all_files.append(fig6_france_brazil_radar(L, lang_key))
-    print(f"\n{'='*70}\n Total : {len(all_files)} fichiers dans {OUTPUT_DIR}/\n{'='*70}")
+    print(f"\n{'='*70}\n Total : {len(all_files)} fichiers dans {afia_style.OUTPUT_DIR}/\n{'='*70}")
     print("""
 ╔══════════════════════════════════════════════════════════════════════════╗
 ║  GUIDE D'INSERTION — Chapitre VI bis (Amérique du Sud / Brésil)        ║
@@ -456,4 +327,5 @@ def main():
     return all_files
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
@@ -26,217 +26,28 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
+
+import afia_style
+from afia_style import US_COLOR, CN_COLOR, ACCENT1, save_fig, setup_style
 
 # ─── Configuration ──────────────────────────────────────────────────────────
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
 FIGSIZE_WIDE = (12, 6.5)
 FIGSIZE_SQUARE = (10, 7)
 FIGSIZE_TALL = (11, 8)
 
 # Couleurs palette professionnelle (même palette que les autres chapitres)
-US_COLOR = "#1B4F72"       # Bleu foncé (US)
-EU_COLOR = "#D4AC0D"       # Or/jaune (EU)
-FR_COLOR = "#2E86C1"       # Bleu moyen (France)
-CN_COLOR = "#C0392B"       # Rouge (Chine)
 JP_COLOR = "#E74C3C"       # Rouge vif (Japon)
 KR_COLOR = "#3498DB"       # Bleu clair (Corée)
 TW_COLOR = "#1ABC9C"       # Turquoise (Taiwan)
 IN_COLOR = "#F39C12"       # Orange (Inde)
 ASEAN_COLOR = "#27AE60"    # Vert (ASEAN)
 GULF_COLOR = "#8E44AD"     # Violet (Golfe)
-ACCENT1 = "#148F77"        # Vert teal
 ACCENT2 = "#884EA0"        # Violet
 ACCENT3 = "#E67E22"        # Orange
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
 
 # ─── Traductions ────────────────────────────────────────────────────────────
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-
-        # ── Fig 6ter.1 — Investissements Japon ──
-        "fig1_title": "Accord d'investissement US-Japon en infrastructure IA\n(550 milliards USD, 2025-2026)",
-        "fig1_cats": ["Infrastr.\nénergétique", "Semi-\nconducteurs", "Data\ncenters", "Câbles &\ncomposants"],
-        "fig1_ylabel": "Milliards USD",
-        "fig1_source": "Sources : Construction Today (2025), Taipei Times (2025), compilation auteur",
-        "fig1_annot": "Total : 550 Md$",
-        "fig1_detail_labels": ["Centrales &\nréseaux (332 Md$)", "Rapidus 2nm\n+ METI (65 Md$)", "SoftBank Stargate\n(40+ Md$)", "Mitsubishi 30 Md$\nTDK 25 Md$\nFujikura"],
-        "fig1_domestic": "Invest. domestique Japon :",
-        "fig1_dom_val": "330 Md$ (public-privé, décennie)",
-
-        # ── Fig 6ter.2 — Capacité DC Asie ──
-        "fig2_title": "Capacité installée de data centers en Asie\nvs États-Unis (GW, 2025)",
-        "fig2_cats": ["États-Unis", "Chine", "Japon", "Taiwan +\nCorée Sud", "Inde", "ASEAN", "Golfe"],
-        "fig2_ylabel": "Gigawatts (GW)",
-        "fig2_source": "Sources : Mind2Markets (2026), Futurum (2026), compilation auteur",
-        "fig2_legend_tier": ["Tier 1", "Tier 2", "Tier 3"],
-
-        # ── Fig 6ter.3 — Taiwan/Corée chaîne semi-conducteurs ──
-        "fig3_title": "Taiwan et Corée du Sud : position dans la chaîne\nde valeur des semi-conducteurs IA (2025)",
-        "fig3_ylabel": "Part de marché mondiale (%)",
-        "fig3_cats": ["Puces pointe\n(<7nm)", "Mémoire HBM\n(GPU IA)", "Fonderie\navancée", "Packaging\navancé"],
-        "fig3_legend": ["TSMC (Taiwan)", "Samsung + SK hynix (Corée)"],
-        "fig3_source": "Sources : données industrielles, TrendForce, IC Insights, compilation auteur",
-        "fig3_risk_label": "Risque : transfert\nproduction vers US",
-
-        # ── Fig 6ter.4 — Inde ambition vs réalité ──
-        "fig4_title": "Inde : le fossé entre ambitions IA\net capacité installée (2025-2026)",
-        "fig4_ylabel_left": "Milliards USD (investissements)",
-        "fig4_ylabel_right": "GW (capacité DC installée)",
-        "fig4_cats": ["Investissements\nannoncés (2 ans)", "Budget public\nIndiaAI Mission", "GPU déployées\n(en Md$ equiv.)"],
-        "fig4_source": "Sources : IBTimes India (2026), Medium/D. Kumar (2026), Mind2Markets",
-        "fig4_compare_label": "Capacité DC (GW)",
-        "fig4_countries": ["États-Unis\n53,7 GW", "Chine\n19,6 GW", "Inde\n1,4 GW"],
-        "fig4_tier_label": "Tier 2 : caps quantitatifs GPU",
-
-        # ── Fig 6ter.5 — Chine autonomisation ──
-        "fig5_title": "Chine : trajectoire d'autonomisation IA\nsous restrictions (2022-2030)",
-        "fig5_ylabel_left": "Milliards USD",
-        "fig5_ylabel_right": "EFLOP/s (capacité calcul IA)",
-        "fig5_source": "Sources : IBTimes, Tom's Hardware, ITIF (2025), EastPost (2026)",
-        "fig5_legend_invest": "Investissement IA (Md$)",
-        "fig5_legend_eflops": "Capacité calcul (EFLOP/s)",
-        "fig5_legend_foundry": "Part fonderies mondiales (%)",
-        "fig5_annot_deepseek": "DeepSeek-V3\n(performances\ncompétitives)",
-        "fig5_annot_huawei": "Huawei Ascend 910c\n(~H100, 60-70% coût)",
-
-        # ── Fig 6ter.6 — Synthèse comparative Tiers ──
-        "fig6_title": "Synthèse comparative : position asiatique\nface au protectionnisme IA américain",
-        "fig6_countries": ["Japon", "Taiwan", "Corée\ndu Sud", "Inde", "Chine", "ASEAN", "Golfe"],
-        "fig6_dimensions": ["Accès GPU\n(Tier)", "Capacité DC\n(GW)", "Investissement\nIA (Md$)", "Autonomie\ntechnologique", "Risque\nprincipal"],
-        "fig6_source": "Source : compilation auteur, Tableau 16 du chapitre",
-        "fig6_tier_labels": ["Tier 1\n(accès libre)", "Tier 2\n(caps)", "Tier 3\n(interdit)"],
-    },
-
-    "en": {
-        "suffix": "EN",
-
-        "fig1_title": "US-Japan AI Infrastructure Investment Agreement\n(USD 550 Billion, 2025-2026)",
-        "fig1_cats": ["Energy\nInfrastructure", "Semi-\nconductors", "Data\nCenters", "Cables &\nComponents"],
-        "fig1_ylabel": "Billion USD",
-        "fig1_source": "Sources: Construction Today (2025), Taipei Times (2025), author compilation",
-        "fig1_annot": "Total: $550B",
-        "fig1_detail_labels": ["Power plants &\ngrids ($332B)", "Rapidus 2nm\n+ METI ($65B)", "SoftBank Stargate\n($40B+)", "Mitsubishi $30B\nTDK $25B\nFujikura"],
-        "fig1_domestic": "Japan domestic invest.:",
-        "fig1_dom_val": "$330B (public-private, decade)",
-
-        "fig2_title": "Installed Data Center Capacity in Asia\nvs United States (GW, 2025)",
-        "fig2_cats": ["United States", "China", "Japan", "Taiwan +\nSouth Korea", "India", "ASEAN", "Gulf"],
-        "fig2_ylabel": "Gigawatts (GW)",
-        "fig2_source": "Sources: Mind2Markets (2026), Futurum (2026), author compilation",
-        "fig2_legend_tier": ["Tier 1", "Tier 2", "Tier 3"],
-
-        "fig3_title": "Taiwan and South Korea: Position in the\nAI Semiconductor Value Chain (2025)",
-        "fig3_ylabel": "Global Market Share (%)",
-        "fig3_cats": ["Leading-edge\nchips (<7nm)", "HBM Memory\n(AI GPUs)", "Advanced\nfoundry", "Advanced\npackaging"],
-        "fig3_legend": ["TSMC (Taiwan)", "Samsung + SK hynix (South Korea)"],
-        "fig3_source": "Sources: industry data, TrendForce, IC Insights, author compilation",
-        "fig3_risk_label": "Risk: production\ntransfer to US",
-
-        "fig4_title": "India: The Gap Between AI Ambitions\nand Installed Capacity (2025-2026)",
-        "fig4_ylabel_left": "Billion USD (investments)",
-        "fig4_ylabel_right": "GW (installed DC capacity)",
-        "fig4_cats": ["Announced\ninvestments (2 yrs)", "Public budget\nIndiaAI Mission", "GPUs deployed\n(B$ equiv.)"],
-        "fig4_source": "Sources: IBTimes India (2026), Medium/D. Kumar (2026), Mind2Markets",
-        "fig4_compare_label": "DC capacity (GW)",
-        "fig4_countries": ["United States\n53.7 GW", "China\n19.6 GW", "India\n1.4 GW"],
-        "fig4_tier_label": "Tier 2: quantitative GPU caps",
-
-        "fig5_title": "China: AI Autonomization Trajectory\nUnder Restrictions (2022-2030)",
-        "fig5_ylabel_left": "Billion USD",
-        "fig5_ylabel_right": "EFLOP/s (AI compute capacity)",
-        "fig5_source": "Sources: IBTimes, Tom's Hardware, ITIF (2025), EastPost (2026)",
-        "fig5_legend_invest": "AI Investment ($B)",
-        "fig5_legend_eflops": "Compute capacity (EFLOP/s)",
-        "fig5_legend_foundry": "Global foundry share (%)",
-        "fig5_annot_deepseek": "DeepSeek-V3\n(competitive\nperformance)",
-        "fig5_annot_huawei": "Huawei Ascend 910c\n(~H100, 60-70% cost)",
-
-        "fig6_title": "Comparative Synthesis: Asian Position\nFacing US AI Protectionism",
-        "fig6_countries": ["Japan", "Taiwan", "South\nKorea", "India", "China", "ASEAN", "Gulf"],
-        "fig6_dimensions": ["GPU Access\n(Tier)", "DC Capacity\n(GW)", "AI Investment\n($B)", "Technological\nAutonomy", "Primary\nRisk"],
-        "fig6_source": "Source: author compilation, Table 16 of the chapter",
-        "fig6_tier_labels": ["Tier 1\n(open access)", "Tier 2\n(caps)", "Tier 3\n(banned)"],
-    },
-
-    "pt": {
-        "suffix": "PT-BR",
-
-        "fig1_title": "Acordo de Investimento EUA-Japão em Infraestrutura IA\n(550 Bilhões USD, 2025-2026)",
-        "fig1_cats": ["Infraestr.\nenergética", "Semi-\ncondutores", "Data\nCenters", "Cabos &\nComponentes"],
-        "fig1_ylabel": "Bilhões USD",
-        "fig1_source": "Fontes: Construction Today (2025), Taipei Times (2025), compilação do autor",
-        "fig1_annot": "Total: US$ 550 bi",
-        "fig1_detail_labels": ["Usinas &\nredes (US$ 332 bi)", "Rapidus 2nm\n+ METI (US$ 65 bi)", "SoftBank Stargate\n(US$ 40+ bi)", "Mitsubishi US$ 30 bi\nTDK US$ 25 bi\nFujikura"],
-        "fig1_domestic": "Invest. doméstico Japão:",
-        "fig1_dom_val": "US$ 330 bi (público-privado, década)",
-
-        "fig2_title": "Capacidade Instalada de Data Centers na Ásia\nvs Estados Unidos (GW, 2025)",
-        "fig2_cats": ["Estados Unidos", "China", "Japão", "Taiwan +\nCoreia Sul", "Índia", "ASEAN", "Golfo"],
-        "fig2_ylabel": "Gigawatts (GW)",
-        "fig2_source": "Fontes: Mind2Markets (2026), Futurum (2026), compilação do autor",
-        "fig2_legend_tier": ["Tier 1", "Tier 2", "Tier 3"],
-
-        "fig3_title": "Taiwan e Coreia do Sul: Posição na Cadeia\nde Valor dos Semicondutores IA (2025)",
-        "fig3_ylabel": "Participação no Mercado Mundial (%)",
-        "fig3_cats": ["Chips ponta\n(<7nm)", "Memória HBM\n(GPUs IA)", "Fundição\navançada", "Empacotamento\navançado"],
-        "fig3_legend": ["TSMC (Taiwan)", "Samsung + SK hynix (Coreia)"],
-        "fig3_source": "Fontes: dados industriais, TrendForce, IC Insights, compilação do autor",
-        "fig3_risk_label": "Risco: transferência\nprodução para EUA",
-
-        "fig4_title": "Índia: O Fosso entre Ambições de IA\ne Capacidade Instalada (2025-2026)",
-        "fig4_ylabel_left": "Bilhões USD (investimentos)",
-        "fig4_ylabel_right": "GW (capacidade DC instalada)",
-        "fig4_cats": ["Investimentos\nanunciados (2 anos)", "Orçamento público\nIndiaAI Mission", "GPUs implantadas\n(bi$ equiv.)"],
-        "fig4_source": "Fontes: IBTimes India (2026), Medium/D. Kumar (2026), Mind2Markets",
-        "fig4_compare_label": "Capacidade DC (GW)",
-        "fig4_countries": ["Estados Unidos\n53,7 GW", "China\n19,6 GW", "Índia\n1,4 GW"],
-        "fig4_tier_label": "Tier 2: caps quantitativos de GPU",
-
-        "fig5_title": "China: Trajetória de Autonomização da IA\nsob Restrições (2022-2030)",
-        "fig5_ylabel_left": "Bilhões USD",
-        "fig5_ylabel_right": "EFLOP/s (capacidade cálculo IA)",
-        "fig5_source": "Fontes: IBTimes, Tom's Hardware, ITIF (2025), EastPost (2026)",
-        "fig5_legend_invest": "Investimento IA (bi$)",
-        "fig5_legend_eflops": "Capacidade cálculo (EFLOP/s)",
-        "fig5_legend_foundry": "Participação fundições mundiais (%)",
-        "fig5_annot_deepseek": "DeepSeek-V3\n(desempenho\ncompetitivo)",
-        "fig5_annot_huawei": "Huawei Ascend 910c\n(~H100, 60-70% custo)",
-
-        "fig6_title": "Síntese Comparativa: Posição Asiática\nFace ao Protecionismo de IA dos EUA",
-        "fig6_countries": ["Japão", "Taiwan", "Coreia\ndo Sul", "Índia", "China", "ASEAN", "Golfo"],
-        "fig6_dimensions": ["Acesso GPU\n(Tier)", "Capacidade DC\n(GW)", "Investimento\nIA (bi$)", "Autonomia\ntecnológica", "Risco\nprincipal"],
-        "fig6_source": "Fonte: compilação do autor, Tabela 16 do capítulo",
-        "fig6_tier_labels": ["Tier 1\n(acesso livre)", "Tier 2\n(caps)", "Tier 3\n(proibido)"],
-    }
-}
-
-
-def setup_style():
-    """Style commun pour tous les graphiques."""
-    plt.rcParams.update({
-        'font.family': 'DejaVu Sans',
-        'font.size': 11,
-        'axes.facecolor': BG_COLOR,
-        'figure.facecolor': 'white',
-        'axes.grid': True,
-        'grid.color': GRID_COLOR,
-        'grid.alpha': 0.7,
-        'axes.spines.top': False,
-        'axes.spines.right': False,
-    })
-
-
-def save_fig(fig, name, lang_suffix):
-    """Sauvegarde avec nom normalisé."""
-    path = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}.png")
-    fig.savefig(path, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {path}")
-    return path
+# Un catalogue JSON par langue (locales/chapitre6ter/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -679,7 +490,6 @@ def fig6_synthesis_comparative(L, lang_key):
 # MAIN — Génération pour les 3 langues
 # ═══════════════════════════════════════════════════════════════════════════
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
 
     print("=" * 70)
@@ -701,7 +511,7 @@ def main():
         all_files.append(fig6_synthesis_comparative(L, lang_key))
 
     print(f"\n{'='*70}")
-    print(f" Total : {len(all_files)} fichiers générés dans {OUTPUT_DIR}/")
+    print(f" Total : {len(all_files)} fichiers générés dans {afia_style.OUTPUT_DIR}/")
     print(f"{'='*70}")
 
     # Résumé des insertions
@@ -735,4 +545,5 @@ def main():
 
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
@@ -24,142 +24,21 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import matplotlib.patheffects as pe
 import numpy as np
-import os
 
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "figures")
-DPI = 300
+import afia_style
+from afia_style import (US_COLOR, EU_COLOR, FR_COLOR, CN_COLOR, ACCENT1,
+                        save_fig, setup_style)
+
 
-US_COLOR = "#1B4F72"
-EU_COLOR = "#D4AC0D"
-FR_COLOR = "#2E86C1"
-CN_COLOR = "#C0392B"
 JP_COLOR = "#E74C3C"
 IN_COLOR = "#F39C12"
 BR_COLOR = "#27AE60"
-ACCENT1 = "#148F77"
 ACCENT2 = "#884EA0"
 ACCENT3 = "#E67E22"
 NUC_COLOR = "#F1C40F"  # Nuclear yellow
-BG_COLOR = "#FAFBFC"
-GRID_COLOR = "#E0E0E0"
-
-LANGS = {
-    "fr": {
-        "suffix": "FR",
-        "fig1_title": "Écart de capex IA : hyperscalers US vs Europe\n(2026, milliards USD/EUR)",
-        "fig1_ylabel": "Milliards (USD pour US, EUR pour EU)",
-        "fig1_cats": ["Amazon", "Alphabet", "Microsoft", "Meta", "Oracle", "Total US\n(5 hypers.)", "InvestAI EU\n(sur 5 ans)"],
-        "fig1_source": "Sources : Euronews (2026), Commission européenne (2025)",
-        "fig1_annot": "×3,3 sur\nune seule\nannée",
-
-        "fig2_title": "L'avantage nucléaire français pour l'IA :\ninfrastructure énergétique dédiée",
-        "fig2_ylabel": "Capacité (GW / MW)",
-        "fig2_cats": ["Parc nucléaire\nactuel (56 réact.)", "Sites EDF\ndata centers", "Campus MGX-\nMistral-Nvidia", "Fluidstack\n(nuc. IA)", "EPR 2\n(6 réacteurs)", "SMR\n(horizon 2033)"],
-        "fig2_source": "Sources : EDF, World Nuclear News, Global DC Hub (2025)",
-        "fig2_legend": ["Opérationnel / en cours", "Planifié 2027-2032"],
-        "fig2_fr_advantage": "France : seul pays EU avec\ntriptyque nucléaire + baseload + compétitivité",
-
-        "fig3_title": "Alliances technologiques stratégiques\npour réduire la dépendance",
-        "fig3_source": "Source : élaboration auteur, §7.3",
-
-        "fig4_title": "Matrice temporelle des recommandations\nstratégiques (2026-2032)",
-        "fig4_horizons": ["Court terme\n2026-2027", "Moyen terme\n2027-2029", "Long terme\n2029-2032"],
-        "fig4_axes": ["Compute", "Énergie", "Alliances", "Régulation", "Talent"],
-        "fig4_source": "Source : Tableau 17 du chapitre",
-
-        "fig5_title": "Fenêtre d'action stratégique 2026-2028 :\nconditions de succès",
-        "fig5_conditions": ["Compétitivité\nMistral", "Exécution\nindustrielle", "Cohérence\neuropéenne", "Facteur\ntemps"],
-        "fig5_source": "Source : §7.7, élaboration auteur",
-        "fig5_window": "FENÊTRE DÉCISIVE : 2026-2028",
-
-        "fig6_title": "Positionnement comparatif mondial :\nstratégies face au protectionnisme IA US",
-        "fig6_countries": ["Japon", "France/UE", "Inde", "Brésil", "Chine"],
-        "fig6_source": "Source : synthèse auteur, §7.8",
-        "fig6_strategies": ["Co-financement\nUS ($550B)", "Autonomie\nénergétique\n+ Mistral", "Compute\nas export\n+ Tier 2", "Hub neutre\ndual\nUS-Chine", "Écosystème\nparallèle\nautonomisé"],
-    },
-    "en": {
-        "suffix": "EN",
-        "fig1_title": "AI Capex Gap: US Hyperscalers vs Europe\n(2026, billion USD/EUR)",
-        "fig1_ylabel": "Billions (USD for US, EUR for EU)",
-        "fig1_cats": ["Amazon", "Alphabet", "Microsoft", "Meta", "Oracle", "Total US\n(5 hypers.)", "InvestAI EU\n(over 5 yrs)"],
-        "fig1_source": "Sources: Euronews (2026), European Commission (2025)",
-        "fig1_annot": "×3.3 in a\nsingle\nyear",
-
-        "fig2_title": "France's Nuclear Advantage for AI:\nDedicated Energy Infrastructure",
-        "fig2_ylabel": "Capacity (GW / MW)",
-        "fig2_cats": ["Current nuclear\nfleet (56 react.)", "EDF DC\nsites", "MGX-Mistral-\nNvidia campus", "Fluidstack\n(nuclear AI)", "EPR 2\n(6 reactors)", "SMR\n(horizon 2033)"],
-        "fig2_source": "Sources: EDF, World Nuclear News, Global DC Hub (2025)",
-        "fig2_legend": ["Operational / underway", "Planned 2027-2032"],
-        "fig2_fr_advantage": "France: only EU country with\nnuclear + baseload + cost competitiveness",
-
-        "fig3_title": "Strategic Technological Alliances\nto Reduce Dependency",
-        "fig3_source": "Source: author's elaboration, §7.3",
-
-        "fig4_title": "Strategic Recommendations\nTime Matrix (2026-2032)",
-        "fig4_horizons": ["Short term\n2026-2027", "Medium term\n2027-2029", "Long term\n2029-2032"],
-        "fig4_axes": ["Compute", "Energy", "Alliances", "Regulation", "Talent"],
-        "fig4_source": "Source: Table 17 of the chapter",
-
-        "fig5_title": "Strategic Action Window 2026-2028:\nConditions for Success",
-        "fig5_conditions": ["Mistral\ncompetitiveness", "Industrial\nexecution", "European\ncoherence", "Time\nfactor"],
-        "fig5_source": "Source: §7.7, author's elaboration",
-        "fig5_window": "DECISIVE WINDOW: 2026-2028",
-
-        "fig6_title": "Comparative Global Positioning:\nStrategies Facing US AI Protectionism",
-        "fig6_countries": ["Japan", "France/EU", "India", "Brazil", "China"],
-        "fig6_source": "Source: author's synthesis, §7.8",
-        "fig6_strategies": ["US co-financing\n($550B)", "Energy\nautonomy\n+ Mistral", "Compute\nas export\n+ Tier 2", "Neutral dual\nhub\nUS-China", "Parallel\nautonomized\necosystem"],
-    },
-    "pt": {
-        "suffix": "PT-BR",
-        "fig1_title": "Gap de Capex em IA: Hyperscalers EUA vs Europa\n(2026, bilhões USD/EUR)",
-        "fig1_ylabel": "Bilhões (USD para EUA, EUR para UE)",
-        "fig1_cats": ["Amazon", "Alphabet", "Microsoft", "Meta", "Oracle", "Total EUA\n(5 hypers.)", "InvestAI UE\n(em 5 anos)"],
-        "fig1_source": "Fontes: Euronews (2026), Comissão Europeia (2025)",
-        "fig1_annot": "×3,3 em\num único\nano",
-
-        "fig2_title": "Vantagem Nuclear Francesa para a IA:\nInfraestrutura Energética Dedicada",
-        "fig2_ylabel": "Capacidade (GW / MW)",
-        "fig2_cats": ["Parque nuclear\natual (56 reat.)", "Sites EDF\ndata centers", "Campus MGX-\nMistral-Nvidia", "Fluidstack\n(nuclear IA)", "EPR 2\n(6 reatores)", "SMR\n(horizonte 2033)"],
-        "fig2_source": "Fontes: EDF, World Nuclear News, Global DC Hub (2025)",
-        "fig2_legend": ["Operacional / em andamento", "Planejado 2027-2032"],
-        "fig2_fr_advantage": "França: único país UE com\nnuclear + base + competitividade de custo",
-
-        "fig3_title": "Alianças Tecnológicas Estratégicas\npara Reduzir a Dependência",
-        "fig3_source": "Fonte: elaboração do autor, §7.3",
-
-        "fig4_title": "Matriz Temporal das Recomendações\nEstratégicas (2026-2032)",
-        "fig4_horizons": ["Curto prazo\n2026-2027", "Médio prazo\n2027-2029", "Longo prazo\n2029-2032"],
-        "fig4_axes": ["Compute", "Energia", "Alianças", "Regulação", "Talento"],
-        "fig4_source": "Fonte: Tabela 17 do capítulo",
-
-        "fig5_title": "Janela de Ação Estratégica 2026-2028:\nCondições de Sucesso",
-        "fig5_conditions": ["Competitividade\nMistral", "Execução\nindustrial", "Coerência\neuropeia", "Fator\ntempo"],
-        "fig5_source": "Fonte: §7.7, elaboração do autor",
-        "fig5_window": "JANELA DECISIVA: 2026-2028",
-
-        "fig6_title": "Posicionamento Comparativo Mundial:\nEstratégias Face ao Protecionismo de IA dos EUA",
-        "fig6_countries": ["Japão", "França/UE", "Índia", "Brasil", "China"],
-        "fig6_source": "Fonte: síntese do autor, §7.8",
-        "fig6_strategies": ["Co-financiamento\nEUA (US$ 550 bi)", "Autonomia\nenergética\n+ Mistral", "Compute\ncomo export\n+ Tier 2", "Hub neutro\ndual\nEUA-China", "Ecossistema\nparalelo\nautonomizado"],
-    }
-}
-
-
-def setup_style():
-    plt.rcParams.update({
-        'font.family': 'DejaVu Sans', 'font.size': 11,
-        'axes.facecolor': BG_COLOR, 'figure.facecolor': 'white',
-        'axes.grid': True, 'grid.color': GRID_COLOR, 'grid.alpha': 0.7,
-        'axes.spines.top': False, 'axes.spines.right': False,
-    })
-
-def save_fig(fig, name, lang_suffix):
-    path = os.path.join(OUTPUT_DIR, f"{name}_{lang_suffix}.png")
-    fig.savefig(path, dpi=DPI, bbox_inches='tight', facecolor='white', edgecolor='none')
-    plt.close(fig)
-    print(f"  ✓ {path}")
-    return path
+
+# Un catalogue JSON par langue (locales/chapitre7/<langue>.json), lu à la demande.
+LANGS = afia_style.load_catalogs(__file__)
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -488,7 +367,6 @@ def fig6_global_positioning(L, lang_key):
 
 
 def main():
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
     setup_style()
     print("=" * 70)
     print(" CHAPITRE VII — Génération des graphiques en 3 langues")
@@ -502,7 +380,7 @@ def main():
         all_files.append(fig4_timeline_matrix(L, lang_key))
         all_files.append(fig5_conditions_success(L, lang_key))
         all_files.append(fig6_global_positioning(L, lang_key))
-    print(f"\n{'='*70}\n Total : {len(all_files)} fichiers dans {OUTPUT_DIR}/\n{'='*70}")
+    print(f"\n{'='*70}\n Total : {len(all_files)} fichiers dans {afia_style.OUTPUT_DIR}/\n{'='*70}")
     print("""
 ╔══════════════════════════════════════════════════════════════════════════╗
 ║  GUIDE D'INSERTION — Chapitre VII (Recommandations stratégiques)       ║
@@ -518,4 +396,5 @@ def main():
     return all_files
 
 if __name__ == "__main__":
+    afia_style.parse_cli()
     main()
@@ -0,0 +1,151 @@
+"""
+=============================================================================
+ AI FOR AMERICANS FIRST — Encodage PNG hors du fil de rendu
+=============================================================================
+ save_png (afia_style) ne fait plus que le rendu Agg : le tampon RGBA est
+ copié et confié à un pool de threads qui le compresse pendant que la figure
+ suivante se dessine. Réglages (variables d'environnement ou configure()) :
+
+   AFIA_PNG_LEVEL    niveau zlib 0-9 (défaut 6, celui de matplotlib) ;
+   AFIA_PNG_PALETTE  N > 0 : palette de N couleurs au plus. Sans perte si
+                     l'image compte déjà N couleurs ou moins ; sinon
+                     quantification (l'anticrénelage des courbes et des
+                     textes produit des milliers de teintes), donc désactivé
+                     par défaut.
+
+ Une image entièrement opaque est toujours écrite en RGB (sans perte).
+ Un fichier existant qui a déjà exactement ces pixels, écrit avec les mêmes
+ réglages, n'est pas réécrit (date de modification et diff git inchangés) ;
+ configure(force=True) réécrit tout (benchmark_figures.py mesure ainsi
+ l'encodage et l'écriture à chaque exécution).
+ wait() attend les encodages en cours et renvoie les erreurs (chemin,
+ traceback) ; il est appelé par le pilote et à la sortie de l'interpréteur.
+=============================================================================
+"""
+
+import atexit
+import os
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from PIL import Image, PngImagePlugin
+
+import figure_report
+
+LEVEL_ENV = "AFIA_PNG_LEVEL"
+PALETTE_ENV = "AFIA_PNG_PALETTE"
+
+LEVEL = int(os.environ.get(LEVEL_ENV, 6))
+PALETTE = int(os.environ.get(PALETTE_ENV, 0))
+FORCE = False
+
+# Bloc tEXt des réglages d'encodage, relu pour décider d'une réécriture.
+SETTINGS_KEY = "afia:encoding"
+
+# Tampons en attente au plus : borne la mémoire (~30 Mo par figure à 300 DPI).
+MAX_PENDING = 4
+WORKERS = 2
+
+_pool = None
+_pending = []
+_lock = threading.Lock()
+
+
+def configure(level=None, palette=None, force=None):
+    global LEVEL, PALETTE, FORCE
+    if level is not None:
+        if not 0 <= level <= 9:
+            raise ValueError(f"niveau de compression hors de 0-9 : {level}")
+        LEVEL = level
+    if palette is not None:
+        if not 0 <= palette <= 256:
+            raise ValueError(f"palette hors de 0-256 : {palette}")
+        PALETTE = palette
+    if force is not None:
+        FORCE = bool(force)
+
+
+def to_image(rgba, palette=0):
+    """Image PIL à écrire : RGB si opaque, palette si demandée."""
+    if (rgba[..., 3] == 255).all():
+        img = Image.fromarray(np.ascontiguousarray(rgba[..., :3]), "RGB")
+    else:
+        img = Image.fromarray(rgba, "RGBA")
+    if palette and img.mode == "RGB":
+        # MAXCOVERAGE conserve exactement les couleurs si elles tiennent dans la palette.
+        img = img.quantize(colors=palette, method=Image.Quantize.MAXCOVERAGE,
+                           dither=Image.Dither.NONE)
+    return img
+
+
+def _same_pixels(path, img, settings):
+    """Vrai si path a été écrit avec ces réglages et contient les mêmes pixels."""
+    try:
+        with Image.open(path) as old:
+            if old.size != img.size or old.info.get(SETTINGS_KEY) != settings:
+                return False
+            return np.array_equal(np.asarray(old.convert("RGBA")),
+                                  np.asarray(img.convert("RGBA")))
+    except (OSError, ValueError):
+        return False
+
+
+def encode(rgba, path, dpi, level=6, palette=0, force=False):
+    """Écrit le tampon RGBA (hauteur × largeur × 4) en PNG.
+
+    Renvoie False si le fichier existant est identique et n'a pas été réécrit
+    (jamais avec force).
+    """
+    img = to_image(rgba, palette)
+    settings = f"level={level} palette={palette} dpi={dpi}"
+    if not force and os.path.exists(path) and _same_pixels(path, img, settings):
+        return False
+    # Seul bloc de métadonnées : les réglages d'encodage (pas de version ni de
+    # date), pour que des pixels identiques donnent des octets identiques.
+    info = PngImagePlugin.PngInfo()
+    info.add_text(SETTINGS_KEY, settings)
+    img.save(path, format="png", compress_level=level, dpi=(dpi, dpi), pnginfo=info)
+    return True
+
+
+def _run(rgba, path, dpi, level, palette, force, entry):
+    t0 = time.perf_counter()
+    written = encode(rgba, path, dpi, level, palette, force)
+    if entry is not None:
+        encode_s = time.perf_counter() - t0
+        entry = dict(entry, encode_s=round(entry["encode_s"] + encode_s, 4),
+                     total_s=round(entry["total_s"] + encode_s, 4), unchanged=not written)
+        figure_report.complete_entry(entry, path)
+
+
+def submit(rgba, path, dpi, entry=None):
+    """Encode rgba vers path en arrière-plan ; entry complète le rapport."""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="png")
+        while sum(not f.done() for _, f in _pending) >= MAX_PENDING:
+            next(f for _, f in _pending if not f.done()).exception()
+        future = _pool.submit(_run, rgba, path, dpi, LEVEL, PALETTE, FORCE, entry)
+        _pending.append((path, future))
+
+
+def wait():
+    """Attend les encodages en cours ; renvoie la liste des (chemin, traceback)."""
+    with _lock:
+        pending, _pending[:] = list(_pending), []
+    errors = []
+    for path, future in pending:
+        exc = future.exception()
+        if exc is not None:
+            errors.append((path, "".join(traceback.format_exception(exc))))
+    return errors
+
+
+@atexit.register
+def _flush_at_exit():
+    for path, tb in wait():
+        print(f"  ✗ {path}\n{tb}")
@@ -0,0 +1,6 @@
+"""Les scripts sont des modules à plat : scripts/ sur le chemin d'import."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
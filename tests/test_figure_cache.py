@@ -0,0 +1,57 @@
+"""Cache des figures : une entrée de manifeste par répertoire de sortie."""
+
+import os
+import re
+
+import pytest
+
+import afia_style
+import build_figures
+import figure_cache
+import figure_layout
+import png_encode
+
+JOB_ARGS = ["-c", "1", "-k", "^fig1_", "-l", "en", "-j", "1", "--no-check"]
+
+
+@pytest.fixture
+def isolated(tmp_path, monkeypatch):
+    """Manifeste, cache de cadrage et variables d'environnement propres au test."""
+    monkeypatch.setattr(figure_cache, "MANIFEST_PATH", str(tmp_path / "cache" / "figures.json"))
+    monkeypatch.setattr(figure_layout, "CACHE_PATH", str(tmp_path / "cache" / "layouts.jsonl"))
+    monkeypatch.setattr(figure_layout, "_enabled", False)
+    monkeypatch.setattr(afia_style, "SELECTED_LANGS", afia_style.SELECTED_LANGS)
+    monkeypatch.setattr(afia_style, "OUTPUT_DIR", afia_style.OUTPUT_DIR)
+    for name in ("AFIA_OUTPUT_DIR", "AFIA_FIGURE_REPORT", afia_style.LANGS_ENV,
+                 afia_style.FORMATS_ENV, png_encode.LEVEL_ENV, png_encode.PALETTE_ENV):
+        monkeypatch.delenv(name, raising=False)
+    return tmp_path
+
+
+def build_into(out_dir, tmp_path, monkeypatch, capsys):
+    """Build normal dans out_dir ; renvoie le nombre de figures rendues."""
+    monkeypatch.setenv("AFIA_OUTPUT_DIR", str(out_dir))
+    monkeypatch.setattr(afia_style, "OUTPUT_DIR", str(out_dir))
+    assert build_figures.main([*JOB_ARGS, "--report", str(tmp_path / "report.jsonl")]) == 0
+    return int(re.search(r"Total : (\d+) figures rendues", capsys.readouterr().out).group(1))
+
+
+def test_alternating_output_dirs_keep_their_entries(isolated, monkeypatch, capsys):
+    figures, published = isolated / "figures", isolated / "published"
+    assert build_into(figures, isolated, monkeypatch, capsys) == 1
+    assert build_into(published, isolated, monkeypatch, capsys) == 1
+    # Chaque répertoire garde son entrée : retour à l'un puis à l'autre sans rendu.
+    assert build_into(figures, isolated, monkeypatch, capsys) == 0
+    assert build_into(published, isolated, monkeypatch, capsys) == 0
+    manifest = figure_cache.load_manifest(figure_cache.MANIFEST_PATH)
+    assert sorted(os.path.dirname(entry["path"]) for entry in manifest.values()) == \
+        sorted([str(figures), str(published)])
+
+
+def test_removed_file_is_rendered_again(isolated, monkeypatch, capsys):
+    figures = isolated / "figures"
+    assert build_into(figures, isolated, monkeypatch, capsys) == 1
+    for name in os.listdir(figures):
+        if name.endswith(".png"):
+            os.remove(figures / name)
+    assert build_into(figures, isolated, monkeypatch, capsys) == 1
@@ -0,0 +1,30 @@
+"""Index des figures (figures.json) : titres tels qu'affichés dans les figures."""
+
+import json
+import os
+
+import pytest
+
+import build_figures
+import figure_index
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PUBLISHED_INDEX = os.path.join(ROOT_DIR, "docs", "figures", figure_index.INDEX_NAME)
+
+
+@pytest.mark.parametrize("chapter", list(build_figures.CHAPTERS))
+def test_titles_have_no_format_field(chapter):
+    mod = build_figures.load_chapter(chapter)
+    for fn_name in build_figures.figure_functions(mod):
+        n = int(figure_index._FIG_NUM_RE.match(fn_name).group(1))
+        for lang_key in mod.LANGS:
+            title = figure_index.figure_title(mod.LANGS[lang_key], n,
+                                              getattr(mod, "TITLE_ARGS", None))
+            assert title is None or "{" not in title, (chapter, fn_name, lang_key, title)
+
+
+def test_published_index_titles_have_no_format_field():
+    with open(PUBLISHED_INDEX, encoding="utf-8") as f:
+        entries = json.load(f)["figures"]
+    assert entries
+    assert [e["file"] for e in entries if "{" in e.get("title", "")] == []